@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Compare request throughput of the control socket and DBus.
+
+Run while the app is running:
+
+    python3 benchmarks/control_bench.py --calls 5000
+
+Each transport makes the same cheap QueryTimers call (one field of one
+timer) so the numbers mostly measure per-call overhead. The socket is
+measured one call at a time and with pipelined batches.
+"""
+import sys
+import time
+import argparse
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from timer_app import rpc  # noqa: E402
+
+QUERY = ('', 'deadline', 1, 0, ['id'])
+
+
+def report(name, calls, elapsed):
+    """Print one result line.
+
+    Args:
+        name: Transport description
+        calls: Number of calls made
+        elapsed: Seconds taken
+    """
+    print(f"{name:<28} {calls / elapsed:>10.0f} ops/s  {elapsed / calls * 1e6:>8.1f} us/op")
+
+
+def bench_socket(calls, batch):
+    """Measure the control socket.
+
+    Args:
+        calls: Number of calls to make
+        batch: Calls per pipelined batch
+    """
+    client = rpc.connect()
+    if client is None:
+        print("control socket: not available")
+        return
+
+    started = time.perf_counter()
+    for _ in range(calls):
+        client.QueryTimers(*QUERY)
+    report("socket (sequential)", calls, time.perf_counter() - started)
+
+    started = time.perf_counter()
+    for _ in range(calls // batch):
+        client.call_many([('QueryTimers', QUERY)] * batch)
+    report(f"socket (pipelined x{batch})", calls // batch * batch, time.perf_counter() - started)
+    client.close()
+
+
+def bench_dbus(calls):
+    """Measure the DBus interface.
+
+    Args:
+        calls: Number of calls to make
+    """
+    try:
+        import dbus
+        bus = dbus.SessionBus()
+        proxy = bus.get_object('com.github.MultiTimerApp', '/com/github/MultiTimerApp')
+        service = dbus.Interface(proxy, 'com.github.MultiTimerApp')
+    except Exception as e:
+        print(f"dbus: not available ({e})")
+        return
+
+    started = time.perf_counter()
+    for _ in range(calls):
+        service.QueryTimers(*QUERY)
+    report("dbus (sequential)", calls, time.perf_counter() - started)
+
+
+def bench_connect(count):
+    """Measure connection setup, which every CLI invocation pays.
+
+    Args:
+        count: Number of connections to open
+    """
+    started = time.perf_counter()
+    for _ in range(count):
+        client = rpc.connect()
+        if client is None:
+            return
+        client.QueryTimers(*QUERY)
+        client.close()
+    report("socket (connect + call)", count, time.perf_counter() - started)
+
+
+def main():
+    """Run the benchmarks."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--calls', type=int, default=2000, help='Calls per measurement')
+    parser.add_argument('--batch', type=int, default=100, help='Pipelined batch size')
+    args = parser.parse_args()
+
+    bench_socket(args.calls, args.batch)
+    bench_connect(max(1, args.calls // 10))
+    bench_dbus(args.calls)
+
+
+if __name__ == '__main__':
+    main()
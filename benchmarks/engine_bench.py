@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Compare the threaded TimerManager with the asyncio AsyncTimerManager.
+
+    python3 benchmarks/engine_bench.py --timers 2000
+
+For each engine this measures how fast timers can be added, how long it
+takes from the shared deadline until every completion has been handled,
+and how fast timers can be cancelled. All timers use the minimum duration
+of one second so they complete together.
+"""
+import sys
+import time
+import asyncio
+import argparse
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from gi.repository import GLib  # noqa: E402
+from timer_app.timer_model import TimerManager  # noqa: E402
+from timer_app.async_manager import AsyncTimerManager  # noqa: E402
+
+
+def report(name, count, elapsed):
+    """Print one result line.
+
+    Args:
+        name: Measurement description
+        count: Number of operations
+        elapsed: Seconds taken
+    """
+    print(f"{name:<34} {count / elapsed:>10.0f} ops/s  {elapsed * 1000:>9.1f} ms total")
+
+
+def bench_threaded(count):
+    """Measure the thread-per-timer engine driven by a GLib main loop.
+
+    Args:
+        count: Number of timers
+    """
+    manager = TimerManager()
+    loop = GLib.MainLoop()
+    completed = []
+
+    def on_event(event, timer):
+        if event == 'completed':
+            completed.append(time.monotonic())
+            if len(completed) == count:
+                loop.quit()
+
+    manager.add_event_callback(on_event)
+
+    started = time.perf_counter()
+    for i in range(count):
+        manager.add_timer(f"timer {i}", 0, 0, 1)
+    report("threaded: add", count, time.perf_counter() - started)
+
+    last_deadline = max(t.deadline for t in manager.get_all_timers())
+    loop.run()
+    lag = completed[-1] - last_deadline
+    print(f"{'threaded: all completed after':<34} {lag * 1000:>10.1f} ms past deadline")
+
+    ids = [manager.add_timer(f"timer {i}", 1, 0, 0) for i in range(count)]
+    started = time.perf_counter()
+    for timer_id in ids:
+        manager.delete_timer(timer_id)
+    report("threaded: cancel", count, time.perf_counter() - started)
+    manager.shutdown()
+
+
+async def bench_async(count):
+    """Measure the asyncio engine.
+
+    Args:
+        count: Number of timers
+    """
+    manager = AsyncTimerManager()
+
+    started = time.perf_counter()
+    ids = [await manager.add(f"timer {i}", seconds=1) for i in range(count)]
+    report("asyncio: add", count, time.perf_counter() - started)
+
+    last_deadline = max(t.deadline for t in manager.get_all_timers())
+    await asyncio.gather(*(manager.wait_for_completion(timer_id) for timer_id in ids))
+    lag = time.monotonic() - last_deadline
+    print(f"{'asyncio: all completed after':<34} {lag * 1000:>10.1f} ms past deadline")
+
+    ids = [await manager.add(f"timer {i}", hours=1) for i in range(count)]
+    started = time.perf_counter()
+    for timer_id in ids:
+        await manager.cancel(timer_id)
+    report("asyncio: cancel", count, time.perf_counter() - started)
+
+
+def main():
+    """Run the benchmarks."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--timers', type=int, default=1000, help='Timers per measurement')
+    args = parser.parse_args()
+
+    bench_threaded(args.timers)
+    asyncio.run(bench_async(args.timers))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Measure the memory-mapped timer snapshot.
+
+Runs standalone against a snapshot file in a temporary directory:
+
+    python3 benchmarks/snapshot_bench.py --timers 100 --reads 20000
+
+Reports the cost of publishing and of reading a snapshot, then reads
+while another thread keeps publishing and checks that every snapshot
+read is consistent (all records come from the same publish). If the app
+is running, the same read is compared with a QueryTimers call on the
+control socket.
+"""
+import sys
+import time
+import uuid
+import argparse
+import tempfile
+import threading
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from timer_app import rpc, snapshot  # noqa: E402
+
+
+def report(name, ops, elapsed):
+    """Print one result line.
+
+    Args:
+        name: What was measured
+        ops: Number of operations
+        elapsed: Seconds taken
+    """
+    print(f"{name:<32} {ops / elapsed:>10.0f} ops/s  {elapsed / ops * 1e6:>8.1f} us/op")
+
+
+def make_timers(count, generation):
+    """Build publish() input whose titles all carry a generation number.
+
+    Args:
+        count: Number of timers
+        generation: Number stored in every title
+
+    Returns:
+        List of timer tuples
+    """
+    now = time.time()
+    return [
+        (str(uuid.UUID(int=i)), f"timer {i} gen {generation}", now + 60 + i, 0.0, now,
+         i == 0, False)
+        for i in range(count)
+    ]
+
+
+def bench_local(count, reads, path):
+    """Measure publishing and reading without contention.
+
+    Args:
+        count: Timers per snapshot
+        reads: Number of reads
+        path: Snapshot file path
+    """
+    writer = snapshot.SnapshotWriter(path)
+    writer.open()
+    timers = make_timers(count, 0)
+
+    publishes = max(1, reads // 10)
+    started = time.perf_counter()
+    for version in range(publishes):
+        writer.publish(timers, version)
+    report(f"publish ({count} timers)", publishes, time.perf_counter() - started)
+
+    reader = snapshot.SnapshotReader(path)
+    started = time.perf_counter()
+    for _ in range(reads):
+        reader.read()
+    report(f"read, mapped ({count} timers)", reads, time.perf_counter() - started)
+
+    started = time.perf_counter()
+    for _ in range(reads // 10):
+        snapshot.read_snapshot(path)
+    report("read, open each time", reads // 10, time.perf_counter() - started)
+    reader.close()
+    return writer
+
+
+def bench_contended(writer, count, reads, path):
+    """Read while another thread publishes, checking consistency.
+
+    Args:
+        writer: Open SnapshotWriter
+        count: Timers per snapshot
+        reads: Number of reads
+        path: Snapshot file path
+    """
+    stop = threading.Event()
+
+    def publish_loop():
+        generation = 0
+        while not stop.is_set():
+            generation += 1
+            # Vary the size so the file is also replaced while being read
+            writer.publish(make_timers(count + generation % 3 * count, generation), generation)
+
+    thread = threading.Thread(target=publish_loop, daemon=True)
+    thread.start()
+
+    reader = snapshot.SnapshotReader(path)
+    torn = 0
+    started = time.perf_counter()
+    for _ in range(reads):
+        timers = reader.read().timers
+        generations = {t.title.rsplit(' ', 1)[1] for t in timers}
+        if len(generations) > 1:
+            torn += 1
+    report("read while publishing", reads, time.perf_counter() - started)
+    stop.set()
+    thread.join()
+    reader.close()
+    print(f"{'inconsistent reads':<32} {torn:>10}")
+
+
+def bench_socket(reads):
+    """Compare with a QueryTimers call on the running app.
+
+    Args:
+        reads: Number of calls
+    """
+    client = rpc.connect()
+    if client is None:
+        print("control socket: not available")
+        return
+
+    fields = ['id', 'title', 'deadline', 'pinned', 'paused']
+    started = time.perf_counter()
+    for _ in range(reads):
+        client.QueryTimers('', 'deadline', 0, 0, fields)
+    report("socket QueryTimers", reads, time.perf_counter() - started)
+    client.close()
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--timers', type=int, default=100, help='Timers per snapshot')
+    parser.add_argument('--reads', type=int, default=20000, help='Reads per measurement')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / 'snapshot'
+        writer = bench_local(args.timers, args.reads, path)
+        bench_contended(writer, args.timers, args.reads // 10, path)
+        writer.close()
+
+    bench_socket(args.reads // 10)
+
+
+if __name__ == '__main__':
+    main()
@@ -10,4 +10,4 @@ if [ ! -d "venv" ]; then
 fi
 
 source venv/bin/activate
-python3 timer_app/main.py
+python3 timer_app/main.py "$@"
@@ -0,0 +1,160 @@
+import time
+from collections import OrderedDict
+from timer_app.control import ControlError
+from timer_app.locks import create_lock
+
+
+class AdmissionError(ControlError):
+    """A timer creation request refused by admission control."""
+
+
+class TokenBucket:
+    """Token bucket allowing `rate` operations per second with bursts."""
+
+    def __init__(self, rate, burst):
+        """Initialize a full bucket.
+
+        Args:
+            rate: Tokens added per second
+            burst: Maximum number of tokens
+        """
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+
+    def refill(self, now):
+        """Add the tokens earned since the last update.
+
+        Args:
+            now: Current time.monotonic()
+        """
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def take(self, now):
+        """Take one token if available.
+
+        Args:
+            now: Current time.monotonic()
+
+        Returns:
+            0.0 if a token was taken, otherwise seconds until one is available
+        """
+        self.refill(now)
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0.0
+        return (1 - self.tokens) / self.rate if self.rate > 0 else float('inf')
+
+
+class AdmissionControl:
+    """Limits how fast clients may create timers and how many may exist.
+
+    Every client (the Unix user behind a DBus or control socket call)
+    gets its own token bucket, refilled at rate_per_second up to burst; each creation
+    request (a single timer or an import batch) takes one token.
+    Independently of the rate, no more than max_active timers may be
+    active at once.
+    """
+
+    def __init__(self, max_active=10000, rate_per_second=20, burst=100, max_clients=1024):
+        """Initialize admission control.
+
+        Args:
+            max_active: Maximum number of active timers (0 for no limit)
+            rate_per_second: Sustained creation requests per client (0 for no limit)
+            burst: Requests a client may make at once before the rate applies
+            max_clients: Client buckets remembered before the least recently
+                used are forgotten
+        """
+        self.max_active = max_active
+        self.rate_per_second = rate_per_second
+        self.burst = max(1, burst)
+        self.max_clients = max_clients
+        self.buckets = OrderedDict()  # Client -> TokenBucket, least recent first
+        self.lock = create_lock('admission')
+        self.stats = {
+            'admitted': 0,
+            'rejected_active': 0,  # Refused because max_active was reached
+            'rejected_rate': 0,  # Refused by a client's token bucket
+        }
+
+    def admit(self, client, active, count=1):
+        """Check whether a client may create timers and account for them.
+
+        Args:
+            client: Client identifier (None for local callers, which are
+                only subject to max_active)
+            active: Number of currently active timers
+            count: Number of timers to be created
+
+        Raises:
+            AdmissionError: "TooManyTimers" if max_active would be exceeded,
+                "RateLimited" if the client's bucket is empty
+        """
+        with self.lock:
+            if self.max_active and active + count > self.max_active:
+                self.stats['rejected_active'] += 1
+                raise AdmissionError(
+                    'TooManyTimers',
+                    f"Limit of {self.max_active} active timers reached "
+                    f"({active} active)"
+                )
+
+            if client is not None and self.rate_per_second > 0:
+                wait = self._bucket(client).take(time.monotonic())
+                if wait > 0:
+                    self.stats['rejected_rate'] += 1
+                    raise AdmissionError(
+                        'RateLimited',
+                        f"Creating timers too fast, retry in {wait:.1f}s"
+                    )
+
+            self.stats['admitted'] += count
+
+    def refund(self, client, count=1):
+        """Give back what admit() took for a request that then failed.
+
+        Args:
+            client: Client identifier passed to admit()
+            count: Number of timers passed to admit()
+        """
+        with self.lock:
+            self.stats['admitted'] -= count
+            bucket = self.buckets.get(client) if client is not None else None
+            if bucket is not None:
+                bucket.tokens = min(bucket.burst, bucket.tokens + 1)
+
+    def _bucket(self, client):
+        """Get a client's token bucket, creating it if needed.
+
+        Should only be called with the lock held.
+
+        Args:
+            client: Client identifier
+
+        Returns:
+            TokenBucket
+        """
+        bucket = self.buckets.get(client)
+        if bucket is None:
+            bucket = TokenBucket(self.rate_per_second, self.burst)
+            self.buckets[client] = bucket
+            if len(self.buckets) > self.max_clients:
+                # A forgotten client starts again with a full bucket
+                self.buckets.popitem(last=False)
+        else:
+            self.buckets.move_to_end(client)
+        return bucket
+
+    def get_stats(self):
+        """Get admission statistics.
+
+        Returns:
+            Dictionary of counters plus the number of tracked clients
+        """
+        with self.lock:
+            stats = dict(self.stats)
+            stats['clients'] = len(self.buckets)
+        return stats
@@ -2,25 +2,19 @@ import gi
 gi.require_version('Gtk', '3.0')
 gi.require_version('AppIndicator3', '0.1')
 from gi.repository import Gtk, AppIndicator3, GLib
-from timer_app.timer_model import TimerManager
-from timer_app.notifications import NotificationHandler
-from timer_app.timer_history import TimerHistory
-from timer_app.timer_presets import TimerPresets
+from timer_app.core import TimerCore
+from timer_app.metrics import timed
 from timer_app.ui.menu_builder import MenuBuilder
 from timer_app.ui.add_timer_dialog import AddTimerDialog
 from timer_app.ui.view_timers_dialog import ViewTimersDialog
 
 
-class TimerApp:
+class TimerApp(TimerCore):
     """Main application class for the multi-timer system tray app."""
 
     def __init__(self):
         """Initialize the timer application."""
-        self.timer_manager = TimerManager()
-        self.notification_handler = NotificationHandler()
-        self.timer_history = TimerHistory()
-        self.timer_presets = TimerPresets()
-        self.timer_manager.set_notification_handler(self.notification_handler)
+        super().__init__()
 
         self.indicator = AppIndicator3.Indicator.new(
             "multi-timer-app",
@@ -35,6 +29,10 @@ class TimerApp:
 
         self.view_dialog = None
 
+        # Hot-reload presets when the config file is edited
+        self.config_watcher = None
+        self._init_config_watcher()
+
         self.label_update_timeout_id = None
 
         # Register for pin change notifications
@@ -46,23 +44,41 @@ class TimerApp:
         # Initial label update
         self.update_indicator_label()
 
-        # Initialize DBus service for CLI support
-        self.dbus_service = None
-        self._init_dbus_service()
+        # Initialize DBus service and control socket for CLI support
+        self.start_services()
 
-    def _init_dbus_service(self):
-        """Initialize the DBus service for CLI communication."""
+    def _init_config_watcher(self):
+        """Watch the config directory for edits to the presets file."""
         try:
-            from timer_app.dbus_service import TimerAppDBusService
-            self.dbus_service = TimerAppDBusService(self)
-            print("DBus service initialized - CLI support enabled")
+            from timer_app.config_watcher import ConfigWatcher
+            self.config_watcher = ConfigWatcher(self.timer_presets.config_file.parent)
+            self.config_watcher.watch(
+                self.timer_presets.config_file.name, self.on_presets_file_changed
+            )
         except Exception as e:
-            print(f"Warning: Could not initialize DBus service: {e}")
-            print("CLI support will not be available")
+            print(f"Warning: Could not watch config directory: {e}")
+            print("Preset changes will need an app restart")
+
+    def on_presets_updated(self, diff):
+        """Patch the menu after presets were imported or reloaded.
+
+        Args:
+            diff: Change description from TimerPresets.add_presets() or
+                TimerPresets.reload_if_changed()
+        """
+        super().on_presets_updated(diff)
+        self.menu_builder.update_presets(diff)
+
+    def on_presets_file_changed(self):
+        """Reload presets and patch the menu after the presets file changed."""
+        diff = self.timer_presets.reload_if_changed()
+        if diff:
+            self.on_presets_updated(diff)
 
     def show_add_timer_dialog(self):
         """Show the dialog to add a new timer."""
-        dialog = AddTimerDialog(None, self.timer_history.get_titles())
+        # History is unbounded, so only offer the most relevant titles
+        dialog = AddTimerDialog(None, self.timer_history.get_titles(limit=200))
         response = dialog.run()
 
         if response == Gtk.ResponseType.OK:
@@ -90,24 +106,38 @@ class TimerApp:
         else:
             self.view_dialog.present()
 
+    def show_timers(self):
+        """Bring up the active timers window for another launch of the app.
+
+        Returns:
+            True
+        """
+        self.show_view_timers_dialog()
+        return True
+
     def start_preset_timer(self, preset):
         """Start a timer from a preset.
 
         Args:
-            preset: Dictionary with keys: title, hours, minutes, seconds
+            preset: Dictionary with keys: title, hours, minutes, seconds,
+                and optionally warnings (seconds before completion) and
+                hooks (commands or URLs to run on completion)
         """
         try:
             self.timer_manager.add_timer(
                 preset["title"],
                 preset["hours"],
                 preset["minutes"],
-                preset["seconds"]
+                preset["seconds"],
+                warnings=preset.get("warnings"),
+                hooks=preset.get("hooks")
             )
             # Save to history
             self.timer_history.add_title(preset["title"])
         except Exception as e:
             print(f"Error starting preset timer: {e}")
 
+    @timed('indicator_label')
     def update_indicator_label(self):
         """Update the AppIndicator label with pinned timer countdown.
 
@@ -155,7 +185,10 @@ class TimerApp:
             GLib.source_remove(self.label_update_timeout_id)
             self.label_update_timeout_id = None
 
-        self.timer_manager.shutdown()
+        if self.config_watcher:
+            self.config_watcher.stop()
+
+        self.shutdown()
         Gtk.main_quit()
 
     def run(self):
@@ -0,0 +1,304 @@
+"""
+asyncio-native timer engine.
+
+Each timer is a loop.call_at handle instead of a thread, and all state is
+only touched from the event loop, so no lock is needed. Pinning follows
+the same rules as TimerManager: the first timer is pinned, a new timer
+that ends sooner than the pinned one takes the pin, and when the pinned
+timer ends the earliest remaining timer is pinned.
+"""
+import time
+import heapq
+import asyncio
+from collections import namedtuple
+from timer_app.timer_model import Timer, TimerManager
+
+
+# kind is "added", "warning", "completed" or "cancelled"; seconds_left is
+# set for warnings only
+TimerEvent = namedtuple('TimerEvent', ['kind', 'timer', 'seconds_left', 'timestamp'])
+
+
+class AsyncTimerManager:
+    """Manages timers on an asyncio event loop.
+
+    All methods must be called from the loop's thread.
+    """
+
+    def __init__(self, loop=None, event_queue_size=1024):
+        """Initialize the manager.
+
+        Args:
+            loop: Event loop to schedule timers on (defaults to the
+                running loop when the first timer is added)
+            event_queue_size: Events buffered per events() subscriber
+                before the oldest are dropped
+        """
+        self.loop = loop
+        self.event_queue_size = event_queue_size
+        self.timers = {}
+        self.handles = {}  # Timer ID -> list of pending TimerHandles
+        self.waiters = {}  # Timer ID -> Future resolved when it finishes
+        # (deadline, created_at, id) of every timer; finished ones are
+        # skipped lazily, so finding the earliest timer is O(log n)
+        self.deadline_heap = []
+        self.subscribers = []  # asyncio.Queue per events() iterator
+        self.pinned_timer_id = None
+        self.pin_change_callbacks = []
+        self.dropped_events = 0
+
+    def _get_loop(self):
+        """Get the loop timers are scheduled on.
+
+        Returns:
+            asyncio event loop
+        """
+        if self.loop is None:
+            self.loop = asyncio.get_running_loop()
+        return self.loop
+
+    async def add(self, title, hours=0, minutes=0, seconds=0, warnings=None, hooks=None):
+        """Create and start a new timer.
+
+        Args:
+            title: Timer display name
+            hours: Hours
+            minutes: Minutes
+            seconds: Seconds
+            warnings: Optional list of seconds-before-completion at which to
+                emit a "warning" event
+            hooks: Optional list of commands or URLs, kept on the timer for
+                event consumers
+
+        Returns:
+            Timer ID (UUID string)
+
+        Raises:
+            ValueError: If duration is less than 1 second
+        """
+        total_seconds = hours * 3600 + minutes * 60 + seconds
+        if total_seconds < 1:
+            raise ValueError("Timer duration must be at least 1 second")
+
+        loop = self._get_loop()
+        timer = Timer(title, total_seconds, warnings, hooks)
+        # loop.time() need not be time.monotonic(), so schedule relative to it
+        due = loop.time() + (timer.deadline - time.monotonic())
+
+        handles = [
+            loop.call_at(due - offset, self._warn, timer.id, offset)
+            for offset in timer.warnings
+        ]
+        handles.append(loop.call_at(due, self._finish, timer.id, 'completed'))
+        self.timers[timer.id] = timer
+        self.handles[timer.id] = handles
+        heapq.heappush(self.deadline_heap, (timer.deadline, timer.created_at, timer.id))
+
+        sort_key = TimerManager.SORT_KEYS['deadline']
+        pinned = self.timers.get(self.pinned_timer_id)
+        if pinned is None or sort_key(timer) < sort_key(pinned):
+            self._set_pin(timer.id)
+
+        self._publish('added', timer)
+        return timer.id
+
+    async def cancel(self, timer_id):
+        """Stop and remove a timer.
+
+        Args:
+            timer_id: UUID string
+
+        Returns:
+            True if the timer existed
+        """
+        if timer_id not in self.timers:
+            return False
+        self._finish(timer_id, 'cancelled')
+        return True
+
+    async def wait_for_completion(self, timer_id):
+        """Wait until a timer completes or is cancelled.
+
+        Args:
+            timer_id: UUID string
+
+        Returns:
+            True if the timer completed, False if it was cancelled
+
+        Raises:
+            KeyError: If no such timer is active
+        """
+        if timer_id not in self.timers:
+            raise KeyError(timer_id)
+
+        waiter = self.waiters.get(timer_id)
+        if waiter is None:
+            waiter = self._get_loop().create_future()
+            self.waiters[timer_id] = waiter
+        # Shielded so one cancelled waiter doesn't cancel the others
+        return await asyncio.shield(waiter)
+
+    async def events(self):
+        """Iterate over timer events as they happen.
+
+        Yields:
+            TimerEvent tuples. If the consumer falls more than
+            event_queue_size events behind, the oldest are dropped.
+        """
+        queue = asyncio.Queue(maxsize=self.event_queue_size)
+        self.subscribers.append(queue)
+        try:
+            while True:
+                yield await queue.get()
+        finally:
+            self.subscribers.remove(queue)
+
+    def get_all_timers(self):
+        """Get list of all active timers.
+
+        Returns:
+            List of Timer objects
+        """
+        return list(self.timers.values())
+
+    def get_timer(self, timer_id):
+        """Get a specific timer by ID.
+
+        Args:
+            timer_id: UUID string
+
+        Returns:
+            Timer object or None if not found
+        """
+        return self.timers.get(timer_id)
+
+    def get_earliest_timer(self):
+        """Find the timer that will complete soonest.
+
+        Returns:
+            Timer object or None if no timers exist
+        """
+        heap = self.deadline_heap
+        while heap and heap[0][2] not in self.timers:
+            heapq.heappop(heap)
+        return self.timers[heap[0][2]] if heap else None
+
+    def set_pinned_timer(self, timer_id):
+        """Pin a specific timer.
+
+        Args:
+            timer_id: UUID string of timer to pin, or None to pin the earliest
+
+        Returns:
+            bool: True if successful, False if timer_id doesn't exist
+        """
+        if timer_id is None:
+            earliest = self.get_earliest_timer()
+            self._set_pin(earliest.id if earliest else None, force=True)
+            return True
+        if timer_id not in self.timers:
+            return False
+        self._set_pin(timer_id, force=True)
+        return True
+
+    def unpin_timer(self):
+        """Unpin the current timer and auto-pin the earliest timer."""
+        self.set_pinned_timer(None)
+
+    def get_pinned_timer(self):
+        """Get the currently pinned timer object.
+
+        Returns:
+            Timer object or None if no timer is pinned
+        """
+        return self.timers.get(self.pinned_timer_id)
+
+    def get_pinned_timer_id(self):
+        """Get the ID of the currently pinned timer.
+
+        Returns:
+            String timer ID or None
+        """
+        return self.pinned_timer_id
+
+    def add_pin_change_callback(self, callback):
+        """Register a callback to be called when the pinned timer changes.
+
+        Args:
+            callback: Function that takes no arguments
+        """
+        if callback not in self.pin_change_callbacks:
+            self.pin_change_callbacks.append(callback)
+
+    async def shutdown(self):
+        """Cancel every timer."""
+        for timer_id in list(self.timers):
+            self._finish(timer_id, 'cancelled')
+
+    def _set_pin(self, timer_id, force=False):
+        """Change the pinned timer and call the pin callbacks.
+
+        Args:
+            timer_id: ID to pin, or None
+            force: Call the callbacks even if the pin didn't change, as
+                TimerManager does for explicit pin requests
+        """
+        if timer_id == self.pinned_timer_id and not force:
+            return
+        self.pinned_timer_id = timer_id
+        for callback in self.pin_change_callbacks:
+            self._get_loop().call_soon(callback)
+
+    def _warn(self, timer_id, seconds_left):
+        """Emit a warning event for a timer that is still active.
+
+        Args:
+            timer_id: UUID string
+            seconds_left: The warning offset that was reached
+        """
+        timer = self.timers.get(timer_id)
+        if timer is not None:
+            self._publish('warning', timer, seconds_left)
+
+    def _finish(self, timer_id, kind):
+        """Remove a completed or cancelled timer.
+
+        Args:
+            timer_id: UUID string
+            kind: "completed" or "cancelled"
+        """
+        timer = self.timers.pop(timer_id, None)
+        if timer is None:
+            return
+        timer.is_active = False
+        for handle in self.handles.pop(timer_id, []):
+            handle.cancel()
+        if len(self.deadline_heap) > 2 * len(self.timers) + 64:
+            # Drop entries of cancelled timers that aren't near the top
+            self.deadline_heap = [e for e in self.deadline_heap if e[2] in self.timers]
+            heapq.heapify(self.deadline_heap)
+
+        if timer_id == self.pinned_timer_id:
+            earliest = self.get_earliest_timer()
+            self._set_pin(earliest.id if earliest else None, force=True)
+
+        waiter = self.waiters.pop(timer_id, None)
+        if waiter is not None and not waiter.done():
+            waiter.set_result(kind == 'completed')
+
+        self._publish(kind, timer)
+
+    def _publish(self, kind, timer, seconds_left=None):
+        """Send an event to every events() subscriber.
+
+        Args:
+            kind: Event kind
+            timer: The Timer object
+            seconds_left: Warning offset for warning events
+        """
+        event = TimerEvent(kind, timer, seconds_left, time.time())
+        for queue in self.subscribers:
+            if queue.full():
+                queue.get_nowait()
+                self.dropped_events += 1
+            queue.put_nowait(event)
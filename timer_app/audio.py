@@ -0,0 +1,262 @@
+import os
+import time
+import queue
+import shutil
+import threading
+import subprocess
+from timer_app.metrics import REGISTRY
+
+PLAY_LATENCY = REGISTRY.histogram(
+    'multi_timer_sound_latency_seconds', 'Time from a sound request to its player being started'
+)
+
+
+class AudioWorker(threading.Thread):
+    """Long-lived thread that plays the alert sound on request.
+
+    Requests are queued instead of each spawning a player. Requests that
+    arrive within a short window of each other are merged into a single
+    play, and no more than a fixed number of plays may overlap, so a burst
+    of completions produces one alert instead of dozens.
+
+    When a sound file and `pactl` are available, the file is uploaded once
+    to the PulseAudio/PipeWire sample cache. The server keeps the decoded
+    sample, and each play is a short play-sample request.
+
+    Players that run for the whole sound (paplay, canberra) count as
+    playing until they exit. Plays that return at once (pactl
+    play-sample, playsound) count as playing for the sample's duration
+    as reported by the sound server, or DEFAULT_PLAY_SECONDS if it is
+    unknown.
+    """
+
+    SAMPLE_NAME = 'multi-timer-alert'
+
+    # Assumed length of a play that doesn't block and has no known duration
+    DEFAULT_PLAY_SECONDS = 2.0
+
+    def __init__(self, method, player=None, sound_path=None,
+                 coalesce_seconds=0.3, max_concurrent=2, beep=None):
+        """Initialize the audio worker.
+
+        Args:
+            method: Sound method ("playsound", "canberra", "paplay" or "beep")
+            player: Absolute path of the player command, if any
+            sound_path: Sound file to play, if any
+            coalesce_seconds: Window in which requests are merged
+            max_concurrent: Maximum number of plays at the same time
+            beep: Function producing the fallback system beep
+        """
+        super().__init__(daemon=True, name='AudioWorker')
+        self.method = method
+        self.player = player
+        self.sound_path = sound_path
+        self.coalesce_seconds = coalesce_seconds
+        self.max_concurrent = max_concurrent
+        self.beep = beep or (lambda: None)
+
+        # Bounded: a full queue already guarantees a play is coming
+        self.requests = queue.Queue(maxsize=64)
+        self.processes = []  # Player processes that may still be running
+        self.play_ends = []  # Monotonic end times of plays without a process
+        self.sample_seconds = None  # Duration of the cached sample
+        self.playsound = None
+        self.pactl = None  # Set once the sample is in the server's cache
+
+        self.stats_lock = threading.Lock()
+        self.stats = {
+            'requests': 0,
+            'plays': 0,
+            'merged': 0,  # Requests folded into another play
+            'skipped': 0,  # Plays dropped because too many were running
+            'last_latency': 0.0,  # Seconds from request to play start
+            'max_latency': 0.0,
+            'total_latency': 0.0,
+        }
+
+    def request_play(self):
+        """Ask for the alert sound to be played. Never blocks."""
+        try:
+            self.requests.put_nowait(time.monotonic())
+        except queue.Full:
+            with self.stats_lock:
+                self.stats['requests'] += 1
+                self.stats['merged'] += 1
+
+    def get_stats(self):
+        """Get playback statistics.
+
+        Returns:
+            Dictionary of counters plus queue_depth and avg_latency
+        """
+        with self.stats_lock:
+            stats = dict(self.stats)
+        stats['queue_depth'] = self.requests.qsize()
+        stats['avg_latency'] = (
+            stats['total_latency'] / stats['plays'] if stats['plays'] else 0.0
+        )
+        return stats
+
+    def stop(self):
+        """Ask the worker to exit after the current request."""
+        try:
+            self.requests.put_nowait(None)
+        except queue.Full:
+            pass
+
+    def run(self):
+        """Serve play requests until stopped."""
+        self._prepare_sample()
+
+        while True:
+            requested_at = self.requests.get()
+            if requested_at is None:
+                return
+
+            # Give the rest of a burst time to arrive, then merge it
+            time.sleep(self.coalesce_seconds)
+            merged = 0
+            stop = False
+            while True:
+                try:
+                    extra = self.requests.get_nowait()
+                except queue.Empty:
+                    break
+                if extra is None:
+                    stop = True
+                    break
+                merged += 1
+
+            self._play(requested_at, merged)
+            if stop:
+                return
+
+    def _prepare_sample(self):
+        """Upload the sound file to the sound server's sample cache."""
+        if not self.sound_path or self.method == 'canberra':
+            return
+
+        pactl = shutil.which('pactl')
+        if not pactl:
+            return
+
+        try:
+            result = subprocess.run(
+                [pactl, 'upload-sample', self.sound_path, self.SAMPLE_NAME],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                timeout=5
+            )
+            if result.returncode == 0:
+                self.pactl = pactl
+        except (OSError, subprocess.TimeoutExpired):
+            pass
+
+        if self.pactl:
+            self.sample_seconds = self._sample_duration()
+
+    def _sample_duration(self):
+        """Ask the sound server how long the cached sample plays.
+
+        Returns:
+            Duration in seconds, or None if it couldn't be read
+        """
+        try:
+            result = subprocess.run(
+                [self.pactl, 'list', 'samples'],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                env=dict(os.environ, LC_ALL='C'),
+                text=True,
+                timeout=5
+            )
+        except (OSError, subprocess.TimeoutExpired):
+            return None
+
+        in_sample = False
+        for line in result.stdout.splitlines():
+            key, _, value = line.strip().partition(': ')
+            if key == 'Name':
+                in_sample = value == self.SAMPLE_NAME
+            elif key == 'Duration' and in_sample:
+                try:
+                    return float(value.rstrip('s'))
+                except ValueError:
+                    return None
+        return None
+
+    def _play(self, requested_at, merged):
+        """Play the alert once for a merged group of requests.
+
+        Args:
+            requested_at: Monotonic time of the first request in the group
+            merged: Number of additional requests folded into this play
+        """
+        now = time.monotonic()
+        self.processes = [p for p in self.processes if p.poll() is None]
+        self.play_ends = [end for end in self.play_ends if end > now]
+
+        with self.stats_lock:
+            self.stats['requests'] += 1 + merged
+            self.stats['merged'] += merged
+            if len(self.processes) + len(self.play_ends) >= self.max_concurrent:
+                self.stats['skipped'] += 1
+                return
+
+        try:
+            process = self._start_player()
+            if self.pactl or self.method == 'playsound':
+                # The player returns before the sound ends
+                self.play_ends.append(now + (self.sample_seconds or self.DEFAULT_PLAY_SECONDS))
+            elif process is not None:
+                self.processes.append(process)
+        except Exception as e:
+            print(f"Error playing sound: {e}")
+            self.beep()
+
+        latency = time.monotonic() - requested_at
+        PLAY_LATENCY.observe(latency)
+        with self.stats_lock:
+            self.stats['plays'] += 1
+            self.stats['last_latency'] = latency
+            self.stats['total_latency'] += latency
+            self.stats['max_latency'] = max(self.stats['max_latency'], latency)
+
+    def _start_player(self):
+        """Start playing the alert with the configured method.
+
+        Returns:
+            subprocess.Popen for the player, or None if none was started
+        """
+        if self.pactl:
+            return subprocess.Popen(
+                [self.pactl, 'play-sample', self.SAMPLE_NAME],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL
+            )
+
+        if self.method == 'playsound':
+            # Custom sound file with playsound
+            if self.playsound is None:
+                from playsound import playsound
+                self.playsound = playsound
+            self.playsound(self.sound_path, block=False)
+        elif self.method == 'canberra':
+            # GNOME notification sound
+            return subprocess.Popen(
+                [self.player or 'canberra-gtk-play',
+                 '-i', 'complete', '-d', 'Timer Complete'],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL
+            )
+        elif self.method == 'paplay':
+            # System sound file with paplay
+            return subprocess.Popen(
+                [self.player or 'paplay', self.sound_path],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL
+            )
+        elif self.method == 'beep':
+            # Fallback to system beep
+            self.beep()
+        return None
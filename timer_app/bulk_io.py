@@ -0,0 +1,249 @@
+"""
+Streaming import/export of timers, presets and history as JSONL or CSV.
+
+Every stage is a generator, so files of any size are processed one record
+at a time and only one batch is held in memory.
+"""
+import csv
+import json
+from pathlib import Path
+from timer_app.utils import parse_duration
+
+
+KINDS = ('timer', 'preset', 'history')
+CSV_FIELDS = ['type', 'title', 'seconds']
+
+
+def detect_format(path, default='jsonl'):
+    """Guess the file format from its extension.
+
+    Args:
+        path: File path, or "-" for stdin/stdout
+        default: Format to use when the extension doesn't tell
+
+    Returns:
+        "jsonl" or "csv"
+    """
+    if path != '-' and path.lower().endswith('.csv'):
+        return 'csv'
+    return default
+
+
+def parse_rows(lines, fmt, errors=None):
+    """Parse input lines into dictionaries.
+
+    Lines that can't be parsed are skipped and reported through the
+    errors list, so one bad line doesn't abort the rest of the import.
+
+    Args:
+        lines: Iterable of text lines
+        fmt: "jsonl" or "csv"
+        errors: Optional list collecting (line_number, message)
+
+    Yields:
+        Tuples of (line_number, dict)
+    """
+    if fmt == 'csv':
+        reader = csv.DictReader(lines)
+        while True:
+            try:
+                row = next(reader)
+            except StopIteration:
+                return
+            except csv.Error as e:
+                if errors is not None:
+                    errors.append((reader.line_num, str(e)))
+                continue
+            yield reader.line_num, row
+
+    for line_number, line in enumerate(lines, 1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            row = json.loads(line)
+        except ValueError as e:
+            if errors is not None:
+                errors.append((line_number, f"invalid JSON: {e}"))
+            continue
+        if not isinstance(row, dict):
+            if errors is not None:
+                errors.append((line_number, "record must be a JSON object"))
+            continue
+        yield line_number, row
+
+
+def _row_seconds(row):
+    """Get the duration of a row in seconds.
+
+    Accepts "seconds", "hours"/"minutes"/"seconds" or a "duration" string
+    such as "1h30m".
+
+    Args:
+        row: Parsed record dictionary
+
+    Returns:
+        Integer seconds (0 if the row has no duration)
+    """
+    if row.get('duration'):
+        hours, minutes, seconds = parse_duration(str(row['duration']))
+        return hours * 3600 + minutes * 60 + seconds
+
+    total = 0
+    for key, factor in (('hours', 3600), ('minutes', 60), ('seconds', 1)):
+        value = row.get(key)
+        if value not in (None, ''):
+            total += int(value) * factor
+    return total
+
+
+def to_records(rows, errors=None):
+    """Turn parsed rows into (kind, title, seconds) records.
+
+    Invalid rows are skipped and reported through the errors list.
+
+    Args:
+        rows: Iterable of (line_number, dict)
+        errors: Optional list collecting (line_number, message)
+
+    Yields:
+        Tuples of (kind, title, seconds)
+    """
+    for line_number, row in rows:
+        try:
+            kind = (row.get('type') or 'timer').strip().lower()
+            title = (row.get('title') or '').strip()
+            if kind not in KINDS:
+                raise ValueError(f"unknown type '{kind}'")
+            if not title:
+                raise ValueError("missing title")
+            seconds = _row_seconds(row)
+            if kind != 'history' and seconds < 1:
+                raise ValueError("duration must be at least 1 second")
+            yield kind, title, seconds
+        except Exception as e:
+            if errors is not None:
+                errors.append((line_number, str(e)))
+
+
+def chunked(records, size):
+    """Group records into lists of at most size items.
+
+    Args:
+        records: Iterable of records
+        size: Maximum batch size
+
+    Yields:
+        Lists of records
+    """
+    batch = []
+    for record in records:
+        batch.append(record)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def iter_active_timers(service, page_size=500):
+    """Page through the app's active timers over one connection.
+
+    Args:
+        service: DBus interface for the timer app
+        page_size: Timers fetched per call
+
+    Yields:
+        Record dictionaries for active timers
+    """
+    import math
+    import time
+
+    cursor = ''
+    while True:
+        cursor, page = service.ListTimers(cursor, page_size, ['title', 'deadline'])
+        now = time.time()
+        for timer in page:
+            yield {
+                'type': 'timer',
+                'title': str(timer['title']),
+                'seconds': max(1, math.ceil(timer['deadline'] - now)),
+            }
+        if len(page) < page_size:
+            return
+
+
+def iter_presets(config_dir):
+    """Read presets from the presets config file.
+
+    Args:
+        config_dir: Path of the app's config directory
+
+    Yields:
+        Record dictionaries for presets
+    """
+    path = Path(config_dir) / 'timer_presets.json'
+    if not path.exists():
+        return
+
+    with open(path, 'r') as f:
+        presets = json.load(f).get('presets', [])
+    for preset in presets:
+        yield {
+            'type': 'preset',
+            'title': preset['title'],
+            'seconds': preset['hours'] * 3600 + preset['minutes'] * 60 + preset['seconds'],
+        }
+
+
+def iter_history(config_dir):
+    """Stream title history from the history database.
+
+    Args:
+        config_dir: Path of the app's config directory
+
+    Yields:
+        Record dictionaries for history titles, least relevant first so
+        that importing them restores the same ranking
+    """
+    from timer_app.timer_history import SQLiteTitleStore
+
+    db_path = Path(config_dir) / 'timer_history.db'
+    if not db_path.exists():
+        return
+
+    store = SQLiteTitleStore(db_path, readonly=True)
+    try:
+        cursor = store.conn.execute(
+            "SELECT title FROM titles ORDER BY last_used ASC"
+        )
+        for (title,) in cursor:
+            yield {'type': 'history', 'title': title, 'seconds': 0}
+    finally:
+        store.close()
+
+
+def write_records(records, out, fmt):
+    """Write record dictionaries to a stream.
+
+    Args:
+        records: Iterable of record dictionaries
+        out: Writable text stream
+        fmt: "jsonl" or "csv"
+
+    Returns:
+        Number of records written
+    """
+    count = 0
+    if fmt == 'csv':
+        writer = csv.DictWriter(out, fieldnames=CSV_FIELDS, extrasaction='ignore')
+        writer.writeheader()
+        for record in records:
+            writer.writerow(record)
+            count += 1
+        return count
+
+    for record in records:
+        out.write(json.dumps(record) + '\n')
+        count += 1
+    return count
@@ -4,18 +4,34 @@ Command-line interface for the Multi-Timer application.
 """
 import sys
 import argparse
-import dbus
+from pathlib import Path
+from timer_app.utils import parse_duration
 
 
 def get_timer_service():
-    """Get the DBus service for the timer app.
+    """Get a connection to the running timer app.
+
+    Uses the app's control socket when it is available, which avoids
+    loading dbus-python and the session bus handshake, and falls back to
+    DBus otherwise. Set MULTI_TIMER_TRANSPORT=dbus to always use DBus.
 
     Returns:
-        DBus proxy object for the timer service
+        RpcClient or DBus proxy object; both offer the same methods
 
     Raises:
         Exception if the service is not available
     """
+    import os
+
+    if os.environ.get('MULTI_TIMER_TRANSPORT', 'socket') != 'dbus':
+        from timer_app import rpc
+        client = rpc.connect()
+        if client is not None:
+            return client
+
+    # Imported here so commands that only read local files don't need DBus
+    import dbus
+
     try:
         bus = dbus.SessionBus()
         proxy = bus.get_object(
@@ -30,66 +46,6 @@ def get_timer_service():
         ) from e
 
 
-def parse_duration(duration_str):
-    """Parse a duration string into hours, minutes, seconds.
-
-    Supported formats:
-    - "5m" - 5 minutes
-    - "1h30m" - 1 hour 30 minutes
-    - "2h" - 2 hours
-    - "90s" - 90 seconds
-    - "1h30m45s" - 1 hour 30 minutes 45 seconds
-
-    Args:
-        duration_str: Duration string to parse
-
-    Returns:
-        Tuple of (hours, minutes, seconds)
-
-    Raises:
-        ValueError if the format is invalid
-    """
-    hours = 0
-    minutes = 0
-    seconds = 0
-
-    duration_str = duration_str.lower().strip()
-
-    # Parse hours
-    if 'h' in duration_str:
-        parts = duration_str.split('h')
-        try:
-            hours = int(parts[0])
-            duration_str = parts[1] if len(parts) > 1 else ''
-        except ValueError:
-            raise ValueError(f"Invalid hours value in duration: {duration_str}")
-
-    # Parse minutes
-    if 'm' in duration_str:
-        parts = duration_str.split('m')
-        try:
-            minutes = int(parts[0])
-            duration_str = parts[1] if len(parts) > 1 else ''
-        except ValueError:
-            raise ValueError(f"Invalid minutes value in duration: {duration_str}")
-
-    # Parse seconds
-    if 's' in duration_str:
-        parts = duration_str.split('s')
-        try:
-            seconds = int(parts[0])
-        except ValueError:
-            raise ValueError(f"Invalid seconds value in duration: {duration_str}")
-    elif duration_str and duration_str.strip():
-        # If there's leftover text, it's invalid
-        raise ValueError(f"Invalid duration format: {duration_str}")
-
-    if hours == 0 and minutes == 0 and seconds == 0:
-        raise ValueError("Duration must be greater than 0")
-
-    return hours, minutes, seconds
-
-
 def add_timer(args):
     """Add a timer via CLI.
 
@@ -103,7 +59,25 @@ def add_timer(args):
         hours, minutes, seconds = parse_duration(args.duration)
 
         # Add timer
-        success = service.AddTimer(args.title, hours, minutes, seconds)
+        if args.warn or args.hook:
+            from timer_app.rpc import RpcClient
+            warnings = []
+            for warn in args.warn or []:
+                h, m, s = parse_duration(warn)
+                warnings.append(h * 3600 + m * 60 + s)
+            options = {'warnings': warnings, 'hooks': args.hook or []}
+            if not isinstance(service, RpcClient):
+                # DBus can't guess the signature of empty lists
+                import dbus
+                options = dbus.Dictionary({
+                    'warnings': dbus.Array(warnings, signature='i'),
+                    'hooks': dbus.Array(args.hook or [], signature='s'),
+                }, signature='sv')
+            success = service.AddTimerWithOptions(
+                args.title, hours, minutes, seconds, options
+            )
+        else:
+            success = service.AddTimer(args.title, hours, minutes, seconds)
 
         if success:
             print(f"✓ Timer '{args.title}' started for {hours}h {minutes}m {seconds}s")
@@ -116,67 +90,473 @@ def add_timer(args):
         sys.exit(1)
 
 
+def query_timers(args):
+    """Query active timers for the list command.
+
+    Reads the app's memory-mapped snapshot when it is available, so no
+    request is made at all, and asks the app otherwise.
+
+    Args:
+        args: Parsed command-line arguments
+
+    Returns:
+        Tuple of (total matching timers, list of dictionaries with title,
+        deadline, pinned and paused)
+    """
+    import os
+    import time
+
+    if os.environ.get('MULTI_TIMER_TRANSPORT', 'socket') != 'dbus':
+        from timer_app import snapshot
+        try:
+            timers = snapshot.read_snapshot().timers
+        except (OSError, ValueError, RuntimeError):
+            pass
+        else:
+            total, timers = snapshot.query_snapshot(timers, args.filter, args.sort, args.limit)
+            now = time.time()
+            return total, [{
+                'title': t.title,
+                'deadline': now + t.remaining if t.paused else t.deadline,
+                'pinned': t.pinned,
+                'paused': t.paused,
+            } for t in timers]
+
+    service = get_timer_service()
+    return service.QueryTimers(
+        args.filter, args.sort, args.limit, 0, ['title', 'deadline', 'pinned', 'paused']
+    )
+
+
 def list_timers(args):
     """List all active timers.
 
     Args:
         args: Parsed command-line arguments
     """
+    import math
+    import time
+    from timer_app.utils import format_time
+
     try:
-        service = get_timer_service()
-        timers = service.GetTimers()
+        total, timers = query_timers(args)
 
         if not timers:
-            print("No active timers")
+            print("No matching timers" if args.filter else "No active timers")
             return
 
-        print(f"Active timers ({len(timers)}):")
+        shown = f"{len(timers)} of {total}" if len(timers) < total else f"{total}"
+        print(f"Active timers ({shown}):")
         print("-" * 50)
-        for timer_id, title, remaining, _ in timers:
-            print(f"  {title}: {remaining}")
+        now = time.time()
+        for timer in timers:
+            remaining = max(0, math.ceil(timer['deadline'] - now))
+            state = " (pinned)" if timer['pinned'] else ""
+            if timer['paused']:
+                state += " (paused)"
+            print(f"  {timer['title']}: {format_time(remaining)}{state}")
 
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)
 
 
-def delete_timer(args):
-    """Delete a timer via CLI.
+def watch_timers(args):
+    """Show a live dashboard of active timers until interrupted.
+
+    Takes one snapshot with QueryTimers, then follows the app's lifecycle
+    signals over the same connection. Countdowns are computed locally from
+    the deadlines and only changed lines are redrawn.
 
     Args:
         args: Parsed command-line arguments
     """
+    import shutil
+    import signal
+    import dbus
+    import dbus.mainloop.glib
+    from gi.repository import GLib
+    from timer_app.dashboard import TimerDashboard
+
+    if not sys.stdout.isatty():
+        print("Error: watch needs a terminal, use 'timer-cli list' instead", file=sys.stderr)
+        sys.exit(1)
+
+    # Signals are delivered through the GLib main loop
+    dbus.mainloop.glib.DBusGMainLoop(set_as_default=True)
+    bus = dbus.SessionBus()
+    proxy = bus.get_object(
+        'com.github.MultiTimerApp',
+        '/com/github/MultiTimerApp',
+        introspect=False,
+        follow_name_owner_changes=True
+    )
+    service = dbus.Interface(proxy, 'com.github.MultiTimerApp')
+
+    size = shutil.get_terminal_size()
+    dashboard = TimerDashboard(sys.stdout, size.lines, size.columns)
+    loop = GLib.MainLoop()
+
+    def take_snapshot(owner):
+        if not owner:
+            dashboard.set_snapshot([])
+            dashboard.set_status("waiting for the app to start")
+        else:
+            try:
+                _, timers = service.QueryTimers(
+                    '', 'deadline', 0, 0, ['id', 'title', 'deadline', 'pinned', 'paused']
+                )
+                pinned = [str(t['id']) for t in timers if t['pinned']]
+                dashboard.set_snapshot(
+                    (
+                        (str(t['id']), str(t['title']), float(t['deadline']), bool(t['paused']))
+                        for t in timers
+                    ),
+                    pinned[0] if pinned else ''
+                )
+                dashboard.set_status('')
+            except dbus.exceptions.DBusException as e:
+                dashboard.set_status(f"error: {e.get_dbus_message()}")
+        dashboard.render()
+
+    def on_added(timers):
+        for timer_id, title, deadline in timers:
+            dashboard.add(str(timer_id), str(title), float(deadline))
+        dashboard.render()
+
+    def on_changed(timers):
+        for timer_id, title, deadline, paused in timers:
+            dashboard.add(str(timer_id), str(title), float(deadline), bool(paused))
+        dashboard.render()
+
+    def on_removed(timers):
+        for timer_id, _ in timers:
+            dashboard.remove(str(timer_id))
+        dashboard.render()
+
+    def on_pin_changed(timer_id):
+        dashboard.set_pinned(str(timer_id))
+        dashboard.render()
+
+    def on_tick():
+        dashboard.render()
+        return True
+
+    def on_resize():
+        size = shutil.get_terminal_size()
+        dashboard.resize(size.lines, size.columns)
+        dashboard.render()
+        return True
+
+    def on_interrupt():
+        loop.quit()
+        return False
+
+    # Subscribe before the snapshot so no change can fall in between
+    service.connect_to_signal('TimerAdded', on_added)
+    service.connect_to_signal('TimerDeleted', on_removed)
+    service.connect_to_signal('TimerCompleted', on_removed)
+    service.connect_to_signal('TimerChanged', on_changed)
+    service.connect_to_signal('PinChanged', on_pin_changed)
+
+    dashboard.open()
     try:
-        service = get_timer_service()
+        # Called right away with the current owner, and again if the app restarts
+        bus.watch_name_owner('com.github.MultiTimerApp', take_snapshot)
+        GLib.timeout_add(1000, on_tick)
+        GLib.unix_signal_add(GLib.PRIORITY_DEFAULT, signal.SIGINT, on_interrupt)
+        GLib.unix_signal_add(GLib.PRIORITY_DEFAULT, signal.SIGTERM, on_interrupt)
+        GLib.unix_signal_add(GLib.PRIORITY_DEFAULT, signal.SIGWINCH, on_resize)
+        loop.run()
+    finally:
+        dashboard.close()
+
+
+def title_match(args):
+    """Get the title match mode selected on the command line.
+
+    Args:
+        args: Parsed command-line arguments
+
+    Returns:
+        "exact", "all", "prefix" or "glob"
+    """
+    if getattr(args, 'all', False):
+        return 'all'
+    if args.glob:
+        return 'glob'
+    if args.prefix:
+        return 'prefix'
+    return 'exact'
 
-        # Get all timers to find the one matching the title
-        timers = service.GetTimers()
 
-        matching_timer = None
-        for timer_id, title, _, _ in timers:
-            if title.lower() == args.title.lower():
-                matching_timer = timer_id
-                break
+def delete_timer(args):
+    """Delete timers by title via CLI.
 
-        if not matching_timer:
+    Args:
+        args: Parsed command-line arguments
+    """
+    try:
+        service = get_timer_service()
+        count = service.DeleteTimerByTitle(args.title, title_match(args))
+
+        if not count:
             print(f"✗ Timer '{args.title}' not found", file=sys.stderr)
             sys.exit(1)
 
-        success = service.DeleteTimer(matching_timer)
-
-        if success:
+        if count == 1:
             print(f"✓ Timer '{args.title}' deleted")
         else:
-            print("✗ Failed to delete timer", file=sys.stderr)
+            print(f"✓ {count} timers matching '{args.title}' deleted")
+
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+def pause_timer(args):
+    """Pause or resume timers by title via CLI.
+
+    Args:
+        args: Parsed command-line arguments
+    """
+    paused = args.command == 'pause'
+    action = 'paused' if paused else 'resumed'
+
+    try:
+        service = get_timer_service()
+        count = service.PauseTimerByTitle(args.title, title_match(args), paused)
+
+        if not count:
+            print(f"✗ No {'running' if paused else 'paused'} timer '{args.title}'", file=sys.stderr)
             sys.exit(1)
 
+        if count == 1:
+            print(f"✓ Timer '{args.title}' {action}")
+        else:
+            print(f"✓ {count} timers matching '{args.title}' {action}")
+
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)
 
 
-def main():
-    """Main CLI entry point."""
+def show_history(args):
+    """List previously used timer titles, most relevant first.
+
+    Reads the history database directly, so the app doesn't need to be running.
+
+    Args:
+        args: Parsed command-line arguments
+    """
+    from timer_app.timer_history import SQLiteTitleStore
+
+    db_path = Path.home() / '.config' / 'multi-timer-app' / 'timer_history.db'
+    if not db_path.exists():
+        print("No timer history")
+        return
+
+    try:
+        store = SQLiteTitleStore(db_path, readonly=True)
+        entries = list(store.iter_entries(prefix=args.prefix, limit=args.limit))
+        store.close()
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    if not entries:
+        print("No matching titles")
+        return
+
+    for title, use_count, _ in entries:
+        print(f"  {title} ({use_count}x)")
+
+
+def show_stats(args):
+    """Show how much time went to each title or day.
+
+    Reads the completion log directly, so the app doesn't need to be running.
+
+    Args:
+        args: Parsed command-line arguments
+    """
+    from timer_app.completion_log import CompletionLog, get_log_dir, days_ago
+    from timer_app.utils import format_time
+
+    if args.live:
+        show_live_stats(args)
+        return
+
+    if not get_log_dir().exists():
+        print("No completed timers yet")
+        return
+
+    start = days_ago(args.days - 1) if args.days else None
+    try:
+        groups = CompletionLog().stats(start=start, group_by=args.by, title=args.title)
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    if not groups:
+        print("No matching timers")
+        return
+
+    if args.by == 'day':
+        keys = sorted(groups)
+    else:
+        keys = sorted(groups, key=lambda k: groups[k]['actual_seconds'], reverse=True)
+
+    period = f"last {args.days} days" if args.days else "all time"
+    print(f"Timer usage by {args.by} ({period}):")
+    print("-" * 50)
+    for key in keys:
+        group = groups[key]
+        line = f"  {key}: {format_time(group['actual_seconds'])}"
+        line += f" ({group['completed']} completed"
+        if group['cancelled']:
+            line += f", {group['cancelled']} cancelled"
+        line += ")"
+        print(line)
+
+
+def show_live_stats(args):
+    """Show the usage aggregates kept live by the running app.
+
+    Args:
+        args: Parsed command-line arguments
+    """
+    from timer_app.utils import format_time
+
+    try:
+        service = get_timer_service()
+        rows = service.GetUsageStats(args.by)
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    if args.title:
+        folded = args.title.casefold()
+        rows = [r for r in rows if str(r[0]).casefold() == folded]
+
+    if not rows:
+        print("No matching timers")
+        return
+
+    if args.by == 'day':
+        rows = sorted(rows, key=lambda r: str(r[0]))
+    else:
+        rows = sorted(rows, key=lambda r: r[3], reverse=True)
+
+    print(f"Live timer usage by {args.by}:")
+    print("-" * 50)
+    for key, completed, cancelled, total_seconds, avg_overrun in rows:
+        line = f"  {key}: {format_time(int(total_seconds))}"
+        line += f" ({completed} completed"
+        if cancelled:
+            line += f", {cancelled} cancelled"
+        if completed:
+            line += f", avg overrun {avg_overrun:+.0f}s"
+        line += ")"
+        print(line)
+
+
+def import_records(args):
+    """Import timers, presets and history from a JSONL or CSV file.
+
+    Records are streamed from the file and sent to the app in batches over
+    a single connection.
+
+    Args:
+        args: Parsed command-line arguments
+    """
+    from timer_app import bulk_io
+
+    fmt = args.format or bulk_io.detect_format(args.file)
+    errors = []
+    imported = 0
+
+    try:
+        service = get_timer_service()
+        stream = sys.stdin if args.file == '-' else open(args.file, 'r', newline='')
+        with stream:
+            rows = bulk_io.parse_rows(stream, fmt, errors)
+            records = bulk_io.to_records(rows, errors)
+            for batch in bulk_io.chunked(records, args.batch_size):
+                imported += service.ImportRecords(batch, timeout=120)
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    for line_number, message in errors[:20]:
+        print(f"  line {line_number}: {message}", file=sys.stderr)
+    if len(errors) > 20:
+        print(f"  ... and {len(errors) - 20} more errors", file=sys.stderr)
+
+    print(f"✓ Imported {imported} records" + (f", skipped {len(errors)}" if errors else ""))
+    if errors:
+        sys.exit(1)
+
+
+def export_records(args):
+    """Export active timers, presets and history as JSONL or CSV.
+
+    Args:
+        args: Parsed command-line arguments
+    """
+    import itertools
+    from timer_app import bulk_io
+
+    config_dir = Path.home() / '.config' / 'multi-timer-app'
+    what = [w.strip() for w in args.what.split(',') if w.strip()]
+    fmt = args.format or bulk_io.detect_format(args.output)
+
+    sources = []
+    try:
+        for kind in what:
+            if kind == 'timers':
+                sources.append(bulk_io.iter_active_timers(get_timer_service()))
+            elif kind == 'presets':
+                sources.append(bulk_io.iter_presets(config_dir))
+            elif kind == 'history':
+                sources.append(bulk_io.iter_history(config_dir))
+            else:
+                raise ValueError(f"Unknown export type: {kind}")
+
+        out = sys.stdout if args.output == '-' else open(args.output, 'w', newline='')
+        with out:
+            count = bulk_io.write_records(itertools.chain(*sources), out, fmt)
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    if args.output != '-':
+        print(f"✓ Exported {count} records to {args.output}")
+
+
+def print_completion(args):
+    """Print a shell completion script.
+
+    Args:
+        args: Parsed command-line arguments
+    """
+    from timer_app import shell_completion
+
+    if args.shell == 'bash':
+        print(shell_completion.bash_script(build_parser()), end='')
+    else:
+        print(shell_completion.zsh_script(build_parser()), end='')
+
+
+def build_parser():
+    """Build the command-line argument parser.
+
+    Arguments whose values can be completed from the app's completion
+    cache carry a `completer` attribute, see timer_app.shell_completion.
+
+    Returns:
+        argparse.ArgumentParser
+    """
     parser = argparse.ArgumentParser(
         description='Command-line interface for Multi-Timer app',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -191,11 +571,37 @@ Examples:
   # Add a timer with seconds
   timer-cli add "Quick task" 2m30s
 
+  # Warn 5 minutes and 1 minute before the end
+  timer-cli add "Talk" 45m --warn 5m --warn 1m
+
+  # Run a command when the timer ends
+  timer-cli add "Build" 10m --hook "make deploy"
+
   # List all active timers
   timer-cli list
 
+  # Follow timers live until Ctrl+C
+  timer-cli watch
+
   # Delete a timer
   timer-cli delete "Coffee"
+
+  # Pause every timer whose title starts with "build", then resume them
+  timer-cli pause build --prefix
+  timer-cli resume build --prefix
+
+  # Show previously used titles starting with "co"
+  timer-cli history co
+
+  # Show time spent per title this week
+  timer-cli stats --days 7
+
+  # Copy timers, presets and history to another machine
+  timer-cli export -o timers.jsonl
+  timer-cli import timers.jsonl
+
+  # Enable tab completion of commands, titles and presets
+  source <(timer-cli completion bash)
         """
     )
 
@@ -203,23 +609,144 @@ Examples:
 
     # Add timer command
     add_parser = subparsers.add_parser('add', help='Add a new timer')
-    add_parser.add_argument('title', help='Timer title/name')
+    add_parser.add_argument('title', help='Timer title/name').completer = 'preset history'
     add_parser.add_argument(
         'duration',
         help='Duration (e.g., 5m, 1h30m, 2h, 90s, 1h30m45s)'
+    ).completer = 'duration'
+    add_parser.add_argument(
+        '--warn', action='append', metavar='DURATION',
+        help='Send a warning this long before the timer ends (repeatable, e.g. --warn 5m)'
+    )
+    add_parser.add_argument(
+        '--hook', action='append', metavar='COMMAND',
+        help='Command or http(s) URL to run when the timer ends (repeatable)'
     )
     add_parser.set_defaults(func=add_timer)
 
     # List timers command
     list_parser = subparsers.add_parser('list', help='List all active timers')
+    list_parser.add_argument(
+        'filter', nargs='?', default='',
+        help='Only show titles containing this text or matching this glob'
+    ).completer = 'timer paused'
+    list_parser.add_argument(
+        '--sort', default='deadline',
+        help='Sort by deadline, title or created ("-" prefix for descending)'
+    )
+    list_parser.add_argument(
+        '-n', '--limit', type=int, default=50, help='Maximum timers to show (0 for all)'
+    )
     list_parser.set_defaults(func=list_timers)
 
+    # Watch timers command
+    watch_parser = subparsers.add_parser(
+        'watch', help='Show a live view of active timers'
+    )
+    watch_parser.set_defaults(func=watch_timers)
+
     # Delete timer command
     delete_parser = subparsers.add_parser('delete', help='Delete a timer')
-    delete_parser.add_argument('title', help='Timer title/name to delete')
     delete_parser.set_defaults(func=delete_timer)
 
-    # Parse arguments
+    # Pause and resume commands
+    pause_parser = subparsers.add_parser('pause', help='Pause a timer')
+    pause_parser.set_defaults(func=pause_timer)
+    resume_parser = subparsers.add_parser('resume', help='Resume a paused timer')
+    resume_parser.set_defaults(func=pause_timer)
+
+    title_completers = {
+        delete_parser: 'timer paused',
+        pause_parser: 'timer',
+        resume_parser: 'paused',
+    }
+    for title_parser, completer in title_completers.items():
+        title_parser.add_argument(
+            'title', help='Timer title/name (case-insensitive)'
+        ).completer = completer
+        match_group = title_parser.add_mutually_exclusive_group()
+        match_group.add_argument(
+            '--prefix', action='store_true', help='Match every title starting with TITLE'
+        )
+        match_group.add_argument(
+            '--glob', action='store_true', help='Treat TITLE as a glob pattern, e.g. "tea*"'
+        )
+        if title_parser is delete_parser:
+            match_group.add_argument(
+                '--all', action='store_true',
+                help='Delete every timer with this title, not just the soonest'
+            )
+
+    # History command
+    history_parser = subparsers.add_parser(
+        'history', help='Show previously used timer titles'
+    )
+    history_parser.add_argument(
+        'prefix', nargs='?', default=None, help='Only show titles starting with this'
+    ).completer = 'history'
+    history_parser.add_argument(
+        '-n', '--limit', type=int, default=20, help='Maximum titles to show'
+    )
+    history_parser.set_defaults(func=show_history)
+
+    # Stats command
+    stats_parser = subparsers.add_parser(
+        'stats', help='Show time spent on completed and cancelled timers'
+    )
+    stats_parser.add_argument(
+        '--days', type=int, default=7,
+        help='Number of days to include, counting today (0 for all time)'
+    )
+    stats_parser.add_argument(
+        '--by', choices=['title', 'day'], default='title', help='How to group results'
+    )
+    stats_parser.add_argument(
+        '--title', help='Only include timers with this title'
+    ).completer = 'history'
+    stats_parser.add_argument(
+        '--live', action='store_true',
+        help='Show the running totals kept by the app (ignores --days)'
+    )
+    stats_parser.set_defaults(func=show_stats)
+
+    # Import command
+    import_parser = subparsers.add_parser(
+        'import', help='Import timers, presets and history from JSONL/CSV'
+    )
+    import_parser.add_argument('file', help='File to read, or - for stdin').completer = 'files'
+    import_parser.add_argument('--format', choices=['jsonl', 'csv'])
+    import_parser.add_argument(
+        '--batch-size', type=int, default=500, help='Records sent per call'
+    )
+    import_parser.set_defaults(func=import_records)
+
+    # Export command
+    export_parser = subparsers.add_parser(
+        'export', help='Export timers, presets and history as JSONL/CSV'
+    )
+    export_parser.add_argument(
+        '-o', '--output', default='-', help='File to write, or - for stdout'
+    ).completer = 'files'
+    export_parser.add_argument('--format', choices=['jsonl', 'csv'])
+    export_parser.add_argument(
+        '--what', default='timers,presets,history',
+        help='Comma-separated list of: timers, presets, history'
+    )
+    export_parser.set_defaults(func=export_records)
+
+    # Completion script command
+    completion_parser = subparsers.add_parser(
+        'completion', help='Print a shell completion script'
+    )
+    completion_parser.add_argument('shell', choices=['bash', 'zsh'])
+    completion_parser.set_defaults(func=print_completion)
+
+    return parser
+
+
+def main():
+    """Main CLI entry point."""
+    parser = build_parser()
     args = parser.parse_args()
 
     if not args.command:
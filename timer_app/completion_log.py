@@ -0,0 +1,409 @@
+import os
+import json
+import time
+import struct
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from timer_app.metrics import REGISTRY
+
+
+# timestamp, title ID, planned seconds, actual seconds, kind
+RECORD = struct.Struct('<IIIIB')
+
+WRITE_SECONDS = REGISTRY.histogram(
+    'multi_timer_journal_write_seconds', 'Time taken to append a completion log record'
+)
+
+KIND_COMPLETED = 0
+KIND_CANCELLED = 1
+
+
+def get_log_dir():
+    """Get the directory holding the completion log.
+
+    Returns:
+        Path object for the log directory
+    """
+    return Path.home() / '.config' / 'multi-timer-app' / 'completion_log'
+
+
+class CompletionLog:
+    """Append-only log of finished and cancelled timers.
+
+    Records are fixed-size binary structs written to one segment file per
+    local day (seg-YYYYMMDD.bin), so a time-range query only opens the
+    segments for the days it covers. Titles are stored once in an
+    append-only dictionary file and referenced by their line number, and
+    per-segment summaries are cached in an index file.
+    """
+
+    TITLES_FILE = 'titles.jsonl'
+    INDEX_FILE = 'index.json'
+
+    def __init__(self, directory=None):
+        """Initialize the completion log.
+
+        Args:
+            directory: Log directory (defaults to get_log_dir())
+        """
+        self.directory = Path(directory) if directory else get_log_dir()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.titles = []  # title ID -> title
+        self.title_ids = {}  # title -> title ID
+        self._titles_size = 0  # Bytes of the titles file already loaded
+        self._segment_file = None
+        self._segment_day = None
+        self._index = None  # segment name -> cached per-title summary
+        self._index_dirty = False
+        self.listeners = []
+        self._load_titles()
+
+    def add_listener(self, callback):
+        """Register a callback for every appended record.
+
+        Args:
+            callback: Function taking (title, planned_seconds, actual_seconds,
+                kind, timestamp)
+        """
+        self.listeners.append(callback)
+
+    def _load_titles(self):
+        """Load titles added to the dictionary since the last call."""
+        path = self.directory / self.TITLES_FILE
+        try:
+            with open(path, 'rb') as f:
+                f.seek(self._titles_size)
+                data = f.read()
+        except FileNotFoundError:
+            return
+
+        # Ignore a trailing line that is still being written
+        end = data.rfind(b'\n') + 1
+        for line in data[:end].splitlines():
+            title = json.loads(line)
+            self.title_ids.setdefault(title, len(self.titles))
+            self.titles.append(title)
+        self._titles_size += end
+
+    def _get_title_id(self, title):
+        """Get the dictionary ID of a title, adding it if needed.
+
+        Args:
+            title: Timer title
+
+        Returns:
+            Integer title ID
+        """
+        title_id = self.title_ids.get(title)
+        if title_id is not None:
+            return title_id
+
+        line = (json.dumps(title) + '\n').encode('utf-8')
+        with open(self.directory / self.TITLES_FILE, 'ab') as f:
+            f.write(line)
+        self._titles_size += len(line)
+
+        title_id = len(self.titles)
+        self.titles.append(title)
+        self.title_ids[title] = title_id
+        return title_id
+
+    def _segment_path(self, day):
+        """Get the segment file for a local day.
+
+        Args:
+            day: datetime.date
+
+        Returns:
+            Path object for the segment
+        """
+        return self.directory / f"seg-{day:%Y%m%d}.bin"
+
+    def append(self, title, planned_seconds, actual_seconds, kind, timestamp=None):
+        """Append one record to the log.
+
+        Args:
+            title: Timer title
+            planned_seconds: Duration the timer was set for
+            actual_seconds: Seconds from start until it finished or was cancelled
+            kind: KIND_COMPLETED or KIND_CANCELLED
+            timestamp: Unix time of the event (defaults to now)
+        """
+        if timestamp is None:
+            timestamp = time.time()
+
+        day = date.fromtimestamp(timestamp)
+        if day != self._segment_day:
+            if self._segment_file:
+                self._segment_file.close()
+            self._segment_file = open(self._segment_path(day), 'ab')
+            self._segment_day = day
+
+        timestamp = int(timestamp)
+        planned_seconds = max(0, int(planned_seconds))
+        actual_seconds = max(0, int(round(actual_seconds)))
+
+        with WRITE_SECONDS.time():
+            self._segment_file.write(RECORD.pack(
+                timestamp,
+                self._get_title_id(title),
+                planned_seconds,
+                actual_seconds,
+                kind
+            ))
+            self._segment_file.flush()
+
+        for callback in self.listeners:
+            try:
+                callback(title, planned_seconds, actual_seconds, kind, timestamp)
+            except Exception as e:
+                print(f"Error in completion log listener: {e}")
+
+    def _iter_segments(self, start=None, end=None):
+        """Find the segments overlapping a time range.
+
+        Args:
+            start: Unix time of the range start (None for the beginning)
+            end: Unix time of the range end, exclusive (None for now)
+
+        Yields:
+            Tuples of (path, partial) where partial is True if the segment
+            may hold records outside the range
+        """
+        first = date.fromtimestamp(start) if start is not None else None
+        last = date.fromtimestamp(end) if end is not None else None
+
+        for path in sorted(self.directory.glob('seg-*.bin')):
+            try:
+                day = datetime.strptime(path.stem[4:], '%Y%m%d').date()
+            except ValueError:
+                continue
+            if (first and day < first) or (last and day > last):
+                continue
+            yield path, (day == first or day == last)
+
+    def _read_segment(self, path):
+        """Read all complete records of a segment.
+
+        Args:
+            path: Segment file path
+
+        Returns:
+            Bytes holding a whole number of records
+        """
+        with open(path, 'rb') as f:
+            data = f.read()
+        # Ignore a trailing record that is still being written
+        return data[:len(data) - len(data) % RECORD.size]
+
+    def _iter_raw(self, start=None, end=None):
+        """Iterate over raw records in a time range, oldest first.
+
+        Args:
+            start: Unix time of the range start (None for the beginning)
+            end: Unix time of the range end, exclusive (None for now)
+
+        Yields:
+            Tuples of (timestamp, title_id, planned_seconds, actual_seconds, kind)
+        """
+        # Pick up titles written by another process (e.g. the running app)
+        self._load_titles()
+
+        for path, partial in self._iter_segments(start, end):
+            records = RECORD.iter_unpack(self._read_segment(path))
+            if not partial:
+                yield from records
+                continue
+            for record in records:
+                if start is not None and record[0] < start:
+                    continue
+                if end is not None and record[0] >= end:
+                    continue
+                yield record
+
+    def _segment_summary(self, path):
+        """Get per-title totals for a whole segment.
+
+        Summaries are cached in index.json keyed by segment name and
+        validated against the segment size, so a segment is only scanned
+        again after records were appended to it.
+
+        Args:
+            path: Segment file path
+
+        Returns:
+            Dictionary of title ID -> [completed, cancelled, planned, actual]
+        """
+        if self._index is None:
+            self._load_index()
+
+        size = path.stat().st_size
+        size -= size % RECORD.size
+        cached = self._index.get(path.name)
+        if cached and cached['size'] == size:
+            return cached['titles']
+
+        totals = {}
+        for _, title_id, planned, actual, kind in RECORD.iter_unpack(self._read_segment(path)[:size]):
+            total = totals.get(title_id)
+            if total is None:
+                total = totals[title_id] = [0, 0, 0, 0]
+            total[kind] += 1
+            total[2] += planned
+            total[3] += actual
+
+        self._index[path.name] = {'size': size, 'titles': totals}
+        self._index_dirty = True
+        return totals
+
+    def _load_index(self):
+        """Load the segment summary index from disk."""
+        self._index = {}
+        try:
+            with open(self.directory / self.INDEX_FILE, 'r') as f:
+                for name, entry in json.load(f).items():
+                    entry['titles'] = {int(k): v for k, v in entry['titles'].items()}
+                    self._index[name] = entry
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"Warning: Could not load completion log index: {e}")
+
+    def _save_index(self):
+        """Write the segment summary index if it changed."""
+        if not self._index_dirty:
+            return
+
+        path = self.directory / self.INDEX_FILE
+        tmp_path = path.with_suffix('.tmp')
+        try:
+            with open(tmp_path, 'w') as f:
+                json.dump(self._index, f)
+            os.replace(tmp_path, path)
+            self._index_dirty = False
+        except Exception as e:
+            print(f"Warning: Could not save completion log index: {e}")
+
+    def iter_records(self, start=None, end=None):
+        """Iterate over records in a time range, oldest first.
+
+        Args:
+            start: Unix time of the range start (None for the beginning)
+            end: Unix time of the range end, exclusive (None for now)
+
+        Yields:
+            Tuples of (timestamp, title, planned_seconds, actual_seconds, kind)
+        """
+        for timestamp, title_id, planned, actual, kind in self._iter_raw(start, end):
+            yield timestamp, self._title_for(title_id), planned, actual, kind
+
+    def _title_for(self, title_id):
+        """Look up a title in the dictionary.
+
+        Args:
+            title_id: Integer title ID
+
+        Returns:
+            Title string
+        """
+        if title_id < len(self.titles):
+            return self.titles[title_id]
+        return f"#{title_id}"
+
+    def stats(self, start=None, end=None, group_by='title', title=None):
+        """Summarize records in a time range.
+
+        Segments that lie entirely inside the range are answered from their
+        cached summaries; only the segments at the edges of the range are
+        scanned record by record.
+
+        Args:
+            start: Unix time of the range start (None for the beginning)
+            end: Unix time of the range end, exclusive (None for now)
+            group_by: "title" or "day" (local date as YYYY-MM-DD)
+            title: Only count records with this title (case-insensitive)
+
+        Returns:
+            Dictionary of group key -> dict with keys: completed, cancelled,
+            planned_seconds, actual_seconds
+        """
+        self._load_titles()
+
+        wanted = None
+        if title:
+            folded = title.casefold()
+            wanted = {i for i, t in enumerate(self.titles) if t.casefold() == folded}
+            if not wanted:
+                return {}
+
+        # group key -> [completed, cancelled, planned, actual]
+        totals = {}
+
+        def add(key, completed, cancelled, planned, actual):
+            total = totals.get(key)
+            if total is None:
+                total = totals[key] = [0, 0, 0, 0]
+            total[0] += completed
+            total[1] += cancelled
+            total[2] += planned
+            total[3] += actual
+
+        for path, partial in self._iter_segments(start, end):
+            if not partial:
+                day_key = f"{path.stem[4:8]}-{path.stem[8:10]}-{path.stem[10:12]}"
+                for title_id, counts in self._segment_summary(path).items():
+                    if wanted is None or title_id in wanted:
+                        add(day_key if group_by == 'day' else title_id, *counts)
+                continue
+
+            for timestamp, title_id, planned, actual, kind in RECORD.iter_unpack(self._read_segment(path)):
+                if start is not None and timestamp < start:
+                    continue
+                if end is not None and timestamp >= end:
+                    continue
+                if wanted is not None and title_id not in wanted:
+                    continue
+                if group_by == 'day':
+                    key = date.fromtimestamp(timestamp).isoformat()
+                else:
+                    key = title_id
+                add(key, kind == KIND_COMPLETED, kind == KIND_CANCELLED, planned, actual)
+
+        self._save_index()
+
+        groups = {}
+        for key, (completed, cancelled, planned, actual) in totals.items():
+            if group_by != 'day':
+                key = self._title_for(key)
+            group = groups.setdefault(key, {
+                'completed': 0,
+                'cancelled': 0,
+                'planned_seconds': 0,
+                'actual_seconds': 0,
+            })
+            group['completed'] += completed
+            group['cancelled'] += cancelled
+            group['planned_seconds'] += planned
+            group['actual_seconds'] += actual
+
+        return groups
+
+    def close(self):
+        """Close the open segment file."""
+        if self._segment_file:
+            self._segment_file.close()
+            self._segment_file = None
+            self._segment_day = None
+
+
+def days_ago(days):
+    """Get the Unix time of local midnight a number of days ago.
+
+    Args:
+        days: Number of days back (0 for today)
+
+    Returns:
+        Unix timestamp
+    """
+    day = date.today() - timedelta(days=days)
+    return time.mktime(day.timetuple())
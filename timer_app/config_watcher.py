@@ -0,0 +1,82 @@
+import gi
+gi.require_version('GLib', '2.0')
+gi.require_version('Gio', '2.0')
+from gi.repository import GLib, Gio
+
+
+class ConfigWatcher:
+    """Watches the config directory and reports changes to specific files.
+
+    Uses Gio.FileMonitor (inotify on Linux) on the directory rather than on
+    the files themselves, so editors that save by writing a temporary file
+    and renaming it over the original are still noticed. Events are
+    debounced so a burst of writes triggers a single callback.
+    """
+
+    def __init__(self, directory, debounce_ms=250):
+        """Initialize the config watcher.
+
+        Args:
+            directory: Path of the directory to watch
+            debounce_ms: Quiet period before a file's callbacks run
+        """
+        self.directory = str(directory)
+        self.debounce_ms = debounce_ms
+        self.callbacks = {}  # filename -> list of callbacks
+        self.pending = {}  # filename -> GLib source ID
+
+        gfile = Gio.File.new_for_path(self.directory)
+        self.monitor = gfile.monitor_directory(Gio.FileMonitorFlags.WATCH_MOVES, None)
+        self.monitor.connect("changed", self._on_changed)
+
+    def watch(self, filename, callback):
+        """Register a callback for changes to a file in the directory.
+
+        Args:
+            filename: Base name of the file (e.g. "timer_presets.json")
+            callback: Function that takes no arguments, called on the main loop
+        """
+        self.callbacks.setdefault(filename, []).append(callback)
+
+    def _on_changed(self, monitor, gfile, other_file, event_type):
+        """Handle a Gio.FileMonitor event.
+
+        Args:
+            monitor: The Gio.FileMonitor
+            gfile: File the event is about
+            other_file: Destination file for rename events (may be None)
+            event_type: Gio.FileMonitorEvent value
+        """
+        names = [gfile.get_basename()]
+        if other_file is not None:
+            names.append(other_file.get_basename())
+
+        for name in names:
+            if name in self.callbacks and name not in self.pending:
+                self.pending[name] = GLib.timeout_add(
+                    self.debounce_ms, self._fire, name
+                )
+
+    def _fire(self, name):
+        """Run the callbacks for a file once its events have settled.
+
+        Args:
+            name: Base name of the changed file
+
+        Returns:
+            False to remove the timeout
+        """
+        self.pending.pop(name, None)
+        for callback in self.callbacks.get(name, []):
+            try:
+                callback()
+            except Exception as e:
+                print(f"Error handling change to {name}: {e}")
+        return False
+
+    def stop(self):
+        """Stop watching the directory."""
+        for source_id in self.pending.values():
+            GLib.source_remove(source_id)
+        self.pending.clear()
+        self.monitor.cancel()
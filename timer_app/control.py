@@ -0,0 +1,336 @@
+"""
+Transport-independent control operations shared by the DBus service and
+the UNIX socket RPC server.
+
+Every method takes and returns plain Python values (str, int, float,
+bool, list, dict), so each transport only has to marshal them.
+"""
+
+
+class ControlError(Exception):
+    """A request the control layer rejected.
+
+    Attributes:
+        name: Short error name, e.g. "InvalidArgs"
+    """
+
+    def __init__(self, name, message):
+        """Initialize the error.
+
+        Args:
+            name: Short error name, e.g. "InvalidArgs"
+            message: Human-readable description
+        """
+        super().__init__(message)
+        self.name = name
+
+
+class TimerControl:
+    """Operations on a running TimerApp, mirroring the DBus interface."""
+
+    # Fields query_timers can return, with how to read them from a Timer
+    QUERY_FIELDS = {
+        'id': lambda t, pinned_id: t.id,
+        'title': lambda t, pinned_id: t.title,
+        'deadline': lambda t, pinned_id: t.deadline_epoch,
+        'total_seconds': lambda t, pinned_id: t.total_seconds,
+        'created_at': lambda t, pinned_id: t.created_at.timestamp(),
+        'pinned': lambda t, pinned_id: t.id == pinned_id,
+        'paused': lambda t, pinned_id: t.is_paused,
+    }
+
+    def __init__(self, timer_app, limits):
+        """Initialize the control layer.
+
+        Args:
+            timer_app: The main TimerApp instance
+            limits: The "limits" settings section
+        """
+        from timer_app.admission import AdmissionControl
+
+        self.timer_app = timer_app
+        self.admission = AdmissionControl(
+            max_active=limits['max_active'],
+            rate_per_second=limits['rate_per_second'],
+            burst=limits['burst']
+        )
+
+    @property
+    def manager(self):
+        """The app's TimerManager."""
+        return self.timer_app.timer_manager
+
+    def add_timer(self, title, hours, minutes, seconds, options=None, client=None):
+        """Add a timer and remember its title.
+
+        Args:
+            title: Timer title
+            hours: Hours component
+            minutes: Minutes component
+            seconds: Seconds component
+            options: Optional dictionary with "warnings" (list of seconds
+                before completion) and "hooks" (list of commands or URLs)
+            client: Identifier of the calling client, for rate limiting
+
+        Returns:
+            ID of the new timer
+
+        Raises:
+            AdmissionError: If a timer limit was hit
+            ControlError: If the duration is invalid
+        """
+        options = options or {}
+        self.admission.admit(client, self.manager.get_timer_count())
+        try:
+            timer_id = self.manager.add_timer(
+                str(title), int(hours), int(minutes), int(seconds),
+                warnings=[int(w) for w in options.get('warnings', [])],
+                hooks=[str(h) for h in options.get('hooks', [])]
+            )
+        except ValueError as e:
+            # An invalid request shouldn't use up the client's rate limit
+            self.admission.refund(client)
+            raise ControlError('InvalidArgs', str(e))
+
+        self.timer_app.timer_history.add_title(str(title))
+        return timer_id
+
+    def import_records(self, records, client=None):
+        """Import a batch of timers, presets and history titles.
+
+        Args:
+            records: List of (kind, title, seconds) where kind is "timer",
+                "preset" or "history"
+            client: Identifier of the calling client, for rate limiting
+
+        Returns:
+            Number of records imported
+
+        Raises:
+            AdmissionError: If the batch would exceed a timer limit
+        """
+        records = [(str(kind), str(title), int(seconds)) for kind, title, seconds in records]
+        timers = sum(1 for kind, _, _ in records if kind == 'timer')
+        if timers:
+            self.admission.admit(client, self.manager.get_timer_count(), timers)
+        return self.timer_app.import_records(records)
+
+    def get_timers(self):
+        """Get all active timers.
+
+        Returns:
+            List of tuples (id, title, remaining_time_formatted, remaining_seconds)
+        """
+        from timer_app.utils import format_time
+
+        result = []
+        for timer in self.manager.get_all_timers():
+            remaining = timer.remaining_seconds
+            result.append((timer.id, timer.title, format_time(remaining), remaining))
+        return result
+
+    def timer_rows(self, timers, names=None):
+        """Convert timers to field dictionaries.
+
+        Args:
+            timers: List of Timer objects
+            names: Field names to include (defaults to all QUERY_FIELDS)
+
+        Returns:
+            List of dictionaries
+        """
+        pinned_id = self.manager.get_pinned_timer_id()
+        getters = [(name, self.QUERY_FIELDS[name]) for name in (names or self.QUERY_FIELDS)]
+        return [{name: get(t, pinned_id) for name, get in getters} for t in timers]
+
+    def query_timers(self, title_filter, sort_key, limit, offset, fields):
+        """Query active timers with filtering, sorting, paging and projection.
+
+        Args:
+            title_filter: Case-insensitive substring or glob ('' for all)
+            sort_key: "deadline", "title" or "created", "-" prefix for descending
+            limit: Maximum number of timers to return (0 for no limit)
+            offset: Number of matching timers to skip
+            fields: Field names to return (empty for all)
+
+        Returns:
+            Tuple of (total matching timers, list of field dictionaries)
+
+        Raises:
+            ControlError: If a field or the sort key is unknown
+        """
+        names = [str(f) for f in fields] or list(self.QUERY_FIELDS)
+        unknown = [f for f in names if f not in self.QUERY_FIELDS]
+        if unknown:
+            raise ControlError('InvalidArgs', f"Unknown fields: {', '.join(unknown)}")
+
+        try:
+            total, timers = self.manager.query_timers(
+                str(title_filter), str(sort_key), int(limit), int(offset)
+            )
+        except ValueError as e:
+            raise ControlError('InvalidArgs', str(e))
+
+        return total, self.timer_rows(timers, names)
+
+    def list_timers(self, after, limit, fields):
+        """Page through active timers in creation order.
+
+        Args:
+            after: Cursor returned by the previous call ('' to start)
+            limit: Maximum number of timers to return
+            fields: Field names to return (empty for all)
+
+        Returns:
+            Tuple of (cursor for the next call, list of field dictionaries).
+            A page shorter than limit is the last one.
+
+        Raises:
+            ControlError: If a field, the cursor or the limit is invalid
+        """
+        names = [str(f) for f in fields] or list(self.QUERY_FIELDS)
+        unknown = [f for f in names if f not in self.QUERY_FIELDS]
+        if unknown:
+            raise ControlError('InvalidArgs', f"Unknown fields: {', '.join(unknown)}")
+
+        try:
+            after = int(str(after) or 0)
+        except ValueError:
+            raise ControlError('InvalidArgs', f"Invalid cursor: {after}")
+        if int(limit) < 1:
+            raise ControlError('InvalidArgs', "Limit must be at least 1")
+
+        timers = self.manager.page_timers(after, int(limit))
+        cursor = str(timers[-1].seq) if timers else str(after)
+        return cursor, self.timer_rows(timers, names)
+
+    def get_changes_since(self, version):
+        """Get the timers added, changed and removed since a version.
+
+        Args:
+            version: Version from the previous call (0 for none)
+
+        Returns:
+            Tuple of (version, full, upserts, removed_ids, pinned_id)
+        """
+        current, full, upserts, removed, pinned_id = self.manager.get_changes_since(int(version))
+        return current, full, self.timer_rows(upserts), removed, pinned_id or ''
+
+    def delete_timer(self, timer_id):
+        """Delete a timer by ID.
+
+        Args:
+            timer_id: UUID of the timer to delete
+
+        Returns:
+            True if the timer existed
+        """
+        return self.manager.delete_timer(str(timer_id))
+
+    def _title_match(self, match):
+        """Validate a title match mode.
+
+        Args:
+            match: Match mode passed by the caller ('' means exact)
+
+        Returns:
+            The match mode to use
+
+        Raises:
+            ControlError: If the match mode is unknown
+        """
+        match = str(match) or 'exact'
+        if match not in self.manager.TITLE_MATCHES:
+            raise ControlError('InvalidArgs', f"Unknown title match: {match}")
+        return match
+
+    def get_timer_by_title(self, pattern, match):
+        """Get the timers whose title matches, soonest first.
+
+        Args:
+            pattern: Title, title prefix or glob pattern (case-insensitive)
+            match: "exact", "prefix" or "glob"
+
+        Returns:
+            List of field dictionaries
+        """
+        match = self._title_match(match)
+        return self.timer_rows(self.manager.find_timers_by_title(str(pattern), match))
+
+    def delete_timer_by_title(self, pattern, match):
+        """Delete the timers whose title matches.
+
+        Args:
+            pattern: Title, title prefix or glob pattern (case-insensitive)
+            match: "exact" (the soonest timer with the title), "all",
+                "prefix" or "glob"
+
+        Returns:
+            Number of timers deleted
+        """
+        match = self._title_match(match)
+        return self.manager.delete_timers_by_title(str(pattern), match)
+
+    def pause_timer_by_title(self, pattern, match, paused):
+        """Pause or resume the timers whose title matches.
+
+        Args:
+            pattern: Title, title prefix or glob pattern (case-insensitive)
+            match: "exact", "prefix" or "glob"
+            paused: True to pause, False to resume
+
+        Returns:
+            Number of timers whose state changed
+        """
+        match = self._title_match(match)
+        return self.manager.set_paused_by_title(str(pattern), bool(paused), match)
+
+    def show_timers(self):
+        """Bring up the active timers window.
+
+        Returns:
+            True if the app has a window to show (False when headless)
+        """
+        return self.timer_app.show_timers()
+
+    def get_stats(self):
+        """Get the internal counters of the engine's components.
+
+        Returns:
+            Dictionary of component name -> dictionary of numeric counters
+        """
+        handler = self.timer_app.notification_handler
+        stats = {
+            'admission': self.admission.get_stats(),
+            'dispatch': handler.get_dispatch_stats(),
+            'hooks': self.timer_app.hook_runner.get_stats(),
+        }
+        sound = handler.get_sound_stats()
+        if sound:
+            stats['sound'] = sound
+        stats['timers'] = {'active': self.manager.get_timer_count()}
+        return stats
+
+    def get_metrics(self):
+        """Get the current value of every runtime metric.
+
+        Returns:
+            Dictionary of 'name{label="value",...}' -> float
+        """
+        from timer_app.metrics import REGISTRY
+
+        return REGISTRY.as_dict()
+
+    def get_usage_stats(self, group_by):
+        """Get the live usage aggregates.
+
+        Args:
+            group_by: "title" or "day"
+
+        Returns:
+            List of tuples (key, completed, cancelled, total_seconds, avg_overrun)
+        """
+        usage_stats = self.timer_app.usage_stats
+        if usage_stats is None:
+            return []
+        return usage_stats.get_rows(str(group_by))
@@ -0,0 +1,279 @@
+import time
+import gi
+gi.require_version('GLib', '2.0')
+from gi.repository import GLib
+from timer_app.timer_model import TimerManager
+from timer_app.notifications import NotificationHandler
+from timer_app.timer_history import TimerHistory
+from timer_app.timer_presets import TimerPresets
+from timer_app.completion_log import CompletionLog
+from timer_app.usage_stats import UsageAggregates
+from timer_app.control import TimerControl
+from timer_app.settings import load_settings
+from timer_app.metrics import REGISTRY, MetricsServer
+
+
+class TimerCore:
+    """Timer engine shared by the tray app and headless mode.
+
+    Owns the timer manager, notifications, history, presets, completion
+    log, hooks and the DBus and control socket endpoints. It needs only a
+    running GLib main loop and never imports GTK.
+    """
+
+    def __init__(self):
+        """Initialize the timer engine."""
+        self.settings = load_settings()
+        self.timer_manager = TimerManager()
+        self.notification_handler = NotificationHandler(self.settings)
+        self.timer_history = TimerHistory()
+        self.timer_presets = TimerPresets()
+        self.timer_manager.set_notification_handler(self.notification_handler)
+
+        self.hook_runner = None
+        self._init_hook_runner()
+
+        self.completion_log = None
+        self.usage_stats = None
+        self.usage_checkpoint_id = None
+        self._init_completion_log()
+
+        self.control = TimerControl(self, self.settings['limits'])
+        self.dbus_service = None
+        self.rpc_server = None
+        self.completion_cache = None
+        self.snapshot_publisher = None
+        self.metrics_server = None
+        self._init_metrics()
+
+    def start_services(self):
+        """Start the DBus service and control socket for CLI support."""
+        self._init_dbus_service()
+        self._init_rpc_server()
+        self._init_snapshot_publisher()
+        self._init_completion_cache()
+        self._init_metrics_server()
+
+    def _init_metrics(self):
+        """Register the timer metrics and export the component counters."""
+        REGISTRY.gauge(
+            'multi_timer_active_timers', 'Timers currently running or paused',
+            func=self.timer_manager.get_timer_count
+        )
+        events = {
+            event: REGISTRY.counter(
+                'multi_timer_timer_events_total', 'Timer lifecycle events', {'event': event}
+            )
+            for event in ('added', 'deleted', 'completed', 'paused', 'resumed')
+        }
+        lateness = REGISTRY.histogram(
+            'multi_timer_completion_lateness_seconds',
+            'Time from a timer\'s deadline to its completion being handled'
+        )
+
+        def on_timer_event(event, timer):
+            counter = events.get(event)
+            if counter is not None:
+                counter.inc()
+            if event == 'completed':
+                lateness.observe(max(0.0, time.monotonic() - timer.deadline))
+
+        self.timer_manager.add_event_callback(on_timer_event)
+        REGISTRY.add_collector(self._collect_component_stats)
+
+    def _collect_component_stats(self):
+        """Export the counters from TimerControl.get_stats() as gauges.
+
+        Returns:
+            List of (name, kind, help, labels, value)
+        """
+        return [
+            (f"multi_timer_{component}_{key}", 'gauge', f"{component} {key}", {}, value)
+            for component, counters in self.control.get_stats().items()
+            for key, value in counters.items()
+        ]
+
+    def _init_metrics_server(self):
+        """Serve the metrics over HTTP if a port is configured."""
+        port = self.settings['metrics']['prometheus_port']
+        if not port:
+            return
+        try:
+            self.metrics_server = MetricsServer(REGISTRY, port)
+            self.metrics_server.start()
+        except Exception as e:
+            self.metrics_server = None
+            print(f"Warning: Could not serve metrics on port {port}: {e}")
+
+    def _init_hook_runner(self):
+        """Start the worker pool for user completion hooks."""
+        from timer_app.hooks import HookRunner
+
+        hook_settings = self.settings['hooks']
+        self.hook_runner = HookRunner(
+            global_hooks=hook_settings['on_complete'],
+            max_concurrent=hook_settings['max_concurrent'],
+            queue_size=hook_settings['queue_size'],
+            timeout_seconds=hook_settings['timeout_ms'] / 1000.0
+        )
+        self.timer_manager.set_hook_runner(self.hook_runner)
+
+    def _init_completion_log(self):
+        """Open the completion log and the live usage aggregates fed by it."""
+        try:
+            self.completion_log = CompletionLog()
+            self.timer_manager.set_completion_log(self.completion_log)
+        except Exception as e:
+            print(f"Warning: Could not open completion log: {e}")
+            return
+
+        try:
+            self.usage_stats = UsageAggregates()
+            self.usage_stats.catch_up(self.completion_log)
+            self.completion_log.add_listener(self.usage_stats.record)
+            # Checkpoint once a minute if anything changed
+            self.usage_checkpoint_id = GLib.timeout_add_seconds(
+                60, self._checkpoint_usage_stats
+            )
+        except Exception as e:
+            print(f"Warning: Could not load usage stats: {e}")
+            self.usage_stats = None
+
+    def _checkpoint_usage_stats(self):
+        """Write the usage aggregates to disk.
+
+        Returns:
+            True to continue the timeout callback
+        """
+        self.usage_stats.checkpoint()
+        return True
+
+    def _init_dbus_service(self):
+        """Initialize the DBus service for CLI communication."""
+        try:
+            from timer_app.dbus_service import TimerAppDBusService
+            self.dbus_service = TimerAppDBusService(self, self.settings['signals'])
+            print("DBus service initialized - CLI support enabled")
+        except Exception as e:
+            print(f"Warning: Could not initialize DBus service: {e}")
+            print("CLI support will only be available through the control socket")
+
+    def _init_rpc_server(self):
+        """Serve the control socket used by the CLI without DBus."""
+        try:
+            from timer_app.rpc import RpcServer
+            self.rpc_server = RpcServer(self.control)
+            self.rpc_server.start()
+        except Exception as e:
+            self.rpc_server = None
+            print(f"Warning: Could not start control socket: {e}")
+
+    def _init_snapshot_publisher(self):
+        """Publish the timers in a memory-mapped file for IPC-free readers."""
+        try:
+            from timer_app.snapshot import SnapshotPublisher
+            self.snapshot_publisher = SnapshotPublisher(self.timer_manager)
+            self.snapshot_publisher.start()
+        except Exception as e:
+            self.snapshot_publisher = None
+            print(f"Warning: Could not publish timer snapshot: {e}")
+
+    def _init_completion_cache(self):
+        """Keep the shell completion cache in sync with timers, presets and history."""
+        from timer_app.shell_completion import CompletionCache
+
+        self.completion_cache = CompletionCache(self)
+        self.timer_manager.add_event_callback(
+            lambda event, timer: self.completion_cache.invalidate()
+        )
+        self.completion_cache.write()
+
+    def import_records(self, records):
+        """Import a batch of timers, presets and history titles.
+
+        Args:
+            records: List of (kind, title, seconds) tuples where kind is
+                "timer", "preset" or "history"
+
+        Returns:
+            Number of records imported
+        """
+        imported = 0
+        presets = []
+        history = []
+
+        for kind, title, seconds in records:
+            title = title.strip()
+            if not title:
+                continue
+            try:
+                if kind == 'timer':
+                    self.timer_manager.add_timer(title, 0, 0, seconds)
+                    history.append(title)
+                elif kind == 'preset':
+                    if seconds < 1:
+                        continue
+                    presets.append({
+                        "title": title,
+                        "hours": seconds // 3600,
+                        "minutes": (seconds % 3600) // 60,
+                        "seconds": seconds % 60
+                    })
+                elif kind == 'history':
+                    history.append(title)
+                else:
+                    continue
+                imported += 1
+            except Exception as e:
+                print(f"Error importing {kind} '{title}': {e}")
+
+        if presets:
+            self.on_presets_updated(self.timer_presets.add_presets(presets))
+        if history:
+            self.timer_history.add_titles(history)
+            if self.completion_cache:
+                self.completion_cache.invalidate()
+
+        return imported
+
+    def show_timers(self):
+        """Bring up the active timers window, if there is one.
+
+        Returns:
+            False, the engine has no window
+        """
+        return False
+
+    def on_presets_updated(self, diff):
+        """Called after presets were imported or reloaded from disk.
+
+        Args:
+            diff: Change description from TimerPresets.add_presets() or
+                TimerPresets.reload_if_changed()
+        """
+        if self.completion_cache:
+            self.completion_cache.invalidate()
+
+    def shutdown(self):
+        """Stop the endpoints, timers and workers and flush state to disk."""
+        if self.dbus_service:
+            self.dbus_service.stop_signals()
+        if self.rpc_server:
+            self.rpc_server.stop()
+        if self.completion_cache:
+            self.completion_cache.stop()
+        if self.snapshot_publisher:
+            self.snapshot_publisher.stop()
+        if self.metrics_server:
+            self.metrics_server.stop()
+
+        self.timer_manager.shutdown()
+        self.notification_handler.shutdown()
+        self.hook_runner.shutdown()
+        if self.usage_checkpoint_id:
+            GLib.source_remove(self.usage_checkpoint_id)
+            self.usage_checkpoint_id = None
+        if self.usage_stats:
+            self.usage_stats.checkpoint()
+        if self.completion_log:
+            self.completion_log.close()
@@ -0,0 +1,177 @@
+import math
+import time
+from datetime import datetime
+from timer_app.utils import format_time
+
+
+class TimerDashboard:
+    """Terminal view of the active timers that redraws only changed lines.
+
+    Timers are kept as (title, deadline, paused remaining) keyed by id,
+    with the deadline as a Unix timestamp, so countdowns are computed
+    locally on every render. The previous frame is remembered line by
+    line and only lines whose text differs are rewritten with ANSI
+    cursor positioning.
+    """
+
+    def __init__(self, out, height=24, width=80):
+        """Initialize the dashboard.
+
+        Args:
+            out: Writable text stream connected to a terminal
+            height: Number of terminal rows available
+            width: Number of terminal columns available
+        """
+        self.out = out
+        self.height = height
+        self.width = width
+        self.timers = {}  # id -> (title, deadline, seconds left if paused else None)
+        self.pinned_id = ''
+        self.status = ''
+        self.order = None  # Ids sorted by deadline, rebuilt when timers change
+        self.frame = []  # Lines currently on screen
+
+    def open(self):
+        """Switch to the alternate screen and hide the cursor."""
+        self.out.write('\x1b[?1049h\x1b[?25l\x1b[2J')
+        self.out.flush()
+
+    def close(self):
+        """Restore the normal screen and cursor."""
+        self.out.write('\x1b[?25h\x1b[?1049l')
+        self.out.flush()
+
+    def resize(self, height, width):
+        """Change the terminal size and force a full redraw.
+
+        Args:
+            height: Number of terminal rows available
+            width: Number of terminal columns available
+        """
+        self.height = height
+        self.width = width
+        self.frame = []
+        self.out.write('\x1b[2J')
+
+    def set_status(self, status):
+        """Set a status message shown in the header instead of the clock.
+
+        Args:
+            status: Message text, or '' to show the clock again
+        """
+        self.status = status
+
+    def set_snapshot(self, timers, pinned_id=''):
+        """Replace all timers.
+
+        Args:
+            timers: Iterable of (id, title, deadline, paused)
+            pinned_id: ID of the pinned timer, or '' if none
+        """
+        self.timers = {}
+        for timer_id, title, deadline, paused in timers:
+            self.add(timer_id, title, deadline, paused)
+        self.pinned_id = pinned_id
+        self.order = None
+
+    def add(self, timer_id, title, deadline, paused=False):
+        """Add or update a timer.
+
+        Args:
+            timer_id: Timer ID
+            title: Timer title
+            deadline: Completion time as a Unix timestamp. For a paused
+                timer, when it would complete if resumed now.
+            paused: Whether the countdown is paused
+        """
+        remaining = max(0.0, deadline - time.time()) if paused else None
+        self.timers[timer_id] = (title, deadline, remaining)
+        self.order = None
+
+    def remove(self, timer_id):
+        """Remove a timer if present.
+
+        Args:
+            timer_id: Timer ID
+        """
+        if self.timers.pop(timer_id, None) is not None:
+            self.order = None
+
+    def set_pinned(self, timer_id):
+        """Mark the pinned timer.
+
+        Args:
+            timer_id: ID of the pinned timer, or '' if none
+        """
+        self.pinned_id = timer_id
+
+    def _lines(self, now):
+        """Build the text of every line on screen.
+
+        Args:
+            now: Current Unix time
+
+        Returns:
+            List of strings, at most height long
+        """
+        if self.order is None:
+            # Running timers by deadline, then paused ones by time left
+            def sort_key(timer_id):
+                _, deadline, paused_remaining = self.timers[timer_id]
+                if paused_remaining is None:
+                    return (False, deadline)
+                return (True, paused_remaining)
+
+            self.order = sorted(self.timers, key=sort_key)
+
+        header = self.status or datetime.fromtimestamp(now).strftime('%H:%M:%S')
+        lines = [
+            f"Multi-Timer: {len(self.timers)} active  ({header})",
+            '-' * min(self.width, 50),
+        ]
+
+        rows = max(0, self.height - len(lines))
+        visible = self.order
+        if len(visible) > rows:
+            visible = visible[:max(0, rows - 1)]
+
+        for timer_id in visible:
+            title, deadline, paused_remaining = self.timers[timer_id]
+            if paused_remaining is None:
+                remaining = max(0, math.ceil(deadline - now))
+                state = ''
+            else:
+                remaining = math.ceil(paused_remaining)
+                state = ' (paused)'
+            marker = '*' if timer_id == self.pinned_id else ' '
+            lines.append(f"{marker} {format_time(remaining)}  {title}{state}")
+
+        hidden = len(self.order) - len(visible)
+        if hidden:
+            lines.append(f"  ... and {hidden} more")
+
+        return [line[:self.width] for line in lines]
+
+    def render(self, now=None):
+        """Redraw the lines that changed since the last render.
+
+        Args:
+            now: Current Unix time (defaults to time.time())
+
+        Returns:
+            Number of lines written
+        """
+        lines = self._lines(time.time() if now is None else now)
+
+        parts = []
+        for row, line in enumerate(lines):
+            if row >= len(self.frame) or self.frame[row] != line:
+                parts.append(f"\x1b[{row + 1};1H{line}\x1b[K")
+        for row in range(len(lines), len(self.frame)):
+            parts.append(f"\x1b[{row + 1};1H\x1b[K")
+
+        self.frame = lines
+        if parts:
+            self.out.write(''.join(parts))
+            self.out.flush()
+        return len(parts)
@@ -1,18 +1,25 @@
 import dbus
 import dbus.service
 import dbus.mainloop.glib
+from gi.repository import GLib
+from timer_app.control import ControlError
+from timer_app.admission import AdmissionError
+from timer_app.locks import create_lock
+from timer_app.metrics import timed
 
 
 class TimerAppDBusService(dbus.service.Object):
     """DBus service for the timer application."""
 
-    def __init__(self, timer_app):
+    def __init__(self, timer_app, settings):
         """Initialize the DBus service.
 
         Args:
             timer_app: The main TimerApp instance
+            settings: The "signals" settings section
         """
         self.timer_app = timer_app
+        self.control = timer_app.control
 
         # Set up DBus
         dbus.mainloop.glib.DBusGMainLoop(set_as_default=True)
@@ -24,12 +31,30 @@ class TimerAppDBusService(dbus.service.Object):
 
         super().__init__(bus_name, '/com/github/MultiTimerApp')
 
+        # Lifecycle signals are collected here and emitted in batches
+        self.batch_ms = max(1, int(settings['batch_ms']))
+        self.pending_lock = create_lock('dbus_signals')
+        self.pending = {'added': [], 'deleted': [], 'completed': [], 'changed': []}
+        self.pin_dirty = False
+        self.flush_source_id = None
+
+        manager = timer_app.timer_manager
+        manager.add_event_callback(self._on_timer_event)
+        manager.add_pin_change_callback(self._on_pin_changed)
+
+        self.tick_source_id = None
+        if settings['tick_seconds'] > 0:
+            self.tick_source_id = GLib.timeout_add_seconds(
+                max(1, int(settings['tick_seconds'])), self._emit_tick
+            )
+
     @dbus.service.method(
         'com.github.MultiTimerApp',
         in_signature='siii',
-        out_signature='b'
+        out_signature='b',
+        sender_keyword='sender'
     )
-    def AddTimer(self, title, hours, minutes, seconds):
+    def AddTimer(self, title, hours, minutes, seconds, sender=None):
         """Add a timer via DBus.
 
         Args:
@@ -37,21 +62,91 @@ class TimerAppDBusService(dbus.service.Object):
             hours: Hours component
             minutes: Minutes component
             seconds: Seconds component
+            sender: Unique bus name of the caller
 
         Returns:
             True if successful, False otherwise
+
+        Raises:
+            DBusException: TooManyTimers or RateLimited if admission
+                control refused the timer
         """
         try:
-            self.timer_app.timer_manager.add_timer(
-                title, hours, minutes, seconds
+            self.control.add_timer(
+                title, hours, minutes, seconds, client=self._client_id(sender)
             )
-            # Save to history
-            self.timer_app.timer_history.add_title(title)
             return True
+        except AdmissionError as e:
+            raise self._dbus_error(e)
         except Exception as e:
             print(f"Error adding timer via DBus: {e}")
             return False
 
+    @dbus.service.method(
+        'com.github.MultiTimerApp',
+        in_signature='siiia{sv}',
+        out_signature='s',
+        sender_keyword='sender'
+    )
+    def AddTimerWithOptions(self, title, hours, minutes, seconds, options, sender=None):
+        """Add a timer with extra options via DBus.
+
+        Args:
+            title: Timer title
+            hours: Hours component
+            minutes: Minutes component
+            seconds: Seconds component
+            options: Dictionary of options. Supported keys:
+                warnings (ai): seconds before completion to send pre-warnings
+                hooks (as): commands or URLs to run when the timer completes
+            sender: Unique bus name of the caller
+
+        Returns:
+            ID of the new timer, or an empty string on failure
+
+        Raises:
+            DBusException: TooManyTimers or RateLimited if admission
+                control refused the timer
+        """
+        try:
+            return self.control.add_timer(
+                title, hours, minutes, seconds, options, client=self._client_id(sender)
+            )
+        except AdmissionError as e:
+            raise self._dbus_error(e)
+        except Exception as e:
+            print(f"Error adding timer via DBus: {e}")
+            return ''
+
+    @dbus.service.method(
+        'com.github.MultiTimerApp',
+        in_signature='a(ssi)',
+        out_signature='i',
+        sender_keyword='sender'
+    )
+    def ImportRecords(self, records, sender=None):
+        """Import a batch of timers, presets and history titles.
+
+        Args:
+            records: List of (kind, title, seconds) where kind is "timer",
+                "preset" or "history"
+            sender: Unique bus name of the caller
+
+        Returns:
+            Number of records imported
+
+        Raises:
+            DBusException: TooManyTimers or RateLimited if admission
+                control refused the batch
+        """
+        try:
+            return self.control.import_records(records, client=self._client_id(sender))
+        except AdmissionError as e:
+            raise self._dbus_error(e)
+        except Exception as e:
+            print(f"Error importing records via DBus: {e}")
+            return 0
+
     @dbus.service.method(
         'com.github.MultiTimerApp',
         in_signature='',
@@ -64,21 +159,90 @@ class TimerAppDBusService(dbus.service.Object):
             List of tuples (id, title, remaining_time_formatted, remaining_seconds)
         """
         try:
-            from timer_app.utils import format_time
-            timers = self.timer_app.timer_manager.get_all_timers()
-            result = []
-            for timer in timers:
-                result.append((
-                    str(timer.timer_id),
-                    timer.title,
-                    format_time(timer.remaining_seconds),
-                    timer.remaining_seconds
-                ))
-            return result
+            return self.control.get_timers()
         except Exception as e:
             print(f"Error getting timers via DBus: {e}")
             return []
 
+    @dbus.service.method(
+        'com.github.MultiTimerApp',
+        in_signature='ssiias',
+        out_signature='iaa{sv}'
+    )
+    def QueryTimers(self, title_filter, sort_key, limit, offset, fields):
+        """Query active timers with filtering, sorting, paging and projection.
+
+        Deadlines are returned as Unix timestamps so clients can compute and
+        format the remaining time themselves.
+
+        Args:
+            title_filter: Case-insensitive substring or glob ('' for all)
+            sort_key: "deadline", "title" or "created", "-" prefix for descending
+            limit: Maximum number of timers to return (0 for no limit)
+            offset: Number of matching timers to skip
+            fields: Field names to return (empty for all): id, title,
+                deadline, total_seconds, created_at, pinned, paused
+
+        Returns:
+            Tuple of (total matching timers, list of field dictionaries)
+        """
+        total, rows = self._call(
+            self.control.query_timers, title_filter, sort_key, limit, offset, fields
+        )
+        return total, dbus.Array(rows, signature='a{sv}')
+
+    @dbus.service.method(
+        'com.github.MultiTimerApp',
+        in_signature='sias',
+        out_signature='saa{sv}'
+    )
+    def ListTimers(self, after, limit, fields):
+        """Page through active timers in creation order.
+
+        Unlike QueryTimers with an offset, each page continues after the
+        last timer of the previous one, so timers removed in between don't
+        cause others to be skipped.
+
+        Args:
+            after: Cursor returned by the previous call ('' to start)
+            limit: Maximum number of timers to return
+            fields: Field names to return (empty for all), as for QueryTimers
+
+        Returns:
+            Tuple of (cursor for the next call, list of field dictionaries)
+        """
+        cursor, rows = self._call(self.control.list_timers, after, limit, fields)
+        return cursor, dbus.Array(rows, signature='a{sv}')
+
+    @dbus.service.method(
+        'com.github.MultiTimerApp',
+        in_signature='t',
+        out_signature='tbaa{sv}ass'
+    )
+    def GetChangesSince(self, version):
+        """Get the timers added, changed and removed since a version.
+
+        Clients keep the returned version and pass it on the next call, so
+        an unchanged timer set costs an empty reply. When the server's
+        change log no longer reaches back to the version, full is True and
+        upserts holds every active timer.
+
+        Args:
+            version: Version from the previous call (0 for none)
+
+        Returns:
+            Tuple of (version, full, upserts, removed_ids, pinned_id). Each
+            upsert has the same fields as QueryTimers returns.
+        """
+        current, full, rows, removed, pinned_id = self.control.get_changes_since(version)
+        return (
+            dbus.UInt64(current),
+            full,
+            dbus.Array(rows, signature='a{sv}'),
+            dbus.Array(removed, signature='s'),
+            pinned_id
+        )
+
     @dbus.service.method(
         'com.github.MultiTimerApp',
         in_signature='s',
@@ -94,8 +258,328 @@ class TimerAppDBusService(dbus.service.Object):
             True if successful, False otherwise
         """
         try:
-            self.timer_app.timer_manager.delete_timer(timer_id)
+            self.control.delete_timer(timer_id)
             return True
         except Exception as e:
             print(f"Error deleting timer via DBus: {e}")
             return False
+
+    @dbus.service.method(
+        'com.github.MultiTimerApp',
+        in_signature='ss',
+        out_signature='aa{sv}'
+    )
+    def GetTimerByTitle(self, pattern, match):
+        """Get the timers whose title matches, soonest first.
+
+        Args:
+            pattern: Title, title prefix or glob pattern (case-insensitive)
+            match: "exact", "prefix" or "glob"
+
+        Returns:
+            List of field dictionaries as returned by QueryTimers
+        """
+        rows = self._call(self.control.get_timer_by_title, pattern, match)
+        return dbus.Array(rows, signature='a{sv}')
+
+    @dbus.service.method(
+        'com.github.MultiTimerApp',
+        in_signature='ss',
+        out_signature='i'
+    )
+    def DeleteTimerByTitle(self, pattern, match):
+        """Delete the timers whose title matches.
+
+        Args:
+            pattern: Title, title prefix or glob pattern (case-insensitive)
+            match: "exact" (the soonest timer with the title), "all",
+                "prefix" or "glob"
+
+        Returns:
+            Number of timers deleted
+        """
+        return self._call(self.control.delete_timer_by_title, pattern, match)
+
+    @dbus.service.method(
+        'com.github.MultiTimerApp',
+        in_signature='ssb',
+        out_signature='i'
+    )
+    def PauseTimerByTitle(self, pattern, match, paused):
+        """Pause or resume the timers whose title matches.
+
+        Args:
+            pattern: Title, title prefix or glob pattern (case-insensitive)
+            match: "exact", "prefix" or "glob"
+            paused: True to pause, False to resume
+
+        Returns:
+            Number of timers whose state changed
+        """
+        return self._call(self.control.pause_timer_by_title, pattern, match, paused)
+
+    @dbus.service.method(
+        'com.github.MultiTimerApp',
+        in_signature='s',
+        out_signature='a(siidd)'
+    )
+    def GetUsageStats(self, group_by):
+        """Get the live usage aggregates.
+
+        Args:
+            group_by: "title" or "day"
+
+        Returns:
+            List of tuples (key, completed, cancelled, total_seconds, avg_overrun)
+        """
+        try:
+            return self.control.get_usage_stats(group_by)
+        except Exception as e:
+            print(f"Error getting usage stats via DBus: {e}")
+            return []
+
+    @dbus.service.method(
+        'com.github.MultiTimerApp',
+        in_signature='',
+        out_signature='b'
+    )
+    def ShowTimers(self):
+        """Bring up the active timers window.
+
+        Returns:
+            True if the app has a window to show
+        """
+        try:
+            return self.control.show_timers()
+        except Exception as e:
+            print(f"Error showing timers via DBus: {e}")
+            return False
+
+    @dbus.service.method(
+        'com.github.MultiTimerApp',
+        in_signature='',
+        out_signature='a{sa{sd}}'
+    )
+    def GetStats(self):
+        """Get the internal counters of the engine's components.
+
+        Returns:
+            Dictionary of component name -> dictionary of counters
+        """
+        stats = self.control.get_stats()
+        return {
+            component: {name: float(value) for name, value in values.items()}
+            for component, values in stats.items()
+        }
+
+    @dbus.service.method(
+        'com.github.MultiTimerApp',
+        in_signature='',
+        out_signature='a{sd}'
+    )
+    def GetMetrics(self):
+        """Get the current value of every runtime metric.
+
+        Histograms are flattened into their _bucket, _sum and _count
+        samples, keyed as in the Prometheus text format.
+
+        Returns:
+            Dictionary of 'name{label="value",...}' -> value
+        """
+        return self.control.get_metrics()
+
+    def _call(self, func, *args):
+        """Call a control method, turning its errors into DBus errors.
+
+        Args:
+            func: TimerControl method
+            *args: Arguments for func
+
+        Returns:
+            The method's result
+
+        Raises:
+            DBusException: Named com.github.MultiTimerApp.Error.<name>
+        """
+        try:
+            return func(*args)
+        except ControlError as e:
+            raise self._dbus_error(e)
+
+    def _client_id(self, sender):
+        """Identify the calling user for rate limiting.
+
+        Every timer-cli call has its own unique bus name, so callers are
+        identified by their Unix user instead, which a loop of separate
+        calls can't escape.
+
+        Args:
+            sender: Unique bus name of the caller
+
+        Returns:
+            "uid:<uid>", or the bus name if the bus can't tell the user
+        """
+        try:
+            return f"uid:{self.connection.get_unix_user(sender)}"
+        except Exception:
+            return sender
+
+    def _dbus_error(self, error):
+        """Convert a control error into a DBus error.
+
+        Args:
+            error: ControlError
+
+        Returns:
+            DBusException named com.github.MultiTimerApp.Error.<name>
+        """
+        return dbus.exceptions.DBusException(
+            str(error), name=f'com.github.MultiTimerApp.Error.{error.name}'
+        )
+
+    @dbus.service.signal('com.github.MultiTimerApp', signature='a(ssd)')
+    def TimerAdded(self, timers):
+        """Emitted for timers added since the last batch.
+
+        Args:
+            timers: List of tuples (id, title, deadline as Unix time)
+        """
+
+    @dbus.service.signal('com.github.MultiTimerApp', signature='a(ss)')
+    def TimerDeleted(self, timers):
+        """Emitted for timers deleted since the last batch.
+
+        Args:
+            timers: List of tuples (id, title)
+        """
+
+    @dbus.service.signal('com.github.MultiTimerApp', signature='a(ss)')
+    def TimerCompleted(self, timers):
+        """Emitted for timers completed since the last batch.
+
+        Args:
+            timers: List of tuples (id, title)
+        """
+
+    @dbus.service.signal('com.github.MultiTimerApp', signature='a(ssdb)')
+    def TimerChanged(self, timers):
+        """Emitted for timers paused or resumed since the last batch.
+
+        Args:
+            timers: List of tuples (id, title, deadline as Unix time, paused).
+                The deadline of a paused timer is where it would end if
+                resumed at the time of the signal.
+        """
+
+    @dbus.service.signal('com.github.MultiTimerApp', signature='s')
+    def PinChanged(self, timer_id):
+        """Emitted once per batch when the pinned timer changed.
+
+        Args:
+            timer_id: ID of the pinned timer, or '' if none
+        """
+
+    @dbus.service.signal('com.github.MultiTimerApp', signature='isd')
+    def Tick(self, active, pinned_id, pinned_deadline):
+        """Emitted every tick_seconds while timers are active.
+
+        Args:
+            active: Number of active timers
+            pinned_id: ID of the pinned timer, or '' if none
+            pinned_deadline: Deadline of the pinned timer as Unix time (0 if none)
+        """
+
+    def _on_timer_event(self, event, timer):
+        """Queue a lifecycle signal. Called from any thread.
+
+        Args:
+            event: "added", "deleted", "completed", "paused" or "resumed"
+            timer: The Timer object the event is about
+        """
+        if event == 'added':
+            entry = (timer.id, timer.title, timer.deadline_epoch)
+        elif event in ('paused', 'resumed'):
+            event = 'changed'
+            entry = (timer.id, timer.title, timer.deadline_epoch, timer.is_paused)
+        else:
+            entry = (timer.id, timer.title)
+
+        with self.pending_lock:
+            self.pending[event].append(entry)
+            self._schedule_flush_locked()
+
+    def _on_pin_changed(self):
+        """Queue a PinChanged signal.
+
+        Returns:
+            False so GLib.idle_add doesn't call it again
+        """
+        with self.pending_lock:
+            self.pin_dirty = True
+            self._schedule_flush_locked()
+        return False
+
+    def _schedule_flush_locked(self):
+        """Schedule a flush of the pending signals if none is scheduled.
+
+        Should only be called with pending_lock held.
+        """
+        if self.flush_source_id is None:
+            self.flush_source_id = GLib.timeout_add(self.batch_ms, self._flush_signals)
+
+    @timed('dbus_signals')
+    def _flush_signals(self):
+        """Emit the pending signals, one per kind. Runs on the main loop.
+
+        Returns:
+            False so the timeout doesn't repeat
+        """
+        with self.pending_lock:
+            pending = self.pending
+            pin_dirty = self.pin_dirty
+            self.pending = {'added': [], 'deleted': [], 'completed': [], 'changed': []}
+            self.pin_dirty = False
+            self.flush_source_id = None
+
+        try:
+            if pending['added']:
+                self.TimerAdded(dbus.Array(pending['added'], signature='(ssd)'))
+            if pending['completed']:
+                self.TimerCompleted(dbus.Array(pending['completed'], signature='(ss)'))
+            if pending['deleted']:
+                self.TimerDeleted(dbus.Array(pending['deleted'], signature='(ss)'))
+            if pending['changed']:
+                self.TimerChanged(dbus.Array(pending['changed'], signature='(ssdb)'))
+            if pin_dirty:
+                self.PinChanged(self.timer_app.timer_manager.get_pinned_timer_id() or '')
+        except Exception as e:
+            print(f"Warning: Could not emit DBus signals: {e}")
+        return False
+
+    @timed('dbus_tick')
+    def _emit_tick(self):
+        """Emit the Tick signal if any timers are active.
+
+        Returns:
+            True to keep the timeout running
+        """
+        manager = self.timer_app.timer_manager
+        timers = manager.get_all_timers()
+        if timers:
+            pinned = manager.get_pinned_timer()
+            self.Tick(
+                len(timers),
+                pinned.id if pinned else '',
+                pinned.deadline_epoch if pinned else 0.0
+            )
+        return True
+
+    def stop_signals(self):
+        """Stop the tick and drop any signals not yet emitted."""
+        with self.pending_lock:
+            if self.flush_source_id is not None:
+                GLib.source_remove(self.flush_source_id)
+                self.flush_source_id = None
+        if self.tick_source_id is not None:
+            GLib.source_remove(self.tick_source_id)
+            self.tick_source_id = None
@@ -0,0 +1,183 @@
+import time
+import queue
+import threading
+from timer_app.metrics import REGISTRY
+
+
+class DispatchQueue:
+    """Bounded queue of jobs run on a background worker thread.
+
+    Used to keep slow desktop services (the notification daemon, DBus)
+    off the GTK main thread. submit() never blocks: when the queue is full
+    it returns False and the caller takes its fallback path. A job that
+    runs longer than its timeout can't be killed, so the worker running it
+    is abandoned and a fresh worker takes over the rest of the queue.
+    """
+
+    def __init__(self, name, max_size=256, timeout_seconds=2.0):
+        """Initialize and start the dispatch queue.
+
+        Args:
+            name: Name used for the worker threads and in log messages
+            max_size: Maximum number of queued jobs
+            timeout_seconds: How long a job may run before its worker is replaced
+        """
+        self.name = name
+        self.timeout_seconds = timeout_seconds
+        self.jobs = queue.Queue(maxsize=max_size)
+
+        self.lock = threading.Lock()
+        self.job_started = threading.Condition(self.lock)
+        self.generation = 0  # Bumped whenever the worker is replaced
+        self.current_started = None  # Monotonic start time of the running job
+        self.current_label = None
+        labels = {'queue': name}
+        self.wait_histogram = REGISTRY.histogram(
+            'multi_timer_dispatch_wait_seconds',
+            'Time dispatch jobs waited in the queue', labels=labels
+        )
+        self.run_histogram = REGISTRY.histogram(
+            'multi_timer_dispatch_run_seconds',
+            'Time dispatch jobs took to run', labels=labels
+        )
+        self.stats = {
+            'submitted': 0,
+            'completed': 0,
+            'failed': 0,
+            'rejected': 0,  # Queue full, caller used its fallback
+            'timed_out': 0,
+            'last_wait': 0.0,  # Seconds a job waited in the queue
+            'max_wait': 0.0,
+            'total_wait': 0.0,
+            'max_run': 0.0,
+        }
+
+        self._start_worker()
+        self.watchdog = threading.Thread(
+            target=self._watch, name=f"{name}-watchdog", daemon=True
+        )
+        self.watchdog.start()
+
+    def _start_worker(self):
+        """Start a worker thread for the current generation."""
+        generation = self.generation
+        worker = threading.Thread(
+            target=self._run, args=(generation,),
+            name=f"{self.name}-{generation}", daemon=True
+        )
+        worker.start()
+
+    def submit(self, label, func, *args):
+        """Queue a job without blocking.
+
+        Args:
+            label: Short description used in timeout messages
+            func: Function to run on the worker
+            *args: Arguments for func
+
+        Returns:
+            True if queued, False if the queue is full
+        """
+        try:
+            self.jobs.put_nowait((time.monotonic(), label, func, args))
+        except queue.Full:
+            with self.lock:
+                self.stats['rejected'] += 1
+            return False
+
+        with self.lock:
+            self.stats['submitted'] += 1
+        return True
+
+    def _watch(self):
+        """Watchdog loop: replace the worker when a job exceeds its timeout.
+
+        Sleeps on a condition while no job is running, so it costs nothing
+        when idle.
+        """
+        while True:
+            with self.lock:
+                while self.current_started is None:
+                    self.job_started.wait()
+
+                remaining = self.current_started + self.timeout_seconds - time.monotonic()
+                if remaining > 0:
+                    self.job_started.wait(remaining)
+                    continue
+
+                label = self.current_label
+                self.stats['timed_out'] += 1
+                self.generation += 1
+                self.current_started = None
+                self.current_label = None
+
+            print(f"Warning: {self.name} job '{label}' timed out, starting a new worker")
+            self._start_worker()
+
+    def _run(self, generation):
+        """Worker loop: run jobs until this worker is replaced.
+
+        Args:
+            generation: Generation this worker belongs to
+        """
+        while True:
+            item = self.jobs.get()
+            if item is None:
+                return
+
+            queued_at, label, func, args = item
+            with self.lock:
+                if generation != self.generation:
+                    # Replaced while waiting; hand the job to the new worker
+                    try:
+                        self.jobs.put_nowait(item)
+                    except queue.Full:
+                        self.stats['rejected'] += 1
+                    return
+                started = time.monotonic()
+                wait = started - queued_at
+                self.current_started = started
+                self.current_label = label
+                self.job_started.notify()
+                self.stats['last_wait'] = wait
+                self.stats['total_wait'] += wait
+                self.stats['max_wait'] = max(self.stats['max_wait'], wait)
+            self.wait_histogram.observe(wait)
+
+            ok = True
+            try:
+                func(*args)
+            except Exception as e:
+                ok = False
+                print(f"Error in {self.name} job '{label}': {e}")
+
+            with self.lock:
+                if generation != self.generation:
+                    # Timed out and replaced; the new worker owns the queue
+                    return
+                run = time.monotonic() - started
+                self.current_started = None
+                self.current_label = None
+                self.stats['completed' if ok else 'failed'] += 1
+                self.stats['max_run'] = max(self.stats['max_run'], run)
+            self.run_histogram.observe(run)
+
+    def get_stats(self):
+        """Get dispatch statistics.
+
+        Returns:
+            Dictionary of counters plus queue_depth and avg_wait
+        """
+        with self.lock:
+            stats = dict(self.stats)
+        done = stats['completed'] + stats['failed']
+        stats['queue_depth'] = self.jobs.qsize()
+        stats['avg_wait'] = stats['total_wait'] / done if done else 0.0
+        return stats
+
+    def stop(self):
+        """Ask the worker to exit once the queued jobs are done."""
+        try:
+            self.jobs.put_nowait(None)
+        except queue.Full:
+            pass
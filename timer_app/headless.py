@@ -0,0 +1,40 @@
+import signal
+import gi
+gi.require_version('GLib', '2.0')
+from gi.repository import GLib
+from timer_app.core import TimerCore
+
+
+class HeadlessTimerApp(TimerCore):
+    """Timer engine on a plain GLib main loop, without GTK or a tray icon.
+
+    Timers are controlled through the control socket or DBus (when a
+    session bus exists); completions still produce notifications, sounds,
+    hooks and completion log entries.
+    """
+
+    def __init__(self):
+        """Initialize the engine and its control endpoints."""
+        super().__init__()
+        self.loop = GLib.MainLoop()
+        self.start_services()
+
+    def run(self):
+        """Run the main loop until SIGINT or SIGTERM."""
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            GLib.unix_signal_add(GLib.PRIORITY_DEFAULT, signum, self._on_signal)
+        self.loop.run()
+
+    def _on_signal(self):
+        """Shut down on a termination signal.
+
+        Returns:
+            False to remove the signal handler
+        """
+        self.quit()
+        return False
+
+    def quit(self):
+        """Stop the engine and leave the main loop."""
+        self.shutdown()
+        self.loop.quit()
@@ -0,0 +1,256 @@
+import os
+import json
+import time
+import queue
+import shlex
+import signal
+import threading
+import subprocess
+import urllib.request
+from datetime import datetime
+from pathlib import Path
+
+
+class HookRunner:
+    """Runs user completion hooks on a bounded pool of worker threads.
+
+    A hook is either a command line (run without a shell, with the timer
+    passed in TIMER_* environment variables) or an http(s) URL that gets a
+    JSON POST. At most max_concurrent hooks run at once, each is killed
+    together with any processes it started after its timeout, and their
+    output is appended to a log file. When
+    the queue is full new hooks are dropped and counted instead of piling
+    up, so a burst of completions can never fork without bound or block
+    the caller.
+    """
+
+    def __init__(self, global_hooks=None, max_concurrent=4, queue_size=64,
+                 timeout_seconds=30.0, log_path=None):
+        """Initialize the hook runner and start its workers.
+
+        Args:
+            global_hooks: Hooks run for every completed timer
+            max_concurrent: Number of hooks that may run at the same time
+            queue_size: Hooks allowed to wait before new ones are dropped
+            timeout_seconds: Time limit for a single hook
+            log_path: File receiving hook output (defaults to hooks.log in
+                the config dir)
+        """
+        if log_path is None:
+            log_path = Path.home() / '.config' / 'multi-timer-app' / 'hooks.log'
+
+        self.global_hooks = list(global_hooks or [])
+        self.timeout_seconds = timeout_seconds
+        self.log_path = Path(log_path)
+        self.jobs = queue.Queue(maxsize=queue_size)
+        self.log_lock = threading.Lock()
+
+        self.stats_lock = threading.Lock()
+        self.stats = {
+            'queued': 0,
+            'succeeded': 0,
+            'failed': 0,
+            'timed_out': 0,
+            'dropped': 0,
+        }
+        self.unlogged_drops = 0
+
+        self.workers = []
+        for i in range(max(1, max_concurrent)):
+            worker = threading.Thread(target=self._run, name=f"HookWorker-{i}", daemon=True)
+            worker.start()
+            self.workers.append(worker)
+
+    def run_completion_hooks(self, timer):
+        """Queue the hooks for a completed timer. Never blocks.
+
+        Args:
+            timer: The completed Timer object
+        """
+        hooks = self.global_hooks + list(getattr(timer, 'hooks', None) or [])
+        if not hooks:
+            return
+
+        event = {
+            'event': 'completed',
+            'id': timer.id,
+            'title': timer.title,
+            'seconds': timer.total_seconds,
+            'completed_at': datetime.now().isoformat(timespec='seconds'),
+        }
+        for hook in hooks:
+            try:
+                self.jobs.put_nowait((hook, event))
+            except queue.Full:
+                # Logged later by a worker so the caller never touches the disk
+                with self.stats_lock:
+                    self.stats['dropped'] += 1
+                    self.unlogged_drops += 1
+                continue
+            self._count('queued')
+
+    def get_stats(self):
+        """Get hook statistics.
+
+        Returns:
+            Dictionary of counters plus queue_depth
+        """
+        with self.stats_lock:
+            stats = dict(self.stats)
+        stats['queue_depth'] = self.jobs.qsize()
+        return stats
+
+    def shutdown(self):
+        """Ask the workers to exit once the queued hooks have run."""
+        for _ in self.workers:
+            try:
+                self.jobs.put_nowait(None)
+            except queue.Full:
+                break
+
+    def _count(self, key):
+        """Increment a statistics counter.
+
+        Args:
+            key: Counter name
+        """
+        with self.stats_lock:
+            self.stats[key] += 1
+
+    def _run(self):
+        """Worker loop: run hooks one at a time."""
+        while True:
+            job = self.jobs.get()
+            if job is None:
+                return
+
+            hook, event = job
+            started = time.monotonic()
+            try:
+                if hook.startswith(('http://', 'https://')):
+                    result = self._post_webhook(hook, event)
+                else:
+                    result = self._run_command(hook, event)
+                self._count('succeeded' if result.startswith('ok') else 'failed')
+            except subprocess.TimeoutExpired:
+                self._count('timed_out')
+                result = f"timed out after {self.timeout_seconds:g}s"
+            except Exception as e:
+                self._count('failed')
+                result = f"error: {e}"
+
+            message = f"{result} ({time.monotonic() - started:.2f}s)"
+            with self.stats_lock:
+                drops, self.unlogged_drops = self.unlogged_drops, 0
+            if drops:
+                message += f"\n{drops} hook(s) dropped because the queue was full"
+            self._log(hook, event, message)
+
+    def _run_command(self, hook, event):
+        """Run a command hook.
+
+        Args:
+            hook: Command line
+            event: Event dictionary
+
+        Returns:
+            Result description including the captured output
+
+        Raises:
+            subprocess.TimeoutExpired: If the command exceeded the timeout
+        """
+        env = dict(os.environ)
+        env.update({
+            'TIMER_EVENT': event['event'],
+            'TIMER_ID': event['id'],
+            'TIMER_TITLE': event['title'],
+            'TIMER_SECONDS': str(event['seconds']),
+        })
+
+        # A session of its own, so a timeout can kill everything the hook started
+        proc = subprocess.Popen(
+            shlex.split(hook),
+            env=env,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            start_new_session=True
+        )
+        deadline = time.monotonic() + self.timeout_seconds
+        while True:
+            try:
+                output, _ = proc.communicate(
+                    timeout=max(0.0, min(0.1, deadline - time.monotonic()))
+                )
+                break
+            except subprocess.TimeoutExpired:
+                if proc.poll() is not None:
+                    # The hook exited but processes it left behind still
+                    # hold its output open
+                    output = self._kill_session(proc)
+                    break
+                if time.monotonic() >= deadline:
+                    self._kill_session(proc)
+                    raise
+
+        output = output.decode('utf-8', 'replace').strip()
+        status = 'ok' if proc.returncode == 0 else f"exit {proc.returncode}"
+        return f"{status}\n{output}" if output else status
+
+    def _kill_session(self, proc):
+        """Kill a command hook and every process it started, and reap it.
+
+        Args:
+            proc: subprocess.Popen started in a new session
+
+        Returns:
+            The rest of the hook's output as bytes
+        """
+        try:
+            os.killpg(proc.pid, signal.SIGKILL)
+        except (ProcessLookupError, PermissionError):
+            pass
+        try:
+            output, _ = proc.communicate(timeout=1)
+        except subprocess.TimeoutExpired:
+            # A process that left the session still holds the pipe
+            proc.stdout.close()
+            proc.wait()
+            output = b''
+        return output
+
+    def _post_webhook(self, url, event):
+        """POST the event as JSON to a webhook URL.
+
+        Args:
+            url: Webhook URL
+            event: Event dictionary
+
+        Returns:
+            Result description
+        """
+        request = urllib.request.Request(
+            url,
+            data=json.dumps(event).encode('utf-8'),
+            headers={'Content-Type': 'application/json'},
+            method='POST'
+        )
+        with urllib.request.urlopen(request, timeout=self.timeout_seconds) as response:
+            return f"ok HTTP {response.status}"
+
+    def _log(self, hook, event, message):
+        """Append a hook result to the log file.
+
+        Args:
+            hook: The hook that ran
+            event: Event dictionary
+            message: Result text
+        """
+        stamp = datetime.now().isoformat(timespec='seconds')
+        entry = f"[{stamp}] {event['title']!r}: {hook}\n  " + message.replace('\n', '\n  ') + '\n'
+        with self.log_lock:
+            try:
+                with open(self.log_path, 'a') as f:
+                    f.write(entry)
+            except OSError as e:
+                print(f"Warning: Could not write hook log: {e}")
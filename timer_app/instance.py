@@ -0,0 +1,56 @@
+"""
+Single-instance check for the app launcher.
+
+The first instance holds an exclusive lock on a file next to the control
+socket for as long as it runs. A later launch that finds the lock taken
+forwards its request over the control socket instead of starting a
+second app. This module only uses the standard library and the socket
+client, so the check runs before GTK is imported.
+"""
+import os
+import time
+import fcntl
+
+
+def acquire_instance_lock():
+    """Try to become the running instance.
+
+    Returns:
+        Open lock file to keep for the life of the process, or None if
+        another instance holds the lock
+    """
+    from timer_app.rpc import get_socket_path
+
+    path = get_socket_path().with_name('instance.lock')
+    path.parent.mkdir(parents=True, exist_ok=True)
+    os.chmod(path.parent, 0o700)
+
+    lock_file = open(path, 'w')
+    try:
+        fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        lock_file.close()
+        return None
+    return lock_file
+
+
+def connect_to_instance(timeout=5.0):
+    """Connect to the running instance's control socket.
+
+    The instance holding the lock may still be starting, so the socket
+    is retried until it appears.
+
+    Args:
+        timeout: Seconds to wait for the socket
+
+    Returns:
+        RpcClient, or None if the socket did not become available
+    """
+    from timer_app import rpc
+
+    deadline = time.monotonic() + timeout
+    while True:
+        client = rpc.connect()
+        if client is not None or time.monotonic() >= deadline:
+            return client
+        time.sleep(0.05)
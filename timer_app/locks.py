@@ -0,0 +1,284 @@
+"""
+Locks for the engine's shared state, with a debug mode for lock bugs.
+
+Locks are normally TimedLock, which only records contention. Setting
+MULTI_TIMER_DEBUG_LOCKS=1 in the environment swaps in DebugLock, which
+also:
+
+- raises LockReentryError with a traceback when a thread acquires a
+  lock it already holds, instead of hanging forever (see
+  DEADLOCK_FIX.md)
+- records how long each lock is held, and counts holds longer than
+  MULTI_TIMER_DEBUG_LOCKS_HOLD_MS (default 50) by the code that took
+  the lock
+- warns when a thread has waited a long time for a lock, naming the code
+  that holds it
+- learns the order in which locks are nested and warns the first time
+  two locks are taken in the opposite order, which can deadlock
+
+Everything is reported through the metrics registry.
+"""
+import os
+import sys
+import time
+import threading
+import traceback
+from timer_app.metrics import REGISTRY, TimedLock
+
+DEBUG_LOCKS = os.environ.get('MULTI_TIMER_DEBUG_LOCKS', '') not in ('', '0')
+
+
+def _long_hold_seconds():
+    """Read the long hold threshold from the environment.
+
+    Returns:
+        Threshold in seconds, 0.05 if unset or invalid
+    """
+    value = os.environ.get('MULTI_TIMER_DEBUG_LOCKS_HOLD_MS', '50')
+    try:
+        return float(value) / 1000.0
+    except ValueError:
+        print(f"Warning: Invalid MULTI_TIMER_DEBUG_LOCKS_HOLD_MS '{value}', using 50")
+        return 0.05
+
+
+# Holds longer than this are counted and reported
+LONG_HOLD_SECONDS = _long_hold_seconds() if DEBUG_LOCKS else 0.05
+
+# Waits longer than this print who holds the lock
+LONG_WAIT_SECONDS = 5.0
+
+
+class LockReentryError(RuntimeError):
+    """A thread tried to acquire a non-reentrant lock it already holds."""
+
+
+def create_lock(name):
+    """Create a lock for shared state.
+
+    Args:
+        name: Short name used in metrics and reports, e.g. "timer_manager"
+
+    Returns:
+        DebugLock if MULTI_TIMER_DEBUG_LOCKS is set, otherwise TimedLock
+    """
+    if DEBUG_LOCKS:
+        return DebugLock(name)
+    return TimedLock(name)
+
+
+# Lock nesting seen so far: (outer name, inner name) -> site of the inner acquire
+_order_lock = threading.Lock()
+_order_edges = {}
+_held = threading.local()
+
+
+def _held_locks():
+    """Get the DebugLocks the current thread holds, outermost first.
+
+    Returns:
+        List of DebugLock
+    """
+    stack = getattr(_held, 'stack', None)
+    if stack is None:
+        stack = _held.stack = []
+    return stack
+
+
+def _caller_site():
+    """Describe the first frame outside this module.
+
+    Returns:
+        String "file:line in function"
+    """
+    frame = sys._getframe(1)
+    while frame is not None and frame.f_code.co_filename == __file__:
+        frame = frame.f_back
+    if frame is None:
+        return 'unknown'
+    filename = os.path.basename(frame.f_code.co_filename)
+    return f"{filename}:{frame.f_lineno} in {frame.f_code.co_name}"
+
+
+class DebugLock:
+    """A non-reentrant lock that checks how it is used.
+
+    Much slower than threading.Lock, so it is only used when
+    MULTI_TIMER_DEBUG_LOCKS is set.
+    """
+
+    def __init__(self, name):
+        """Initialize the lock.
+
+        Args:
+            name: Value of the "lock" label
+        """
+        self.name = name
+        self._lock = threading.Lock()
+        self.owner = None  # Thread ident of the holder
+        self.owner_site = None  # Where the holder acquired the lock
+        self.acquired_at = 0.0
+
+        labels = {'lock': name}
+        self.contended = REGISTRY.counter(
+            'multi_timer_lock_contended_total',
+            'Lock acquisitions that had to wait',
+            labels=labels
+        )
+        self.wait = REGISTRY.histogram(
+            'multi_timer_lock_wait_seconds',
+            'Time spent waiting for contended locks',
+            labels=labels
+        )
+        self.hold = REGISTRY.histogram(
+            'multi_timer_lock_hold_seconds',
+            'Time locks were held (debug locks only)',
+            labels=labels
+        )
+        self.reentries = REGISTRY.counter(
+            'multi_timer_lock_reentries_total',
+            'Attempts to acquire a lock already held by the same thread',
+            labels=labels
+        )
+
+    def acquire(self, blocking=True, timeout=-1):
+        """Acquire the lock.
+
+        Args:
+            blocking: Wait for the lock if it is held
+            timeout: Longest wait in seconds (-1 for no limit)
+
+        Returns:
+            True if the lock was acquired
+
+        Raises:
+            LockReentryError: If the current thread already holds the lock
+        """
+        me = threading.get_ident()
+        site = _caller_site()
+        if self.owner == me:
+            self.reentries.inc()
+            raise LockReentryError(
+                f"Lock '{self.name}' acquired again at {site} by the thread holding it "
+                f"since {self.owner_site}; this would deadlock.\n"
+                + ''.join(traceback.format_stack()[:-1])
+            )
+
+        if not self._lock.acquire(False):
+            if not blocking:
+                return False
+            if not self._wait(site, timeout):
+                return False
+
+        self.owner = me
+        self.owner_site = site
+        self.acquired_at = time.perf_counter()
+        self._check_order(site)
+        _held_locks().append(self)
+        return True
+
+    def _wait(self, site, timeout):
+        """Block until the lock is free, reporting long waits.
+
+        Args:
+            site: Where the lock is being acquired
+            timeout: Longest wait in seconds (-1 for no limit)
+
+        Returns:
+            True if the lock was acquired
+        """
+        started = time.perf_counter()
+        warned = False
+        acquired = False
+        while True:
+            waited = time.perf_counter() - started
+            if timeout >= 0:
+                remaining = timeout - waited
+                if remaining <= 0:
+                    break
+                step = min(remaining, LONG_WAIT_SECONDS)
+            else:
+                step = LONG_WAIT_SECONDS
+            if self._lock.acquire(True, step):
+                acquired = True
+                break
+            if not warned:
+                warned = True
+                print(
+                    f"Warning: Waited {time.perf_counter() - started:.1f}s for lock "
+                    f"'{self.name}' at {site}; held since {self.owner_site}"
+                )
+
+        self.wait.observe(time.perf_counter() - started)
+        self.contended.inc()
+        return acquired
+
+    def _check_order(self, site):
+        """Record the nesting of this lock under the ones already held.
+
+        Warns the first time a pair of locks is nested in both orders.
+
+        Args:
+            site: Where this lock was acquired
+        """
+        for outer in _held_locks():
+            if outer.name == self.name:
+                continue
+            with _order_lock:
+                if (outer.name, self.name) in _order_edges:
+                    continue
+                _order_edges[(outer.name, self.name)] = site
+                reverse_site = _order_edges.get((self.name, outer.name))
+            if reverse_site is not None:
+                REGISTRY.counter(
+                    'multi_timer_lock_order_violations_total',
+                    'Pairs of locks taken in both orders',
+                    labels={'first': self.name, 'second': outer.name}
+                ).inc()
+                print(
+                    f"Warning: Lock order inversion: '{self.name}' taken under "
+                    f"'{outer.name}' at {site}, but '{outer.name}' was taken under "
+                    f"'{self.name}' at {reverse_site}"
+                )
+
+    def release(self):
+        """Release the lock.
+
+        Raises:
+            RuntimeError: If the lock is not held
+        """
+        held = time.perf_counter() - self.acquired_at
+        site = self.owner_site
+        stack = _held_locks()
+        if self in stack:
+            stack.remove(self)
+        self.owner = None
+        self.owner_site = None
+        self._lock.release()
+
+        self.hold.observe(held)
+        if held > LONG_HOLD_SECONDS:
+            REGISTRY.counter(
+                'multi_timer_lock_long_holds_total',
+                'Lock holds longer than the debug threshold, by acquiring code',
+                labels={'lock': self.name, 'site': site}
+            ).inc()
+            print(f"Warning: Lock '{self.name}' held for {held * 1000:.0f}ms from {site}")
+
+    def locked(self):
+        """Check whether the lock is held.
+
+        Returns:
+            True if some thread holds the lock
+        """
+        return self._lock.locked()
+
+    def __enter__(self):
+        """Acquire the lock for a with block."""
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc_info):
+        """Release the lock at the end of a with block."""
+        self.release()
+        return False
@@ -1,26 +1,95 @@
 #!/usr/bin/env python3
-import gi
-gi.require_version('Gtk', '3.0')
-gi.require_version('AppIndicator3', '0.1')
-gi.require_version('Notify', '0.7')
-
 import signal
 import sys
 import os
+import argparse
 
 # Add the project root directory to Python path
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
-from timer_app.app import TimerApp
 
+def forward_to_instance(args):
+    """Hand this launch's request to the instance that is already running.
+
+    Args:
+        args: Parsed command-line arguments
+
+    Returns:
+        Exit status
+    """
+    from timer_app.instance import connect_to_instance
+
+    client = connect_to_instance()
+    if client is None:
+        print("Error: Multi-Timer is already running but its control socket "
+              "is not available", file=sys.stderr)
+        return 1
+
+    try:
+        if args.add:
+            title, duration = args.add
+            client.AddTimer(title, *duration)
+            print(f"✓ Timer '{title}' added to the running Multi-Timer")
+        elif args.headless or not client.ShowTimers():
+            print("Multi-Timer is already running")
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    finally:
+        client.close()
+    return 0
+
+
+def add_startup_timer(app, args):
+    """Start the timer given with --add in a newly started app.
+
+    Args:
+        app: The TimerCore that was just started
+        args: Parsed command-line arguments
+    """
+    if args.add:
+        title, duration = args.add
+        try:
+            app.control.add_timer(title, *duration)
+        except Exception as e:
+            print(f"Error adding timer: {e}")
+
+
+def run_headless(args):
+    """Run the timer engine without GTK.
+
+    Args:
+        args: Parsed command-line arguments
+    """
+    from timer_app.headless import HeadlessTimerApp
+
+    app = HeadlessTimerApp()
+    add_startup_timer(app, args)
+    if app.rpc_server:
+        print(f"Multi-Timer running headless, control socket: {app.rpc_server.path}")
+    else:
+        print("Multi-Timer running headless")
+    app.run()
+
+
+def run_gui(args):
+    """Run the system tray application.
+
+    Args:
+        args: Parsed command-line arguments
+    """
+    import gi
+    gi.require_version('Gtk', '3.0')
+    gi.require_version('AppIndicator3', '0.1')
+    gi.require_version('Notify', '0.7')
+    from timer_app.app import TimerApp
 
-def main():
-    """Main entry point for the multi-timer application."""
     signal.signal(signal.SIGINT, signal.SIG_DFL)
 
     app = TimerApp()
+    add_startup_timer(app, args)
 
     try:
         print("Multi-Timer application started.")
@@ -29,6 +98,44 @@ def main():
     except KeyboardInterrupt:
         print("\nShutting down...")
         app.quit()
+
+
+def main():
+    """Main entry point for the multi-timer application."""
+    parser = argparse.ArgumentParser(description='Multi-Timer system tray app')
+    parser.add_argument(
+        '--headless', action='store_true',
+        help='Run the timer engine without GTK or a tray icon; '
+             'control it with timer-cli'
+    )
+    parser.add_argument(
+        '--add', nargs=2, metavar=('TITLE', 'DURATION'),
+        help='Start a timer, e.g. --add Tea 5m (in the running instance, if any)'
+    )
+    args = parser.parse_args()
+
+    if args.add:
+        from timer_app.utils import parse_duration
+        try:
+            args.add[1] = parse_duration(args.add[1])
+        except ValueError as e:
+            parser.error(str(e))
+
+    # Only one instance runs; later launches forward their request to it
+    # and exit before GTK is loaded
+    from timer_app.instance import acquire_instance_lock
+    try:
+        instance_lock = acquire_instance_lock()  # Held until the app exits
+        if instance_lock is None:
+            sys.exit(forward_to_instance(args))
+    except OSError as e:
+        print(f"Warning: Could not check for a running instance: {e}")
+
+    try:
+        if args.headless:
+            run_headless(args)
+        else:
+            run_gui(args)
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)
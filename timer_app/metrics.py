@@ -0,0 +1,534 @@
+"""
+Runtime metrics.
+
+A process-wide registry of counters, gauges and histograms. Modules define
+the metrics they update at import time and update them from any thread;
+an update takes one uncontended lock, so instrumentation stays on in
+normal use. The registry is exported as a flat dictionary (the GetMetrics
+method) and in the Prometheus text format, which MetricsServer can serve
+over HTTP on a local port.
+"""
+import time
+import bisect
+import threading
+import functools
+
+
+# Seconds, from half a millisecond to ten seconds
+DEFAULT_BUCKETS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0
+)
+
+
+class Counter:
+    """A value that only goes up."""
+
+    kind = 'counter'
+
+    def __init__(self):
+        """Initialize the counter at zero."""
+        self.value = 0
+        self.lock = threading.Lock()
+
+    def inc(self, amount=1):
+        """Increase the counter.
+
+        Args:
+            amount: Non-negative amount to add
+        """
+        with self.lock:
+            self.value += amount
+
+    def samples(self, name, labels):
+        """Get the counter's samples.
+
+        Args:
+            name: Metric name
+            labels: Dictionary of labels
+
+        Returns:
+            List of (sample name, labels, value)
+        """
+        return [(name, labels, self.value)]
+
+
+class Gauge:
+    """A value that can go up and down, or is read from a function."""
+
+    kind = 'gauge'
+
+    def __init__(self, func=None):
+        """Initialize the gauge.
+
+        Args:
+            func: Optional function returning the current value, called
+                whenever the metrics are collected
+        """
+        self.value = 0
+        self.func = func
+        self.lock = threading.Lock()
+
+    def set(self, value):
+        """Set the gauge.
+
+        Args:
+            value: New value
+        """
+        self.value = value
+
+    def inc(self, amount=1):
+        """Increase the gauge.
+
+        Args:
+            amount: Amount to add (negative to decrease)
+        """
+        with self.lock:
+            self.value += amount
+
+    def samples(self, name, labels):
+        """Get the gauge's samples.
+
+        Args:
+            name: Metric name
+            labels: Dictionary of labels
+
+        Returns:
+            List of (sample name, labels, value)
+        """
+        if self.func is None:
+            return [(name, labels, self.value)]
+        try:
+            return [(name, labels, self.func())]
+        except Exception as e:
+            print(f"Warning: Could not read gauge {name}: {e}")
+            return []
+
+
+class Histogram:
+    """Distribution of observed values in fixed buckets."""
+
+    kind = 'histogram'
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        """Initialize an empty histogram.
+
+        Args:
+            buckets: Sorted upper bounds of the buckets; +Inf is implied
+        """
+        self.bounds = tuple(buckets)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+        self.lock = threading.Lock()
+
+    def observe(self, value):
+        """Record one value.
+
+        Args:
+            value: Observed value
+        """
+        index = bisect.bisect_left(self.bounds, value)
+        with self.lock:
+            self.counts[index] += 1
+            self.sum += value
+            self.count += 1
+
+    def time(self):
+        """Time a block of code.
+
+        Returns:
+            Context manager observing the seconds spent inside it
+        """
+        return _Timer(self)
+
+    def samples(self, name, labels):
+        """Get the histogram's samples.
+
+        Args:
+            name: Metric name
+            labels: Dictionary of labels
+
+        Returns:
+            List of (sample name, labels, value): cumulative _bucket
+            samples, then _sum and _count
+        """
+        with self.lock:
+            counts = list(self.counts)
+            total, count = self.sum, self.count
+
+        result = []
+        cumulative = 0
+        for bound, bucket_count in zip(self.bounds + (float('inf'),), counts):
+            cumulative += bucket_count
+            le = '+Inf' if bound == float('inf') else repr(bound)
+            result.append((f"{name}_bucket", dict(labels, le=le), cumulative))
+        result.append((f"{name}_sum", labels, total))
+        result.append((f"{name}_count", labels, count))
+        return result
+
+
+class _Timer:
+    """Context manager that observes elapsed seconds into a histogram."""
+
+    __slots__ = ('histogram', 'started')
+
+    def __init__(self, histogram):
+        """Initialize the timer.
+
+        Args:
+            histogram: Histogram to observe into
+        """
+        self.histogram = histogram
+
+    def __enter__(self):
+        """Start timing."""
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        """Observe the elapsed time."""
+        self.histogram.observe(time.perf_counter() - self.started)
+        return False
+
+
+class MetricsRegistry:
+    """Named metrics, each with an optional set of labels."""
+
+    def __init__(self):
+        """Initialize an empty registry."""
+        self.lock = threading.Lock()
+        self.families = {}  # name -> [kind, help, {label tuple: metric}]
+        self.collectors = []
+
+    def _get(self, cls, name, help_text, labels, *args):
+        """Get a metric, creating it on first use.
+
+        Args:
+            cls: Counter, Gauge or Histogram
+            name: Metric name
+            help_text: One-line description
+            labels: Dictionary of labels, or None
+            *args: Arguments for cls
+
+        Returns:
+            The metric
+
+        Raises:
+            ValueError: If the name is already used by another kind of metric
+        """
+        key = tuple(sorted((labels or {}).items()))
+        with self.lock:
+            family = self.families.get(name)
+            if family is None:
+                family = self.families[name] = [cls.kind, help_text, {}]
+            elif family[0] != cls.kind:
+                raise ValueError(f"Metric {name} is a {family[0]}, not a {cls.kind}")
+            metric = family[2].get(key)
+            if metric is None:
+                metric = family[2][key] = cls(*args)
+            return metric
+
+    def counter(self, name, help_text, labels=None):
+        """Get or create a counter.
+
+        Args:
+            name: Metric name, ending in _total by convention
+            help_text: One-line description
+            labels: Optional dictionary of labels
+
+        Returns:
+            Counter
+        """
+        return self._get(Counter, name, help_text, labels)
+
+    def gauge(self, name, help_text, labels=None, func=None):
+        """Get or create a gauge.
+
+        Args:
+            name: Metric name
+            help_text: One-line description
+            labels: Optional dictionary of labels
+            func: Optional function returning the value at collection time
+
+        Returns:
+            Gauge
+        """
+        gauge = self._get(Gauge, name, help_text, labels)
+        if func is not None:
+            gauge.func = func
+        return gauge
+
+    def histogram(self, name, help_text, labels=None, buckets=DEFAULT_BUCKETS):
+        """Get or create a histogram.
+
+        Args:
+            name: Metric name
+            help_text: One-line description
+            labels: Optional dictionary of labels
+            buckets: Sorted upper bounds of the buckets
+
+        Returns:
+            Histogram
+        """
+        return self._get(Histogram, name, help_text, labels, buckets)
+
+    def add_collector(self, func):
+        """Register a function producing extra samples at collection time.
+
+        Used to export statistics that components already keep.
+
+        Args:
+            func: Function returning an iterable of
+                (name, kind, help, labels, value)
+        """
+        with self.lock:
+            self.collectors.append(func)
+
+    def collect(self):
+        """Gather every metric.
+
+        Returns:
+            List of (name, kind, help, samples) where samples is a list of
+            (sample name, labels, value)
+        """
+        with self.lock:
+            families = [
+                (name, kind, help_text, list(metrics.items()))
+                for name, (kind, help_text, metrics) in sorted(self.families.items())
+            ]
+            collectors = list(self.collectors)
+
+        result = []
+        for name, kind, help_text, metrics in families:
+            samples = []
+            for key, metric in metrics:
+                samples.extend(metric.samples(name, dict(key)))
+            result.append((name, kind, help_text, samples))
+
+        collected = {}
+        for collector in collectors:
+            try:
+                for name, kind, help_text, labels, value in collector():
+                    family = collected.setdefault(name, (name, kind, help_text, []))
+                    family[3].append((name, labels, value))
+            except Exception as e:
+                print(f"Warning: Metrics collector failed: {e}")
+        result.extend(collected[name] for name in sorted(collected))
+        return result
+
+    def as_dict(self):
+        """Get every sample as a flat dictionary.
+
+        Returns:
+            Dictionary of 'name{label="value",...}' -> float
+        """
+        return {
+            _sample_key(sample_name, labels): float(value)
+            for _, _, _, samples in self.collect()
+            for sample_name, labels, value in samples
+        }
+
+    def as_text(self):
+        """Format every metric in the Prometheus text exposition format.
+
+        Returns:
+            String ending in a newline
+        """
+        lines = []
+        for name, kind, help_text, samples in self.collect():
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            for sample_name, labels, value in samples:
+                lines.append(f"{_sample_key(sample_name, labels)} {float(value)!r}")
+        return '\n'.join(lines) + '\n'
+
+
+def _sample_key(name, labels):
+    """Format a sample name with its labels.
+
+    Args:
+        name: Sample name
+        labels: Dictionary of labels
+
+    Returns:
+        e.g. 'multi_timer_lock_wait_seconds_count{lock="timer_manager"}'
+    """
+    if not labels:
+        return name
+    pairs = ','.join(
+        f'{key}="{_escape_label(str(value))}"' for key, value in sorted(labels.items())
+    )
+    return f"{name}{{{pairs}}}"
+
+
+def _escape_label(value):
+    """Escape a label value for the text format.
+
+    Args:
+        value: Label value
+
+    Returns:
+        Value with backslashes, quotes and newlines escaped
+    """
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+REGISTRY = MetricsRegistry()
+
+
+def timed(callback_name):
+    """Decorate a main loop callback to record how long it runs.
+
+    Args:
+        callback_name: Value of the "callback" label
+
+    Returns:
+        Decorator
+    """
+    histogram = REGISTRY.histogram(
+        'multi_timer_main_loop_callback_seconds',
+        'Time spent in main loop callbacks',
+        labels={'callback': callback_name}
+    )
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                histogram.observe(time.perf_counter() - started)
+        return wrapper
+
+    return decorator
+
+
+class TimedLock:
+    """A threading.Lock that records how long threads wait for it.
+
+    Acquiring first tries a non-blocking acquire; only when that fails is
+    the wait timed, so an uncontended lock costs one extra method call.
+    """
+
+    def __init__(self, name):
+        """Initialize the lock.
+
+        Args:
+            name: Value of the "lock" label
+        """
+        self._lock = threading.Lock()
+        self.contended = REGISTRY.counter(
+            'multi_timer_lock_contended_total',
+            'Lock acquisitions that had to wait',
+            labels={'lock': name}
+        )
+        self.wait = REGISTRY.histogram(
+            'multi_timer_lock_wait_seconds',
+            'Time spent waiting for contended locks',
+            labels={'lock': name}
+        )
+
+    def acquire(self, blocking=True, timeout=-1):
+        """Acquire the lock.
+
+        Args:
+            blocking: Wait for the lock if it is held
+            timeout: Longest wait in seconds (-1 for no limit)
+
+        Returns:
+            True if the lock was acquired
+        """
+        if self._lock.acquire(False):
+            return True
+        if not blocking:
+            return False
+
+        started = time.perf_counter()
+        acquired = self._lock.acquire(True, timeout)
+        self.wait.observe(time.perf_counter() - started)
+        self.contended.inc()
+        return acquired
+
+    def release(self):
+        """Release the lock."""
+        self._lock.release()
+
+    def locked(self):
+        """Check whether the lock is held.
+
+        Returns:
+            True if some thread holds the lock
+        """
+        return self._lock.locked()
+
+    def __enter__(self):
+        """Acquire the lock for a with block."""
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc_info):
+        """Release the lock at the end of a with block."""
+        self._lock.release()
+        return False
+
+
+class MetricsServer:
+    """Serves the registry as Prometheus text over HTTP on a local port.
+
+    Runs in its own daemon thread, so a slow scraper never blocks the
+    main loop.
+    """
+
+    def __init__(self, registry, port, host='127.0.0.1'):
+        """Initialize the server.
+
+        Args:
+            registry: MetricsRegistry to serve
+            port: TCP port to listen on
+            host: Address to bind, loopback by default
+        """
+        self.registry = registry
+        self.port = port
+        self.host = host
+        self.httpd = None
+        self.thread = None
+
+    def start(self):
+        """Bind the port and start serving.
+
+        Raises:
+            OSError: If the port can't be bound
+        """
+        from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+        registry = self.registry
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split('?', 1)[0] not in ('/', '/metrics'):
+                    self.send_error(404)
+                    return
+                body = registry.as_text().encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer((self.host, self.port), Handler)
+        self.httpd.daemon_threads = True
+        self.thread = threading.Thread(
+            target=self.httpd.serve_forever, name='MetricsServer', daemon=True
+        )
+        self.thread.start()
+
+    def stop(self):
+        """Stop serving and close the port."""
+        if self.httpd is not None:
+            self.httpd.shutdown()
+            self.httpd.server_close()
+            self.httpd = None
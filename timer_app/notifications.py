@@ -1,17 +1,67 @@
 import os
 import sys
-import subprocess
+import json
+import time
+import shutil
+import threading
+import importlib.util
+from pathlib import Path
+
+from timer_app.settings import load_settings
+from timer_app.dispatch import DispatchQueue
+from timer_app.locks import create_lock
 
 
 class NotificationHandler:
     """Handles desktop notifications and sound alerts for timer completion."""
 
-    def __init__(self):
-        """Initialize the notification handler."""
+    SYSTEM_SOUNDS = [
+        '/usr/share/sounds/freedesktop/stereo/complete.oga',
+        '/usr/share/sounds/freedesktop/stereo/bell.oga',
+        '/usr/share/sounds/ubuntu/stereo/message.ogg',
+        '/usr/share/sounds/ubuntu/stereo/bell.ogg'
+    ]
+
+    # Player commands tried by _detect_sound_backend(), best first
+    SOUND_PLAYERS = ['canberra-gtk-play', 'paplay']
+
+    def __init__(self, settings=None):
+        """Initialize the notification handler.
+
+        Args:
+            settings: Settings from load_settings(), loaded here if None
+        """
         self.notify_available = False
         self.sound_available = False
         self.sound_path = None
         self.sound_method = None
+        self.sound_player = None  # Absolute path of the player command
+        self.audio_worker = None
+        self.notification = None  # Reused for every summary notification
+        self.warning_notification = None  # Reused for every pre-warning summary
+        self.settings = settings if settings is not None else load_settings()
+
+        # Talks to the notification daemon off the main thread
+        dispatch_settings = self.settings['dispatch']
+        self.dispatcher = DispatchQueue(
+            'NotificationDispatch',
+            max_size=dispatch_settings['queue_size'],
+            timeout_seconds=dispatch_settings['timeout_ms'] / 1000.0
+        )
+
+        notify_settings = self.settings['notifications']
+        self.aggregator = NotificationAggregator(
+            self._dispatch_summary,
+            window_seconds=notify_settings['coalesce_ms'] / 1000.0,
+            max_per_minute=notify_settings['max_per_minute'],
+            display_seconds=notify_settings['timeout_ms'] / 1000.0
+        )
+        self.warning_aggregator = NotificationAggregator(
+            self._dispatch_warning_summary,
+            window_seconds=notify_settings['coalesce_ms'] / 1000.0,
+            max_per_minute=notify_settings['max_per_minute'],
+            display_seconds=notify_settings['timeout_ms'] / 1000.0
+        )
 
         self._init_notifications()
         self._init_sound()
@@ -28,40 +78,51 @@ class NotificationHandler:
             self.notify_available = False
 
     def _init_sound(self):
-        """Initialize sound playback."""
+        """Initialize sound playback.
+
+        Backend detection only touches the filesystem (no subprocesses, no
+        playsound import) and its result is cached in the config directory.
+        The cache is reused until the next boot, a PATH change, playsound
+        being installed or removed, or any candidate player or sound file
+        appearing, changing or disappearing.
+        """
+        if self._load_sound_cache():
+            return
+
+        self._detect_sound_backend()
+        self._save_sound_cache()
+
+    def _detect_sound_backend(self):
+        """Pick the best available sound method."""
         # Try multiple sound methods in order of preference
 
-        # 1. Try custom sound file with playsound
-        try:
-            from playsound import playsound
-            self.playsound = playsound
-            sound_file = self._find_sound_file()
-            if sound_file and os.path.exists(sound_file):
+        # 1. Try custom sound file with playsound (imported on first use)
+        sound_file = self._find_sound_file()
+        if sound_file and os.path.exists(sound_file):
+            if importlib.util.find_spec('playsound') is not None:
                 self.sound_path = sound_file
                 self.sound_method = 'playsound'
                 self.sound_available = True
                 print("Using custom alert sound")
                 return
-        except Exception as e:
-            print(f"Note: playsound not available: {e}")
+            print("Note: playsound not available")
 
         # 2. Try canberra-gtk-play (GNOME notification sounds)
-        if self._check_command_exists('canberra-gtk-play'):
+        player = shutil.which(self.SOUND_PLAYERS[0])
+        if player:
+            self.sound_player = player
             self.sound_method = 'canberra'
             self.sound_available = True
             print("Using system notification sound (canberra)")
             return
 
         # 3. Try paplay with system sounds
-        if self._check_command_exists('paplay'):
+        player = shutil.which(self.SOUND_PLAYERS[1])
+        if player:
             # Check for common system alert sounds
-            for sound_path in [
-                '/usr/share/sounds/freedesktop/stereo/complete.oga',
-                '/usr/share/sounds/freedesktop/stereo/bell.oga',
-                '/usr/share/sounds/ubuntu/stereo/message.ogg',
-                '/usr/share/sounds/ubuntu/stereo/bell.ogg'
-            ]:
+            for sound_path in self.SYSTEM_SOUNDS:
                 if os.path.exists(sound_path):
+                    self.sound_player = player
                     self.sound_path = sound_path
                     self.sound_method = 'paplay'
                     self.sound_available = True
@@ -73,24 +134,111 @@ class NotificationHandler:
         self.sound_method = 'beep'
         self.sound_available = True
 
-    def _check_command_exists(self, command):
-        """Check if a command exists in the system.
+    def _get_sound_cache_path(self):
+        """Get the path to the sound backend cache file.
+
+        Returns:
+            Path object for the cache file
+        """
+        config_dir = Path.home() / '.config' / 'multi-timer-app'
+        config_dir.mkdir(parents=True, exist_ok=True)
+        return config_dir / 'sound_backend.json'
+
+    def _sound_cache_key(self):
+        """Describe the environment the detection result depends on.
+
+        Returns:
+            Dictionary that must match for a cached result to be reused
+        """
+        try:
+            with open('/proc/sys/kernel/random/boot_id', 'r') as f:
+                boot_id = f.read().strip()
+        except OSError:
+            boot_id = None
+
+        return {
+            'boot_id': boot_id,
+            'path': os.environ.get('PATH', ''),
+            'sound_file': self._find_sound_file(),
+            'playsound': importlib.util.find_spec('playsound') is not None,
+        }
+
+    def _sound_candidates(self):
+        """List every file whose presence can change the detection result.
+
+        Returns:
+            List of paths: each player command in every PATH directory,
+            the system sounds and the custom sound file
+        """
+        paths = [
+            os.path.join(directory, player)
+            for directory in os.environ.get('PATH', '').split(os.pathsep) if directory
+            for player in self.SOUND_PLAYERS
+        ]
+        paths.extend(self.SYSTEM_SOUNDS)
+        paths.append(self._find_sound_file())
+        return paths
+
+    def _file_mtime(self, path):
+        """Get a file's modification time.
 
         Args:
-            command: Command name to check
+            path: File path or None
+
+        Returns:
+            mtime in nanoseconds, or None if the file doesn't exist
+        """
+        if not path:
+            return None
+        try:
+            return os.stat(path).st_mtime_ns
+        except OSError:
+            return None
+
+    def _load_sound_cache(self):
+        """Apply a cached detection result if it is still valid.
 
         Returns:
-            True if command exists, False otherwise
+            True if the cached result was used
         """
         try:
-            subprocess.run(['which', command],
-                         capture_output=True,
-                         check=True,
-                         timeout=1)
-            return True
-        except (subprocess.CalledProcessError, subprocess.TimeoutExpired, FileNotFoundError):
+            with open(self._get_sound_cache_path(), 'r') as f:
+                cached = json.load(f)
+        except Exception:
             return False
 
+        if cached.get('key') != self._sound_cache_key():
+            return False
+
+        # A candidate player or sound file replaced, removed or installed
+        # since (missing files are recorded with None)
+        for path, mtime in cached.get('mtimes', {}).items():
+            if self._file_mtime(path) != mtime:
+                return False
+
+        self.sound_method = cached.get('method')
+        self.sound_player = cached.get('player')
+        self.sound_path = cached.get('sound_path')
+        self.sound_available = self.sound_method is not None
+        return self.sound_available
+
+    def _save_sound_cache(self):
+        """Persist the detection result for later launches."""
+        watched = set(self._sound_candidates())
+        watched.update([self.sound_player, self.sound_path])
+        data = {
+            'key': self._sound_cache_key(),
+            'method': self.sound_method,
+            'player': self.sound_player,
+            'sound_path': self.sound_path,
+            'mtimes': {p: self._file_mtime(p) for p in watched if p},
+        }
+        try:
+            with open(self._get_sound_cache_path(), 'w') as f:
+                json.dump(data, f, indent=2)
+        except Exception as e:
+            print(f"Warning: Could not save sound backend cache: {e}")
+
     def _find_sound_file(self):
         """Find the alert sound file.
 
@@ -108,71 +256,190 @@ class NotificationHandler:
     def notify_timer_complete(self, timer):
         """Show notification and play sound when timer completes.
 
+        Only queues work, so it is safe to call from the GTK main thread:
+        the notification is shown by the dispatch worker and the sound by
+        the audio worker.
+
         Args:
             timer: The completed Timer object
         """
         self._show_notification(timer)
         self._play_sound()
 
+    def notify_timer_warning(self, timer, seconds_left):
+        """Show a pre-warning notification for a timer about to finish.
+
+        Warnings are grouped like completions but shown in their own
+        notification, without a sound.
+
+        Args:
+            timer: The Timer object
+            seconds_left: Seconds until the timer completes
+        """
+        from timer_app.utils import format_duration
+        self.warning_aggregator.add(f"{timer.title}: {format_duration(seconds_left)} left")
+
+    def _dispatch_warning_summary(self, lines):
+        """Hand a pre-warning summary to the dispatch worker.
+
+        Args:
+            lines: List of "title: time left" strings
+        """
+        if len(lines) == 1:
+            summary, body = "Timer Ending Soon", lines[0]
+        else:
+            summary = f"{len(lines)} timers ending soon"
+            body = "\n".join(lines[:5])
+            if len(lines) > 5:
+                body += f"\n... and {len(lines) - 5} more"
+
+        if not self.dispatcher.submit(
+                'show-warning', self._show_warning_summary, summary, body):
+            self._fallback_notification(summary, body)
+
+    def _show_warning_summary(self, summary, body):
+        """Display or update the pre-warning notification.
+
+        Args:
+            summary: Notification summary line
+            body: Notification body text
+        """
+        if not self.notify_available:
+            self._fallback_notification(summary, body)
+            return
+
+        try:
+            if self.warning_notification is None:
+                self.warning_notification = self.notify2.Notification(
+                    summary, body, "alarm-symbolic"
+                )
+                self.warning_notification.set_urgency(self.notify2.URGENCY_LOW)
+            else:
+                self.warning_notification.update(summary, body, "alarm-symbolic")
+            self.warning_notification.set_timeout(self.settings['notifications']['timeout_ms'])
+            self.warning_notification.show()
+        except Exception as e:
+            print(f"Error showing notification: {e}")
+            self._fallback_notification(summary, body)
+
     def _show_notification(self, timer):
-        """Display desktop notification.
+        """Queue a desktop notification for a completed timer.
+
+        Completions close together are grouped into one notification by
+        the aggregator.
 
         Args:
             timer: The completed Timer object
         """
+        self.aggregator.add(timer.title)
+
+    def _format_summary(self, titles):
+        """Build the notification text for a group of completed timers.
+
+        Args:
+            titles: List of completed timer titles
+
+        Returns:
+            Tuple of (summary, body)
+        """
+        if len(titles) == 1:
+            return "Timer Complete", f"{titles[0]} has finished!"
+
+        shown = ", ".join(titles[:5])
+        if len(titles) > 5:
+            shown += f" and {len(titles) - 5} more"
+        return f"{len(titles)} timers finished", shown
+
+    def _dispatch_summary(self, titles):
+        """Hand a summary to the dispatch worker.
+
+        If the worker is saturated the summary is printed to the console
+        instead, which never blocks.
+
+        Args:
+            titles: List of completed timer titles
+        """
+        if not self.dispatcher.submit('show-notification', self._show_summary, titles):
+            self._fallback_notification(*self._format_summary(titles))
+
+    def get_dispatch_stats(self):
+        """Get notification dispatch statistics (latency, queue depth, ...).
+
+        Returns:
+            Dictionary of statistics
+        """
+        return self.dispatcher.get_stats()
+
+    def _show_summary(self, titles):
+        """Display or update the summary notification.
+
+        The same notify2.Notification is reused, so the notification daemon
+        updates the existing bubble in place instead of stacking new ones.
+
+        Args:
+            titles: List of completed timer titles
+        """
+        summary, body = self._format_summary(titles)
+
         if self.notify_available:
             try:
-                notification = self.notify2.Notification(
-                    "Timer Complete",
-                    f"{timer.title} has finished!",
-                    "dialog-information"
-                )
-                notification.set_urgency(self.notify2.URGENCY_NORMAL)
-                notification.set_timeout(5000)
-                notification.show()
+                if self.notification is None:
+                    self.notification = self.notify2.Notification(
+                        summary, body, "dialog-information"
+                    )
+                    self.notification.set_urgency(self.notify2.URGENCY_NORMAL)
+                else:
+                    self.notification.update(summary, body, "dialog-information")
+                self.notification.set_timeout(self.settings['notifications']['timeout_ms'])
+                self.notification.show()
             except Exception as e:
                 print(f"Error showing notification: {e}")
-                self._fallback_notification(timer)
+                self._fallback_notification(summary, body)
         else:
-            self._fallback_notification(timer)
+            self._fallback_notification(summary, body)
 
-    def _fallback_notification(self, timer):
+    def _fallback_notification(self, summary, body):
         """Fallback notification using console output.
 
         Args:
-            timer: The completed Timer object
+            summary: Notification summary line
+            body: Notification body text
         """
-        print(f"\n*** TIMER COMPLETE: {timer.title} ***\n")
+        print(f"\n*** {summary.upper()}: {body} ***\n")
 
     def _play_sound(self):
-        """Play alert sound."""
+        """Queue the alert sound on the audio worker."""
         if not self.sound_available:
             return
 
-        try:
-            if self.sound_method == 'playsound':
-                # Custom sound file with playsound
-                self.playsound(self.sound_path, block=False)
-            elif self.sound_method == 'canberra':
-                # GNOME notification sound
-                subprocess.Popen(
-                    ['canberra-gtk-play', '-i', 'complete', '-d', 'Timer Complete'],
-                    stdout=subprocess.DEVNULL,
-                    stderr=subprocess.DEVNULL
-                )
-            elif self.sound_method == 'paplay':
-                # System sound file with paplay
-                subprocess.Popen(
-                    ['paplay', self.sound_path],
-                    stdout=subprocess.DEVNULL,
-                    stderr=subprocess.DEVNULL
-                )
-            elif self.sound_method == 'beep':
-                # Fallback to system beep
-                self._system_beep()
-        except Exception as e:
-            print(f"Error playing sound: {e}")
-            self._system_beep()
+        if self.audio_worker is None:
+            self._start_audio_worker()
+        self.audio_worker.request_play()
+
+    def _start_audio_worker(self):
+        """Start the long-lived thread that plays alert sounds."""
+        from timer_app.audio import AudioWorker
+
+        sound_settings = self.settings['sound']
+        self.audio_worker = AudioWorker(
+            self.sound_method,
+            player=self.sound_player,
+            sound_path=self.sound_path,
+            coalesce_seconds=sound_settings['coalesce_ms'] / 1000.0,
+            max_concurrent=sound_settings['max_concurrent'],
+            beep=self._system_beep
+        )
+        self.audio_worker.start()
+
+    def get_sound_stats(self):
+        """Get audio worker statistics (queue depth, play latency, ...).
+
+        Returns:
+            Dictionary of statistics, empty if no sound was played yet
+        """
+        if self.audio_worker is None:
+            return {}
+        return self.audio_worker.get_stats()
 
     def _system_beep(self):
         """Fallback to system beep."""
@@ -180,3 +447,103 @@ class NotificationHandler:
             print("\a", end="", flush=True)
         except Exception:
             pass
+
+    def shutdown(self):
+        """Stop the audio worker and drop pending notifications."""
+        self.aggregator.cancel()
+        self.warning_aggregator.cancel()
+        self.dispatcher.stop()
+        if self.audio_worker is not None:
+            self.audio_worker.stop()
+            self.audio_worker = None
+
+
+class NotificationAggregator:
+    """Groups completions that happen close together into one notification.
+
+    The first completion opens a short collection window; everything that
+    completes before it closes is shown as one summary. While a summary is
+    still on screen, later completions are added to it rather than shown
+    separately. Updates are also rate limited: when one would come too
+    soon after the previous, it is delayed and keeps collecting.
+    """
+
+    def __init__(self, show, window_seconds=0.5, max_per_minute=12, display_seconds=5.0):
+        """Initialize the aggregator.
+
+        Args:
+            show: Function called with the list of titles to display
+            window_seconds: How long to collect completions before showing
+            max_per_minute: Maximum number of notification updates per minute
+            display_seconds: How long a shown summary stays on screen
+        """
+        self.show = show
+        self.window_seconds = window_seconds
+        self.min_interval = 60.0 / max_per_minute if max_per_minute > 0 else 0.0
+        self.display_seconds = display_seconds
+
+        self.lock = create_lock('notification_coalescer')
+        self.pending = []  # Titles not shown yet
+        self.visible = []  # Titles in the summary currently on screen
+        self.last_shown = None  # Monotonic time of the last update
+        self.extend_visible = False  # Pending titles join the summary on screen
+        self.flush_timer = None
+
+    def add(self, title):
+        """Add a completed timer to the next summary.
+
+        Args:
+            title: Completed timer title
+        """
+        with self.lock:
+            if not self.pending:
+                # Decided now rather than at the flush, which rate limiting
+                # can delay until after the summary has left the screen
+                self.extend_visible = (
+                    self.last_shown is not None
+                    and time.monotonic() - self.last_shown < self.display_seconds
+                )
+            self.pending.append(title)
+            if self.flush_timer is None:
+                self._schedule(self.window_seconds)
+
+    def _schedule(self, delay):
+        """Start the flush timer. Must be called with the lock held.
+
+        Args:
+            delay: Seconds until the flush
+        """
+        self.flush_timer = threading.Timer(delay, self._flush)
+        self.flush_timer.daemon = True
+        self.flush_timer.start()
+
+    def _flush(self):
+        """Show the pending titles, or wait longer if rate limited."""
+        with self.lock:
+            now = time.monotonic()
+            if self.last_shown is not None:
+                wait = self.last_shown + self.min_interval - now
+                if wait > 0:
+                    self._schedule(wait)
+                    return
+
+            if not self.extend_visible:
+                self.visible = []
+            self.visible.extend(self.pending)
+            self.pending = []
+            self.last_shown = now
+            self.flush_timer = None
+            titles = list(self.visible)
+
+        try:
+            self.show(titles)
+        except Exception as e:
+            print(f"Error showing notification: {e}")
+
+    def cancel(self):
+        """Cancel any scheduled flush."""
+        with self.lock:
+            if self.flush_timer is not None:
+                self.flush_timer.cancel()
+                self.flush_timer = None
+            self.pending = []
@@ -0,0 +1,508 @@
+"""
+Length-prefixed JSON-RPC over a UNIX domain socket.
+
+The app serves the same methods as its DBus interface on a socket in
+$XDG_RUNTIME_DIR, so clients don't need dbus-python or a session bus.
+Each frame is a 4-byte big-endian length followed by a UTF-8 JSON
+object:
+
+    request:  {"id": 1, "method": "QueryTimers", "params": [...]}
+    response: {"id": 1, "result": ...}
+              {"id": 1, "error": {"name": "InvalidArgs", "message": "..."}}
+
+Requests on one connection may be pipelined; responses come back in
+request order.
+"""
+import os
+import json
+import socket
+import struct
+import tempfile
+from pathlib import Path
+from timer_app.metrics import timed
+
+
+HEADER = struct.Struct('>I')
+MAX_FRAME = 16 * 1024 * 1024
+MAX_PENDING_OUTPUT = 4 * 1024 * 1024  # Stop reading a client that doesn't read its replies
+
+# RPC method name -> TimerControl method
+METHODS = {
+    'AddTimer': 'add_timer',
+    'AddTimerWithOptions': 'add_timer',
+    'ImportRecords': 'import_records',
+    'GetTimers': 'get_timers',
+    'QueryTimers': 'query_timers',
+    'ListTimers': 'list_timers',
+    'GetChangesSince': 'get_changes_since',
+    'DeleteTimer': 'delete_timer',
+    'GetTimerByTitle': 'get_timer_by_title',
+    'DeleteTimerByTitle': 'delete_timer_by_title',
+    'PauseTimerByTitle': 'pause_timer_by_title',
+    'GetUsageStats': 'get_usage_stats',
+    'GetStats': 'get_stats',
+    'GetMetrics': 'get_metrics',
+    'ShowTimers': 'show_timers',
+}
+
+# Methods that are rate limited per client, so get the caller's identity
+CLIENT_METHODS = {'AddTimer', 'AddTimerWithOptions', 'ImportRecords'}
+
+
+class RpcError(Exception):
+    """Error returned by the RPC server.
+
+    Attributes:
+        name: Short error name, e.g. "InvalidArgs"
+    """
+
+    def __init__(self, name, message):
+        """Initialize the error.
+
+        Args:
+            name: Short error name
+            message: Human-readable description
+        """
+        super().__init__(message)
+        self.name = name
+
+
+def get_socket_path():
+    """Get the path of the control socket.
+
+    Uses $XDG_RUNTIME_DIR/multi-timer/control.sock, or a per-user directory
+    in the temp dir when XDG_RUNTIME_DIR is not set (e.g. in containers).
+
+    Returns:
+        Path object for the socket
+    """
+    runtime_dir = os.environ.get('XDG_RUNTIME_DIR')
+    if runtime_dir:
+        return Path(runtime_dir) / 'multi-timer' / 'control.sock'
+    return Path(tempfile.gettempdir()) / f'multi-timer-{os.getuid()}' / 'control.sock'
+
+
+def encode_frame(message):
+    """Encode a message as a length-prefixed frame.
+
+    Args:
+        message: JSON-serializable object
+
+    Returns:
+        Bytes of the frame
+    """
+    body = json.dumps(message, separators=(',', ':')).encode('utf-8')
+    return HEADER.pack(len(body)) + body
+
+
+def decode_frames(buffer):
+    """Split complete frames off the front of a buffer.
+
+    Args:
+        buffer: bytearray of received data; consumed frames are removed
+
+    Returns:
+        List of decoded messages
+
+    Raises:
+        ValueError: If a frame is larger than MAX_FRAME
+    """
+    messages = []
+    offset = 0
+    while len(buffer) - offset >= HEADER.size:
+        (length,) = HEADER.unpack_from(buffer, offset)
+        if length > MAX_FRAME:
+            raise ValueError(f"Frame of {length} bytes is too large")
+        end = offset + HEADER.size + length
+        if len(buffer) < end:
+            break
+        messages.append(json.loads(buffer[offset + HEADER.size:end].decode('utf-8')))
+        offset = end
+    del buffer[:offset]
+    return messages
+
+
+class RpcServer:
+    """Serves TimerControl over the control socket from the GLib main loop.
+
+    Requests are handled on the main thread, like DBus calls, so they may
+    touch the UI safely.
+    """
+
+    def __init__(self, control, path=None):
+        """Initialize the server.
+
+        Args:
+            control: TimerControl instance
+            path: Socket path (defaults to get_socket_path())
+        """
+        self.control = control
+        self.path = Path(path) if path else get_socket_path()
+        self.sock = None
+        self.watch_id = None
+        self.connections = set()
+
+    def start(self):
+        """Bind the socket and start accepting connections.
+
+        Raises:
+            OSError: If the socket can't be created or another instance
+                is already serving it
+        """
+        from gi.repository import GLib
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        os.chmod(self.path.parent, 0o700)
+
+        if self.path.exists():
+            # A live socket means another instance; a dead one is left over
+            probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                probe.connect(str(self.path))
+                raise OSError(f"Another instance is serving {self.path}")
+            except (ConnectionRefusedError, FileNotFoundError):
+                self.path.unlink()
+            finally:
+                probe.close()
+
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.bind(str(self.path))
+        os.chmod(self.path, 0o600)
+        self.sock.listen(16)
+        self.sock.setblocking(False)
+        self.watch_id = GLib.io_add_watch(
+            self.sock.fileno(), GLib.PRIORITY_DEFAULT, GLib.IO_IN, self._on_accept
+        )
+
+    def stop(self):
+        """Close all connections and remove the socket."""
+        from gi.repository import GLib
+
+        if self.watch_id:
+            GLib.source_remove(self.watch_id)
+            self.watch_id = None
+        for connection in list(self.connections):
+            connection.close()
+        if self.sock:
+            self.sock.close()
+            self.sock = None
+            try:
+                self.path.unlink()
+            except OSError:
+                pass
+
+    def _on_accept(self, fd, condition):
+        """Accept pending connections.
+
+        Returns:
+            True to keep watching the listening socket
+        """
+        while True:
+            try:
+                sock, _ = self.sock.accept()
+            except (BlockingIOError, InterruptedError):
+                return True
+            except OSError as e:
+                print(f"Warning: Could not accept control connection: {e}")
+                return True
+            self.connections.add(_Connection(self, sock))
+
+    def dispatch(self, request, client=None):
+        """Run one request.
+
+        Args:
+            request: Decoded request dictionary
+            client: Identifier of the peer, for rate limiting
+
+        Returns:
+            Response dictionary
+        """
+        from timer_app.control import ControlError
+
+        request_id = request.get('id') if isinstance(request, dict) else None
+        try:
+            method = METHODS.get(request.get('method'))
+            if method is None:
+                raise RpcError('UnknownMethod', f"Unknown method: {request.get('method')}")
+            params = request.get('params') or []
+            if not isinstance(params, list):
+                raise RpcError('InvalidArgs', "params must be a list")
+            kwargs = {'client': client} if request['method'] in CLIENT_METHODS else {}
+            return {'id': request_id, 'result': getattr(self.control, method)(*params, **kwargs)}
+        except (RpcError, ControlError) as e:
+            return {'id': request_id, 'error': {'name': e.name, 'message': str(e)}}
+        except (TypeError, ValueError) as e:
+            return {'id': request_id, 'error': {'name': 'InvalidArgs', 'message': str(e)}}
+        except Exception as e:
+            print(f"Error handling control request: {e}")
+            return {'id': request_id, 'error': {'name': 'Failed', 'message': str(e)}}
+
+
+class _Connection:
+    """One client connection of the RPC server."""
+
+    def __init__(self, server, sock):
+        """Start serving a client.
+
+        Args:
+            server: The RpcServer
+            sock: Accepted client socket
+        """
+        from gi.repository import GLib
+
+        self.server = server
+        self.sock = sock
+        self.sock.setblocking(False)
+        self.inbuf = bytearray()
+        self.outbuf = bytearray()
+        self.closed = False
+        self.client = self._peer_id(sock)
+        self.write_id = None
+        self.read_id = GLib.io_add_watch(
+            sock.fileno(), GLib.PRIORITY_DEFAULT,
+            GLib.IO_IN | GLib.IO_HUP | GLib.IO_ERR, self._on_readable
+        )
+
+    @staticmethod
+    def _peer_id(sock):
+        """Identify the client user for rate limiting.
+
+        Keyed by user rather than process, so a loop starting a new
+        timer-cli process for every call shares one rate limit.
+
+        Args:
+            sock: Accepted client socket
+
+        Returns:
+            "uid:<uid>" from the peer credentials, or a per-connection
+            identifier where SO_PEERCRED isn't available
+        """
+        try:
+            creds = sock.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize('3i'))
+            _, uid, _ = struct.unpack('3i', creds)
+            return f"uid:{uid}"
+        except (AttributeError, OSError):
+            return f"fd:{sock.fileno()}"
+
+    def close(self):
+        """Close the connection and remove its watches."""
+        from gi.repository import GLib
+
+        for source_id in (self.read_id, self.write_id):
+            if source_id:
+                GLib.source_remove(source_id)
+        self.read_id = self.write_id = None
+        self.closed = True
+        self.sock.close()
+        self.server.connections.discard(self)
+
+    @timed('control_socket')
+    def _on_readable(self, fd, condition):
+        """Read what the client sent and answer complete requests.
+
+        Returns:
+            True to keep watching for input
+        """
+        try:
+            data = self.sock.recv(65536)
+        except (BlockingIOError, InterruptedError):
+            return True
+        except OSError:
+            data = b''
+
+        if not data:
+            self.close()
+            return False
+
+        self.inbuf += data
+        self._process()
+        return self.read_id is not None
+
+    def _process(self):
+        """Answer the complete requests in the input buffer."""
+        try:
+            requests = decode_frames(self.inbuf)
+        except ValueError as e:
+            print(f"Warning: Dropping control connection: {e}")
+            self.close()
+            return
+
+        for request in requests:
+            self.outbuf += encode_frame(self.server.dispatch(request, self.client))
+        self._flush()
+
+    def _flush(self):
+        """Write as much pending output as the socket takes."""
+        from gi.repository import GLib
+
+        if self.closed or not self.outbuf:
+            return
+
+        try:
+            sent = self.sock.send(self.outbuf)
+        except (BlockingIOError, InterruptedError):
+            sent = 0
+        except OSError:
+            self.close()
+            return
+        del self.outbuf[:sent]
+
+        if self.outbuf and self.write_id is None:
+            self.write_id = GLib.io_add_watch(
+                self.sock.fileno(), GLib.PRIORITY_DEFAULT, GLib.IO_OUT, self._on_writable
+            )
+        if len(self.outbuf) > MAX_PENDING_OUTPUT and self.read_id:
+            # Back-pressure: read no more until the client catches up
+            GLib.source_remove(self.read_id)
+            self.read_id = None
+
+    def _on_writable(self, fd, condition):
+        """Continue writing pending output.
+
+        Returns:
+            True while output remains
+        """
+        from gi.repository import GLib
+
+        self._flush()
+        if self.closed:
+            return False
+        if self.outbuf:
+            return True
+
+        self.write_id = None
+        if self.read_id is None:
+            self.read_id = GLib.io_add_watch(
+                self.sock.fileno(), GLib.PRIORITY_DEFAULT,
+                GLib.IO_IN | GLib.IO_HUP | GLib.IO_ERR, self._on_readable
+            )
+            # Requests may have arrived while reading was paused
+            self._process()
+        return False
+
+
+class RpcClient:
+    """Blocking client for the control socket.
+
+    Methods of the DBus interface can be called directly, e.g.
+    client.QueryTimers('', 'deadline', 10, 0, []), so the client can stand
+    in for the DBus proxy.
+    """
+
+    def __init__(self, path=None, timeout=10.0):
+        """Connect to the control socket.
+
+        Args:
+            path: Socket path (defaults to get_socket_path())
+            timeout: Socket timeout in seconds
+
+        Raises:
+            OSError: If the app isn't serving the socket
+        """
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(timeout)
+        try:
+            self.sock.connect(str(path or get_socket_path()))
+        except OSError:
+            self.sock.close()
+            raise
+        self.next_id = 1
+        self.inbuf = bytearray()
+        self.responses = []
+
+    def __getattr__(self, name):
+        """Return a callable for an RPC method named like the DBus method.
+
+        Args:
+            name: Method name, e.g. "QueryTimers"
+
+        Returns:
+            Function taking the method's parameters. A DBus-style
+            timeout keyword is accepted and ignored.
+        """
+        if name not in METHODS:
+            raise AttributeError(name)
+        return lambda *params, timeout=None: self.call(name, *params)
+
+    def call(self, method, *params):
+        """Call a method and wait for its result.
+
+        Args:
+            method: Method name
+            *params: Method parameters
+
+        Returns:
+            The method's result
+
+        Raises:
+            RpcError: If the server returned an error
+        """
+        return self.call_many([(method, params)])[0]
+
+    def call_many(self, calls):
+        """Send several calls at once and collect their results in order.
+
+        Args:
+            calls: List of (method, params) tuples
+
+        Returns:
+            List of results
+
+        Raises:
+            RpcError: For the first call the server answered with an error
+        """
+        first_id = self.next_id
+        frames = []
+        for method, params in calls:
+            frames.append(encode_frame(
+                {'id': self.next_id, 'method': method, 'params': list(params)}
+            ))
+            self.next_id += 1
+        self.sock.sendall(b''.join(frames))
+
+        results = []
+        while len(results) < len(calls):
+            response = self._read_response()
+            if response.get('id') != first_id + len(results):
+                raise RpcError('Protocol', f"Unexpected response id {response.get('id')}")
+            if 'error' in response:
+                error = response['error']
+                # Keep the stream in sync before raising
+                for _ in range(len(calls) - len(results) - 1):
+                    self._read_response()
+                raise RpcError(error.get('name', 'Failed'), error.get('message', ''))
+            results.append(response.get('result'))
+        return results
+
+    def _read_response(self):
+        """Read the next response from the socket.
+
+        Returns:
+            Decoded response dictionary
+        """
+        while not self.responses:
+            data = self.sock.recv(65536)
+            if not data:
+                raise ConnectionError("Control socket closed by the app")
+            self.inbuf += data
+            self.responses.extend(decode_frames(self.inbuf))
+        return self.responses.pop(0)
+
+    def close(self):
+        """Close the connection."""
+        self.sock.close()
+
+
+def connect(path=None):
+    """Connect to the app's control socket if it is being served.
+
+    Args:
+        path: Socket path (defaults to get_socket_path())
+
+    Returns:
+        RpcClient, or None if the socket is not available
+    """
+    try:
+        return RpcClient(path)
+    except OSError:
+        return None
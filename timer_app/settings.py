@@ -0,0 +1,76 @@
+import json
+from pathlib import Path
+
+
+# Default values for every tunable setting, grouped by section
+DEFAULTS = {
+    'dispatch': {
+        'queue_size': 256,  # Notification jobs waiting before falling back
+        'timeout_ms': 2000,  # Longest a notification call may block the worker
+    },
+    'hooks': {
+        'on_complete': [],  # Commands or http(s) URLs run for every completion
+        'max_concurrent': 4,  # Hooks allowed to run at the same time
+        'queue_size': 64,  # Hooks waiting before new ones are dropped
+        'timeout_ms': 30000,  # Time limit for a single hook
+    },
+    'limits': {
+        'max_active': 10000,  # Active timers allowed at once (0 for no limit)
+        'rate_per_second': 20,  # Timer creation requests per client per second
+        'burst': 100,  # Requests a client may make at once before the rate applies
+    },
+    'metrics': {
+        'prometheus_port': 0,  # Serve /metrics on this localhost port (0 disables it)
+    },
+    'notifications': {
+        'coalesce_ms': 500,  # Completions within this window share a notification
+        'max_per_minute': 12,  # Rate limit on notification updates
+        'timeout_ms': 5000,  # How long a notification stays on screen
+    },
+    'signals': {
+        'batch_ms': 100,  # DBus lifecycle signals are batched over this window
+        'tick_seconds': 0,  # Interval of the Tick signal (0 disables it)
+    },
+    'sound': {
+        'coalesce_ms': 300,  # Requests within this window play once
+        'max_concurrent': 2,  # Plays allowed to overlap
+    },
+}
+
+
+def get_settings_file_path():
+    """Get the path to the settings file.
+
+    Returns:
+        Path object for the settings file
+    """
+    return Path.home() / '.config' / 'multi-timer-app' / 'settings.json'
+
+
+def load_settings():
+    """Load user settings merged over the defaults.
+
+    The settings file is optional and may set any subset of the keys in
+    DEFAULTS, e.g. {"sound": {"max_concurrent": 1}}.
+
+    Returns:
+        Dictionary of section name -> dictionary of settings
+    """
+    settings = {section: dict(values) for section, values in DEFAULTS.items()}
+
+    path = get_settings_file_path()
+    if not path.exists():
+        return settings
+
+    try:
+        with open(path, 'r') as f:
+            data = json.load(f)
+    except Exception as e:
+        print(f"Warning: Could not load settings: {e}")
+        return settings
+
+    for section, values in data.items():
+        if isinstance(values, dict):
+            settings.setdefault(section, {}).update(values)
+
+    return settings
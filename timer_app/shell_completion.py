@@ -0,0 +1,426 @@
+"""
+Shell completion for timer-cli.
+
+The app keeps a small tab-separated cache of the titles worth completing,
+one "kind<TAB>title[<TAB>duration]" line each, where kind is "timer",
+"paused", "preset" or "history". It is rewritten atomically whenever
+timers, presets or history change. The bash and zsh scripts generated
+from the CLI's argument parser read that file directly, so pressing Tab
+never talks to the app or starts Python.
+
+Arguments opt into dynamic completion with a `completer` attribute on
+their argparse action: a space-separated list of cache kinds, "duration"
+(durations of the presets matching the title argument) or "files".
+"""
+import os
+import argparse
+from pathlib import Path
+from timer_app.locks import create_lock
+from timer_app.metrics import timed
+
+
+def get_completion_cache_path():
+    """Get the path of the completion cache.
+
+    Returns:
+        Path under $XDG_CACHE_HOME (default ~/.cache)
+    """
+    cache_home = os.environ.get('XDG_CACHE_HOME') or str(Path.home() / '.cache')
+    return Path(cache_home) / 'multi-timer-app' / 'completion.tsv'
+
+
+class CompletionCache:
+    """Keeps the completion cache file in sync with a running app.
+
+    invalidate() may be called from any thread; changes are coalesced and
+    the file is rewritten once on the GLib main loop after delay_ms.
+    """
+
+    # History is unbounded, so only the most relevant titles are cached
+    HISTORY_LIMIT = 200
+
+    def __init__(self, timer_app, path=None, delay_ms=250):
+        """Initialize the cache writer.
+
+        Args:
+            timer_app: The TimerCore whose state is cached
+            path: Cache file path (defaults to get_completion_cache_path())
+            delay_ms: Quiet period before a change is written
+        """
+        self.timer_app = timer_app
+        self.path = Path(path) if path else get_completion_cache_path()
+        self.delay_ms = delay_ms
+        self.lock = create_lock('completion_cache')
+        self.source_id = None
+
+    def invalidate(self):
+        """Schedule a rewrite of the cache file."""
+        from gi.repository import GLib
+
+        with self.lock:
+            if self.source_id is None:
+                self.source_id = GLib.timeout_add(self.delay_ms, self._on_timeout)
+
+    @timed('completion_cache')
+    def _on_timeout(self):
+        """Write the cache once the quiet period is over.
+
+        Returns:
+            False to remove the timeout
+        """
+        with self.lock:
+            self.source_id = None
+        self.write()
+        return False
+
+    def stop(self):
+        """Cancel a pending rewrite."""
+        from gi.repository import GLib
+
+        with self.lock:
+            if self.source_id is not None:
+                GLib.source_remove(self.source_id)
+                self.source_id = None
+
+    def build_lines(self):
+        """Collect the cache entries from the app.
+
+        Returns:
+            List of lines without newlines
+        """
+        from timer_app.utils import format_duration
+
+        lines = []
+        for timer in self.timer_app.timer_manager.get_all_timers():
+            lines.append(('paused' if timer.is_paused else 'timer', timer.title, ''))
+        for preset in self.timer_app.timer_presets.get_presets():
+            seconds = preset['hours'] * 3600 + preset['minutes'] * 60 + preset['seconds']
+            lines.append(('preset', preset['title'], format_duration(seconds).replace(' ', '')))
+        for title in self.timer_app.timer_history.get_titles(limit=self.HISTORY_LIMIT):
+            lines.append(('history', title, ''))
+
+        result = []
+        seen = set()
+        for kind, title, extra in lines:
+            # Titles with tabs or newlines can't be represented in the file
+            if not title or any(c in title for c in '\t\r\n') or (kind, title) in seen:
+                continue
+            seen.add((kind, title))
+            result.append(f"{kind}\t{title}\t{extra}" if extra else f"{kind}\t{title}")
+        return result
+
+    def write(self):
+        """Rewrite the cache file.
+
+        The file is written to a temporary name and renamed into place, so
+        a completion never reads a half-written file.
+        """
+        tmp_path = self.path.with_suffix('.tmp')
+        try:
+            lines = self.build_lines()
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, 'w') as f:
+                f.write(''.join(line + '\n' for line in lines))
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            print(f"Warning: Could not write completion cache: {e}")
+
+
+def _commands(parser):
+    """Describe the subcommands of an argument parser.
+
+    Args:
+        parser: The top-level argparse.ArgumentParser
+
+    Returns:
+        List of dictionaries with name, help, options (option strings),
+        value_options (option string -> choices or completer, for options
+        that take a value) and positionals (completer of each positional)
+    """
+    commands = []
+    for action in parser._actions:
+        if not isinstance(action, argparse._SubParsersAction):
+            continue
+        helps = {a.dest: a.help or '' for a in action._choices_actions}
+        for name, subparser in action.choices.items():
+            command = {
+                'name': name,
+                'help': helps.get(name, ''),
+                'options': [],
+                'value_options': {},
+                'positionals': [],
+            }
+            for sub_action in subparser._actions:
+                if sub_action.choices:
+                    completer = list(sub_action.choices)
+                else:
+                    completer = getattr(sub_action, 'completer', '')
+                if not sub_action.option_strings:
+                    command['positionals'].append(completer)
+                    continue
+                command['options'].extend(sub_action.option_strings)
+                if sub_action.nargs != 0:
+                    for option in sub_action.option_strings:
+                        command['value_options'][option] = completer
+            commands.append(command)
+    return commands
+
+
+def _bash_complete(completer):
+    """Bash statements completing one argument.
+
+    Args:
+        completer: List of choices, or a completer string
+
+    Returns:
+        Shell code that fills COMPREPLY
+    """
+    if isinstance(completer, list):
+        words = ' '.join(completer)
+        return f'COMPREPLY=($(compgen -W "{words}" -- "$cur"))'
+    if completer == 'files':
+        return 'COMPREPLY=($(compgen -f -- "$cur"))'
+    if completer == 'duration':
+        return '_timer_cli_cached duration "$first"'
+    if completer:
+        return f'_timer_cli_cached "{completer}"'
+    return ':'
+
+
+BASH_TEMPLATE = r'''# bash completion for timer-cli, generated by "timer-cli completion bash"
+#
+# Titles come from the cache file kept up to date by the running app.
+
+_timer_cli_cached() {
+    # $1: space-separated cache kinds, or "duration" to complete the
+    # durations of the presets titled $2
+    local cache="${XDG_CACHE_HOME:-$HOME/.cache}/multi-timer-app/completion.tsv"
+    [[ -r $cache ]] || return
+    local kind title extra quoted
+    local want=" $1 " match="${cur#[\"\']}"
+    match="${match,,}"
+    while IFS=$'\t' read -r kind title extra; do
+        if [[ $1 == duration ]]; then
+            [[ $kind == preset && ${title,,} == "${2,,}" ]] || continue
+            [[ $extra == "$cur"* ]] && COMPREPLY+=("$extra")
+            continue
+        fi
+        [[ $want == *" $kind "* && ${title,,} == "$match"* ]] || continue
+        printf -v quoted '%%q' "$title"
+        COMPREPLY+=("$quoted")
+    done < "$cache"
+}
+
+_timer_cli() {
+    local cur="${COMP_WORDS[COMP_CWORD]}" prev="${COMP_WORDS[COMP_CWORD-1]}"
+    local cmd= first= pos=0 skip= i w
+    COMPREPLY=()
+
+    for ((i = 1; i < COMP_CWORD; i++)); do
+        w="${COMP_WORDS[i]}"
+        if [[ -n $skip ]]; then
+            skip=
+        elif [[ -z $cmd ]]; then
+            [[ $w == -* ]] || cmd="$w"
+        elif [[ $w == -* ]]; then
+            case "$cmd $w" in
+%(value_options)s
+            esac
+        else
+            if ((pos == 0)); then
+                first="${w//\\/}"
+                first="${first//[\"\']/}"
+            fi
+            ((pos++))
+        fi
+    done
+
+    if [[ -z $cmd ]]; then
+        COMPREPLY=($(compgen -W "%(commands)s -h --help" -- "$cur"))
+        return
+    fi
+
+    case "$cmd $prev" in
+%(option_values)s
+    esac
+
+    if [[ $cur == -* ]]; then
+        case "$cmd" in
+%(options)s
+        esac
+        return
+    fi
+
+    case "$cmd $pos" in
+%(positionals)s
+    esac
+}
+
+complete -F _timer_cli timer-cli
+'''
+
+
+def bash_script(parser):
+    """Generate the bash completion script.
+
+    Args:
+        parser: The timer-cli argparse.ArgumentParser
+
+    Returns:
+        Script text
+    """
+    commands = _commands(parser)
+    indent = ' ' * 16
+    value_options = []
+    option_values = []
+    options = []
+    positionals = []
+    for command in commands:
+        name = command['name']
+        for option, completer in command['value_options'].items():
+            value_options.append(f'{indent}"{name} {option}") skip=1 ;;')
+            option_values.append(
+                f'{indent[8:]}"{name} {option}") {_bash_complete(completer)}; return ;;'
+            )
+        words = ' '.join(command['options'])
+        options.append(f'{indent[4:]}{name}) COMPREPLY=($(compgen -W "{words}" -- "$cur")) ;;')
+        for index, completer in enumerate(command['positionals']):
+            if completer:
+                positionals.append(f'{indent[8:]}"{name} {index}") {_bash_complete(completer)} ;;')
+
+    return BASH_TEMPLATE % {
+        'commands': ' '.join(c['name'] for c in commands),
+        'value_options': '\n'.join(value_options) or f'{indent}*) ;;',
+        'option_values': '\n'.join(option_values) or f'{indent[8:]}*) ;;',
+        'options': '\n'.join(options) or f'{indent[4:]}*) ;;',
+        'positionals': '\n'.join(positionals) or f'{indent[8:]}*) ;;',
+    }
+
+
+def _zsh_complete(completer):
+    """Zsh statements completing one argument.
+
+    Args:
+        completer: List of choices, or a completer string
+
+    Returns:
+        Shell code that adds matches
+    """
+    if isinstance(completer, list):
+        return f"compadd -- {' '.join(completer)}"
+    if completer == 'files':
+        return '_files'
+    if completer == 'duration':
+        return '_timer_cli_cached duration "$first"'
+    if completer:
+        return f'_timer_cli_cached "{completer}"'
+    return ':'
+
+
+ZSH_TEMPLATE = r'''#compdef timer-cli
+# zsh completion for timer-cli, generated by "timer-cli completion zsh"
+#
+# Titles come from the cache file kept up to date by the running app.
+
+_timer_cli_cached() {
+    # $1: space-separated cache kinds, or "duration" to complete the
+    # durations of the presets titled $2
+    local cache="${XDG_CACHE_HOME:-$HOME/.cache}/multi-timer-app/completion.tsv"
+    [[ -r $cache ]] || return 1
+    local kind title extra
+    local -a matches
+    while IFS=$'\t' read -r kind title extra; do
+        if [[ $1 == duration ]]; then
+            [[ $kind == preset && ${(L)title} == ${(L)2} ]] && matches+=("$extra")
+        elif [[ " $1 " == *" $kind "* ]]; then
+            matches+=("$title")
+        fi
+    done < "$cache"
+    compadd -M 'm:{a-zA-Z}={A-Za-z}' -a matches
+}
+
+_timer_cli() {
+    local -a commands
+    commands=(
+%(commands)s
+    )
+
+    local cmd= first= pos=0 skip= i w
+    for ((i = 2; i < CURRENT; i++)); do
+        w="${words[i]}"
+        if [[ -n $skip ]]; then
+            skip=
+        elif [[ -z $cmd ]]; then
+            [[ $w == -* ]] || cmd="$w"
+        elif [[ $w == -* ]]; then
+            case "$cmd $w" in
+%(value_options)s
+            esac
+        else
+            ((pos == 0)) && first="${(Q)w}"
+            ((pos++))
+        fi
+    done
+
+    if [[ -z $cmd ]]; then
+        _describe command commands
+        return
+    fi
+
+    case "$cmd ${words[CURRENT-1]}" in
+%(option_values)s
+    esac
+
+    if [[ ${words[CURRENT]} == -* ]]; then
+        case "$cmd" in
+%(options)s
+        esac
+        return
+    fi
+
+    case "$cmd $pos" in
+%(positionals)s
+    esac
+}
+
+_timer_cli "$@"
+'''
+
+
+def zsh_script(parser):
+    """Generate the zsh completion script.
+
+    Args:
+        parser: The timer-cli argparse.ArgumentParser
+
+    Returns:
+        Script text
+    """
+    commands = _commands(parser)
+    indent = ' ' * 16
+    command_lines = []
+    value_options = []
+    option_values = []
+    options = []
+    positionals = []
+    for command in commands:
+        name = command['name']
+        description = command['help'].replace("'", "'\\''").replace(':', '\\:')
+        command_lines.append(f"{indent[8:]}'{name}:{description}'")
+        for option, completer in command['value_options'].items():
+            value_options.append(f'{indent}"{name} {option}") skip=1 ;;')
+            option_values.append(
+                f'{indent[8:]}"{name} {option}") {_zsh_complete(completer)}; return ;;'
+            )
+        options.append(f"{indent[4:]}{name}) compadd -- {' '.join(command['options'])} ;;")
+        for index, completer in enumerate(command['positionals']):
+            if completer:
+                positionals.append(f'{indent[8:]}"{name} {index}") {_zsh_complete(completer)} ;;')
+
+    return ZSH_TEMPLATE % {
+        'commands': '\n'.join(command_lines),
+        'value_options': '\n'.join(value_options) or f'{indent}*) ;;',
+        'option_values': '\n'.join(option_values) or f'{indent[8:]}*) ;;',
+        'options': '\n'.join(options) or f'{indent[4:]}*) ;;',
+        'positionals': '\n'.join(positionals) or f'{indent[8:]}*) ;;',
+    }
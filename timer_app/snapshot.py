@@ -0,0 +1,494 @@
+"""
+Memory-mapped snapshot of the active timers.
+
+The app publishes its timers in a fixed-layout file next to the control
+socket ($XDG_RUNTIME_DIR/multi-timer/snapshot). Status bars, prompts and
+`timer-cli list` can map it and read a consistent view without any IPC.
+
+Layout (little-endian):
+
+    header (64 bytes):
+        0  magic      4s   b'MTSN'
+        4  layout     u32  LAYOUT_VERSION
+        8  seq        u64  seqlock counter, odd while an update is in progress
+        16 flags      u32  FLAG_CLOSED once the file is stale
+        20 count      u32  number of records
+        24 capacity   u32  records the file has room for
+        28 pid        u32  process id of the publishing app
+        32 version    u64  TimerManager.version of the snapshot
+        40 published  f64  Unix time of the update
+
+    record (192 bytes each, soonest deadline first):
+        0   deadline     f64  Unix time the timer completes
+        8   remaining    f64  seconds left, for paused timers (whose
+                              deadline is only valid at publish time)
+        16  created_at   f64  Unix time the timer was created
+        24  flags        u32  RECORD_PINNED | RECORD_PAUSED | RECORD_TRUNCATED
+        28  id           36s  ASCII UUID
+        64  title        128s UTF-8, NUL padded, cut at a character boundary
+
+A writer bumps seq to odd, writes the records and the other header fields,
+then bumps seq to even. A reader copies the data between two reads of seq
+and retries if they differ or are odd. When the file has to grow, a new
+one is renamed into place and the old one is marked FLAG_CLOSED so mapped
+readers reopen the path.
+"""
+import os
+import mmap
+import time
+import struct
+import fnmatch
+from collections import namedtuple
+from timer_app.locks import create_lock
+from timer_app.metrics import timed
+
+MAGIC = b'MTSN'
+LAYOUT_VERSION = 1
+
+HEADER = struct.Struct('<4sIQIIIIQd16x')
+SEQ = struct.Struct('<Q')
+SEQ_OFFSET = 8
+STATE = struct.Struct('<IIIIQd')  # Header fields after seq
+STATE_OFFSET = 16
+RECORD = struct.Struct('<dddI36s128s')
+
+FLAG_CLOSED = 1
+
+RECORD_PINNED = 1
+RECORD_PAUSED = 2
+RECORD_TRUNCATED = 4  # Title was longer than the record holds
+
+TITLE_BYTES = 128
+
+SnapshotTimer = namedtuple(
+    'SnapshotTimer',
+    ['id', 'title', 'deadline', 'remaining', 'created_at', 'pinned', 'paused']
+)
+Snapshot = namedtuple('Snapshot', ['version', 'published', 'pid', 'timers'])
+
+
+def get_snapshot_path():
+    """Get the path of the snapshot file.
+
+    Returns:
+        Path object next to the control socket
+    """
+    from timer_app.rpc import get_socket_path
+
+    return get_socket_path().with_name('snapshot')
+
+
+def _pid_alive(pid):
+    """Check whether a process exists.
+
+    Args:
+        pid: Process id
+
+    Returns:
+        True if the process exists
+    """
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _encode_title(title):
+    """Encode a title for a record.
+
+    Args:
+        title: Timer title
+
+    Returns:
+        Tuple of (UTF-8 bytes of at most TITLE_BYTES, whether it was cut)
+    """
+    data = title.encode('utf-8')
+    if len(data) <= TITLE_BYTES:
+        return data, False
+    return data[:TITLE_BYTES].decode('utf-8', 'ignore').encode('utf-8'), True
+
+
+class SnapshotWriter:
+    """Publishes timer snapshots into the memory-mapped file."""
+
+    def __init__(self, path=None, capacity=256):
+        """Initialize the writer.
+
+        Args:
+            path: Snapshot file path (defaults to get_snapshot_path())
+            capacity: Records the file has room for initially; the file
+                is replaced with a larger one when needed
+        """
+        self.path = path or get_snapshot_path()
+        self.capacity = capacity
+        self.mm = None
+        self.seq = 0
+
+    def open(self):
+        """Create the snapshot file with no timers.
+
+        Raises:
+            OSError: If the file can't be created or another running
+                instance is publishing it
+        """
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        os.chmod(self.path.parent, 0o700)
+
+        try:
+            existing = read_snapshot(self.path)
+        except (FileNotFoundError, ValueError, RuntimeError):
+            existing = None  # Missing, corrupt or left over by an instance that exited
+        if existing is not None and existing.pid != os.getpid():
+            raise OSError(f"Another instance is publishing {self.path}")
+
+        self.mm = self._create(self.capacity)
+        os.replace(self.path.with_suffix('.tmp'), self.path)
+
+    def _create(self, capacity):
+        """Create an empty snapshot file under a temporary name.
+
+        The caller renames it into place once it holds the data readers
+        should see first.
+
+        Args:
+            capacity: Number of records the file has room for
+
+        Returns:
+            Writable mmap of the new file
+        """
+        size = HEADER.size + capacity * RECORD.size
+        fd = os.open(self.path.with_suffix('.tmp'), os.O_RDWR | os.O_CREAT | os.O_TRUNC, 0o600)
+        try:
+            os.ftruncate(fd, size)
+            mm = mmap.mmap(fd, size)
+        finally:
+            os.close(fd)
+
+        HEADER.pack_into(
+            mm, 0, MAGIC, LAYOUT_VERSION, self.seq, 0, 0, capacity, os.getpid(), 0, time.time()
+        )
+        self.capacity = capacity
+        return mm
+
+    def _mark_closed(self, mm):
+        """Tell readers still mapping a file that it is stale.
+
+        Args:
+            mm: The file's mmap
+        """
+        self.seq += 1
+        SEQ.pack_into(mm, SEQ_OFFSET, self.seq)
+        STATE.pack_into(mm, STATE_OFFSET, FLAG_CLOSED, 0, 0, 0, 0, time.time())
+        self.seq += 1
+        SEQ.pack_into(mm, SEQ_OFFSET, self.seq)
+
+    def publish(self, timers, version):
+        """Replace the published timers.
+
+        Args:
+            timers: List of (id, title, deadline, remaining, created_at,
+                pinned, paused) in the order readers should see them
+            version: TimerManager.version the timers correspond to
+        """
+        old = None
+        if len(timers) > self.capacity:
+            capacity = self.capacity
+            while capacity < len(timers):
+                capacity *= 2
+            old = self.mm
+            self.mm = self._create(capacity)
+
+        records = []
+        for timer_id, title, deadline, remaining, created_at, pinned, paused in timers:
+            title_bytes, truncated = _encode_title(title)
+            flags = (
+                (RECORD_PINNED if pinned else 0)
+                | (RECORD_PAUSED if paused else 0)
+                | (RECORD_TRUNCATED if truncated else 0)
+            )
+            records.append(RECORD.pack(
+                deadline, remaining, created_at, flags,
+                timer_id.encode('ascii', 'replace'), title_bytes
+            ))
+        data = b''.join(records)
+
+        mm = self.mm
+        self.seq += 1
+        SEQ.pack_into(mm, SEQ_OFFSET, self.seq)
+        mm[HEADER.size:HEADER.size + len(data)] = data
+        STATE.pack_into(
+            mm, STATE_OFFSET, 0, len(timers), self.capacity, os.getpid(), version, time.time()
+        )
+        self.seq += 1
+        SEQ.pack_into(mm, SEQ_OFFSET, self.seq)
+
+        if old is not None:
+            # Readers of the old file reopen the path and find the new one
+            os.replace(self.path.with_suffix('.tmp'), self.path)
+            self._mark_closed(old)
+            old.close()
+
+    def close(self):
+        """Mark the file stale and remove it."""
+        if self.mm is None:
+            return
+        self._mark_closed(self.mm)
+        self.mm.close()
+        self.mm = None
+        try:
+            self.path.unlink()
+        except OSError:
+            pass
+
+
+class SnapshotReader:
+    """Reads consistent timer snapshots from the memory-mapped file.
+
+    The file is mapped once and reopened only when the app replaces it.
+    The decoded timers are kept until the sequence number changes, so
+    polling an unchanged snapshot costs a few header reads.
+    """
+
+    def __init__(self, path=None, max_retries=1000):
+        """Initialize the reader.
+
+        Args:
+            path: Snapshot file path (defaults to get_snapshot_path())
+            max_retries: Attempts before giving up on a snapshot that keeps
+                changing while it is copied
+        """
+        self.path = path or get_snapshot_path()
+        self.max_retries = max_retries
+        self.mm = None
+        self.cached_seq = None
+        self.cached = None
+
+    def _open(self):
+        """Map the snapshot file.
+
+        Raises:
+            FileNotFoundError: If no app is publishing a snapshot
+            ValueError: If the file isn't a snapshot this reader understands
+        """
+        self.close()
+        with open(self.path, 'rb') as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(mm) < HEADER.size or mm[:4] != MAGIC:
+            mm.close()
+            raise ValueError(f"Not a timer snapshot: {self.path}")
+        if struct.unpack_from('<I', mm, 4)[0] != LAYOUT_VERSION:
+            mm.close()
+            raise ValueError(f"Unsupported snapshot layout in {self.path}")
+        self.mm = mm
+
+    def read(self):
+        """Read the current snapshot.
+
+        Returns:
+            Snapshot with timers as a list of SnapshotTimer, soonest first
+
+        Raises:
+            FileNotFoundError: If no running app is publishing a snapshot
+            ValueError: If the file is invalid
+            RuntimeError: If no consistent copy could be made
+        """
+        for _ in range(self.max_retries):
+            if self.mm is None:
+                self._open()
+            mm = self.mm
+
+            seq = SEQ.unpack_from(mm, SEQ_OFFSET)[0]
+            if seq & 1:
+                time.sleep(0)
+                continue
+            flags, count, _, pid, version, published = STATE.unpack_from(mm, STATE_OFFSET)
+            if flags & FLAG_CLOSED:
+                # Replaced by a larger file, or the app exited
+                self.close()
+                continue
+            if not _pid_alive(pid):
+                self.close()
+                raise FileNotFoundError(f"Snapshot publisher {pid} is not running")
+            if seq == self.cached_seq:
+                return self.cached._replace(timers=list(self.cached.timers))
+
+            end = HEADER.size + count * RECORD.size
+            data = mm[HEADER.size:end] if end <= len(mm) else None
+            if SEQ.unpack_from(mm, SEQ_OFFSET)[0] != seq or data is None:
+                continue
+
+            self.cached_seq = seq
+            self.cached = Snapshot(version, published, pid, self._decode(data))
+            return self.cached._replace(timers=list(self.cached.timers))
+
+        raise RuntimeError("Snapshot kept changing while it was read")
+
+    @staticmethod
+    def _decode(data):
+        """Decode the records of a snapshot.
+
+        A paused timer's deadline is when it would have completed had it
+        been resumed at the time of publishing; use its remaining seconds.
+
+        Args:
+            data: Bytes of the records
+
+        Returns:
+            List of SnapshotTimer
+        """
+        return [
+            SnapshotTimer(
+                timer_id.decode('ascii'),
+                title.rstrip(b'\0').decode('utf-8', 'replace'),
+                deadline, remaining, created_at,
+                bool(flags & RECORD_PINNED), bool(flags & RECORD_PAUSED)
+            )
+            for deadline, remaining, created_at, flags, timer_id, title
+            in RECORD.iter_unpack(data)
+        ]
+
+    def close(self):
+        """Unmap the file."""
+        if self.mm is not None:
+            self.mm.close()
+            self.mm = None
+        self.cached_seq = None
+        self.cached = None
+
+
+def read_snapshot(path=None):
+    """Read the current snapshot once.
+
+    Args:
+        path: Snapshot file path (defaults to get_snapshot_path())
+
+    Returns:
+        Snapshot
+
+    Raises:
+        FileNotFoundError: If no running app is publishing a snapshot
+        ValueError: If the file is invalid
+    """
+    reader = SnapshotReader(path)
+    try:
+        return reader.read()
+    finally:
+        reader.close()
+
+
+def query_snapshot(timers, title_filter='', sort_key='deadline', limit=0):
+    """Filter and sort snapshot timers like TimerManager.query_timers().
+
+    Args:
+        timers: List of SnapshotTimer
+        title_filter: Case-insensitive substring, or glob if it contains
+            *, ? or [ ('' for all)
+        sort_key: "deadline", "title" or "created", "-" prefix for descending
+        limit: Maximum number of timers to return (0 for no limit)
+
+    Returns:
+        Tuple of (total matching timers, list of SnapshotTimer)
+
+    Raises:
+        ValueError: If sort_key is unknown
+    """
+    keys = {
+        'deadline': lambda t: (t.paused, t.remaining if t.paused else t.deadline, t.created_at),
+        'title': lambda t: (t.title.casefold(), t.deadline),
+        'created': lambda t: t.created_at,
+    }
+    key = keys.get(sort_key.lstrip('-') or 'deadline')
+    if key is None:
+        raise ValueError(f"Unknown sort key: {sort_key}")
+
+    if title_filter:
+        folded = title_filter.casefold()
+        if any(c in folded for c in '*?['):
+            timers = [t for t in timers if fnmatch.fnmatchcase(t.title.casefold(), folded)]
+        else:
+            timers = [t for t in timers if folded in t.title.casefold()]
+
+    timers = sorted(timers, key=key, reverse=sort_key.startswith('-'))
+    return len(timers), timers[:limit] if limit > 0 else timers
+
+
+class SnapshotPublisher:
+    """Keeps the snapshot file in sync with a TimerManager.
+
+    Changes may be reported from any thread; they are coalesced and the
+    snapshot is rewritten once on the GLib main loop when it is idle.
+    """
+
+    def __init__(self, timer_manager, path=None):
+        """Initialize the publisher.
+
+        Args:
+            timer_manager: TimerManager to publish
+            path: Snapshot file path (defaults to get_snapshot_path())
+        """
+        self.timer_manager = timer_manager
+        self.writer = SnapshotWriter(path)
+        self.lock = create_lock('snapshot')
+        self.source_id = None
+        self.stopped = False
+
+    def start(self):
+        """Create the snapshot file and follow the manager's changes.
+
+        Raises:
+            OSError: If the file can't be created or another instance is
+                publishing it
+        """
+        self.writer.open()
+        self.timer_manager.add_event_callback(lambda event, timer: self.invalidate())
+        self.timer_manager.add_pin_change_callback(self.invalidate)
+        self.publish()
+
+    def invalidate(self):
+        """Schedule a snapshot update."""
+        from gi.repository import GLib
+
+        with self.lock:
+            if self.source_id is None and not self.stopped:
+                self.source_id = GLib.idle_add(self._on_idle)
+
+    @timed('snapshot')
+    def _on_idle(self):
+        """Publish once the main loop is idle.
+
+        Returns:
+            False to remove the idle callback
+        """
+        with self.lock:
+            self.source_id = None
+        self.publish()
+        return False
+
+    def publish(self):
+        """Write the manager's current timers to the snapshot."""
+        manager = self.timer_manager
+        version = manager.version
+        pinned_id = manager.get_pinned_timer_id()
+        timers = sorted(manager.get_all_timers(), key=manager.SORT_KEYS['deadline'])
+        try:
+            self.writer.publish([
+                (t.id, t.title, t.deadline_epoch, t.paused_remaining or 0.0,
+                 t.created_at.timestamp(), t.id == pinned_id, t.is_paused)
+                for t in timers
+            ], version)
+        except Exception as e:
+            print(f"Warning: Could not publish timer snapshot: {e}")
+
+    def stop(self):
+        """Stop publishing and remove the snapshot file."""
+        from gi.repository import GLib
+
+        with self.lock:
+            self.stopped = True
+            if self.source_id is not None:
+                GLib.source_remove(self.source_id)
+                self.source_id = None
+        self.writer.close()
@@ -1,15 +1,47 @@
 import os
 import json
+import math
+import time
 from pathlib import Path
 
 
 class TimerHistory:
-    """Manages history of timer titles for autocomplete."""
+    """Manages history of timer titles for autocomplete.
+
+    Titles are stored in an SQLite database by default, which keeps every
+    title ever used together with its use count and last-used time. If
+    SQLite cannot be used the manager falls back to the original JSON file
+    that keeps only the most recent 50 titles.
+    """
+
+    MAX_JSON_TITLES = 50
+
+    def __init__(self, backend=None):
+        """Initialize the timer history manager.
+
+        Args:
+            backend: "sqlite" or "json". Defaults to the
+                MULTI_TIMER_HISTORY_BACKEND environment variable, or "sqlite".
+        """
+        if backend is None:
+            backend = os.environ.get('MULTI_TIMER_HISTORY_BACKEND', 'sqlite')
 
-    def __init__(self):
-        """Initialize the timer history manager."""
         self.history_file = self._get_history_file_path()
-        self.titles = self._load_history()
+        self.store = None
+        self.titles = []
+
+        if backend == 'sqlite':
+            try:
+                self.store = SQLiteTitleStore(
+                    self.history_file.with_suffix('.db'),
+                    legacy_json_path=self.history_file
+                )
+            except Exception as e:
+                print(f"Warning: Could not open SQLite history, using JSON: {e}")
+                self.store = None
+
+        if self.store is None:
+            self.titles = self._load_history()
 
     def _get_history_file_path(self):
         """Get the path to the history file.
@@ -57,6 +89,13 @@ class TimerHistory:
 
         title = title.strip()
 
+        if self.store is not None:
+            try:
+                self.store.record_use(title)
+            except Exception as e:
+                print(f"Warning: Could not save timer history: {e}")
+            return
+
         # Remove title if it already exists (we'll add it to the front)
         if title in self.titles:
             self.titles.remove(title)
@@ -64,20 +103,260 @@ class TimerHistory:
         # Add to the beginning (most recent first)
         self.titles.insert(0, title)
 
-        # Keep only the most recent 50 titles
-        self.titles = self.titles[:50]
+        # Keep only the most recent titles
+        self.titles = self.titles[:self.MAX_JSON_TITLES]
 
         self._save_history()
 
-    def get_titles(self):
-        """Get all timer titles in history.
+    def add_titles(self, titles):
+        """Add several timer titles to history in one write.
+
+        Args:
+            titles: Iterable of timer titles, oldest first
+        """
+        titles = [t.strip() for t in titles if t and t.strip()]
+        if not titles:
+            return
+
+        if self.store is not None:
+            try:
+                self.store.record_uses(titles)
+            except Exception as e:
+                print(f"Warning: Could not save timer history: {e}")
+            return
+
+        for title in titles:
+            if title in self.titles:
+                self.titles.remove(title)
+            self.titles.insert(0, title)
+        self.titles = self.titles[:self.MAX_JSON_TITLES]
+        self._save_history()
+
+    def get_titles(self, prefix=None, limit=None):
+        """Get timer titles in history.
+
+        Args:
+            prefix: Only return titles starting with this text (case-insensitive)
+            limit: Maximum number of titles to return (None for all)
 
         Returns:
-            List of timer titles
+            List of timer titles, most relevant first
         """
-        return self.titles.copy()
+        if self.store is not None:
+            try:
+                return self.store.get_titles(prefix=prefix, limit=limit)
+            except Exception as e:
+                print(f"Warning: Could not read timer history: {e}")
+                return []
+
+        titles = self.titles
+        if prefix:
+            folded = prefix.casefold()
+            titles = [t for t in titles if t.casefold().startswith(folded)]
+        if limit is not None:
+            titles = titles[:limit]
+        return list(titles)
 
     def clear_history(self):
         """Clear all timer title history."""
+        if self.store is not None:
+            self.store.clear()
+            return
+
         self.titles = []
         self._save_history()
+
+
+class SQLiteTitleStore:
+    """SQLite storage for timer titles ranked by frecency.
+
+    Every title is kept with its use count and last-used time. The table is
+    indexed on the case-folded title so prefix lookups are range scans, and
+    the database runs in WAL mode so readers (e.g. timer-cli) never block
+    the app while it writes.
+    """
+
+    # Recency weight halves every week
+    HALF_LIFE_SECONDS = 7 * 24 * 3600
+
+    def __init__(self, db_path, legacy_json_path=None, readonly=False):
+        """Open (and create if needed) the title database.
+
+        Args:
+            db_path: Path to the SQLite database file
+            legacy_json_path: Path to the old JSON history file to migrate
+            readonly: Open an existing database without writing to it
+        """
+        import sqlite3
+
+        self.db_path = Path(db_path)
+        if readonly:
+            self.conn = sqlite3.connect(
+                f"file:{self.db_path}?mode=ro", uri=True, timeout=2.0
+            )
+            self.conn.create_function("frecency", 3, self._frecency)
+            return
+
+        self.conn = sqlite3.connect(str(self.db_path), timeout=2.0)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.create_function("frecency", 3, self._frecency)
+        self._create_schema()
+
+        if legacy_json_path is not None:
+            self._migrate_json(Path(legacy_json_path))
+
+    @classmethod
+    def _frecency(cls, use_count, last_used, now):
+        """Score a title by how often and how recently it was used.
+
+        Args:
+            use_count: Number of times the title was used
+            last_used: Unix timestamp of the last use
+            now: Unix timestamp to score against
+
+        Returns:
+            Float score, higher is more relevant
+        """
+        age = max(0.0, now - last_used)
+        return use_count * math.pow(0.5, age / cls.HALF_LIFE_SECONDS)
+
+    def _create_schema(self):
+        """Create the titles table and its indexes."""
+        with self.conn:
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS titles ("
+                " title TEXT PRIMARY KEY,"
+                " folded TEXT NOT NULL,"
+                " use_count INTEGER NOT NULL DEFAULT 0,"
+                " last_used REAL NOT NULL)"
+            )
+            self.conn.execute(
+                "CREATE INDEX IF NOT EXISTS titles_folded ON titles(folded)"
+            )
+
+    def _migrate_json(self, json_path):
+        """Import titles from the legacy JSON history file once.
+
+        The JSON list is ordered most recent first, so titles get strictly
+        decreasing last-used times to keep that order. The JSON file is
+        renamed afterwards so the migration runs only once.
+
+        Args:
+            json_path: Path to timer_history.json
+        """
+        if not json_path.exists():
+            return
+
+        try:
+            with open(json_path, 'r') as f:
+                titles = json.load(f).get('titles', [])
+        except Exception as e:
+            print(f"Warning: Could not migrate timer history: {e}")
+            return
+
+        now = time.time()
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO titles (title, folded, use_count, last_used)"
+                " VALUES (?, ?, 1, ?)",
+                [(t, t.casefold(), now - i) for i, t in enumerate(titles) if t]
+            )
+
+        try:
+            json_path.rename(json_path.with_name(json_path.name + '.migrated'))
+        except OSError as e:
+            print(f"Warning: Could not rename migrated history file: {e}")
+
+    def record_use(self, title, now=None):
+        """Record one use of a title.
+
+        Args:
+            title: Timer title
+            now: Unix timestamp of the use (defaults to current time)
+        """
+        if now is None:
+            now = time.time()
+
+        with self.conn:
+            self.conn.execute(
+                "INSERT INTO titles (title, folded, use_count, last_used)"
+                " VALUES (?, ?, 1, ?)"
+                " ON CONFLICT(title) DO UPDATE SET"
+                " use_count = use_count + 1, last_used = excluded.last_used",
+                (title, title.casefold(), now)
+            )
+
+    def record_uses(self, titles, now=None):
+        """Record one use of each title in a single transaction.
+
+        Args:
+            titles: Iterable of titles, oldest first
+            now: Unix timestamp of the last use (defaults to current time)
+        """
+        if now is None:
+            now = time.time()
+
+        titles = list(titles)
+        # Space the uses out slightly so later titles rank as more recent
+        start = now - len(titles) * 0.001
+        with self.conn:
+            self.conn.executemany(
+                "INSERT INTO titles (title, folded, use_count, last_used)"
+                " VALUES (?, ?, 1, ?)"
+                " ON CONFLICT(title) DO UPDATE SET"
+                " use_count = use_count + 1, last_used = excluded.last_used",
+                [(t, t.casefold(), start + i * 0.001) for i, t in enumerate(titles)]
+            )
+
+    def get_titles(self, prefix=None, limit=None, now=None):
+        """Get titles ordered by frecency.
+
+        Args:
+            prefix: Only return titles starting with this text (case-insensitive)
+            limit: Maximum number of titles to return (None for all)
+            now: Unix timestamp to score against (defaults to current time)
+
+        Returns:
+            List of titles
+        """
+        return [row[0] for row in self.iter_entries(prefix, limit, now)]
+
+    def iter_entries(self, prefix=None, limit=None, now=None):
+        """Iterate over history entries ordered by frecency.
+
+        Args:
+            prefix: Only return titles starting with this text (case-insensitive)
+            limit: Maximum number of entries to return (None for all)
+            now: Unix timestamp to score against (defaults to current time)
+
+        Yields:
+            Tuples of (title, use_count, last_used)
+        """
+        if now is None:
+            now = time.time()
+
+        sql = "SELECT title, use_count, last_used FROM titles"
+        params = []
+        if prefix:
+            # Range scan on the folded index instead of LIKE, which would
+            # not use the index with the default case-sensitive collation
+            folded = prefix.casefold()
+            sql += " WHERE folded >= ? AND folded < ?"
+            params += [folded, folded + '\U0010ffff']
+        sql += " ORDER BY frecency(use_count, last_used, ?) DESC, last_used DESC"
+        params.append(now)
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        yield from self.conn.execute(sql, params)
+
+    def clear(self):
+        """Delete every stored title."""
+        with self.conn:
+            self.conn.execute("DELETE FROM titles")
+
+    def close(self):
+        """Close the database connection."""
+        self.conn.close()
@@ -1,40 +1,98 @@
+import math
+import time
 import uuid
-import threading
+import heapq
+import bisect
+import fnmatch
+import itertools
+from collections import deque
 from datetime import datetime
-import gi
-gi.require_version('GLib', '2.0')
-from gi.repository import GLib
+from timer_app.locks import create_lock
+from timer_app.metrics import timed
 
 
 class Timer:
     """Represents a single timer with title and duration."""
 
-    def __init__(self, title, total_seconds):
+    # Creation sequence numbers, strictly increasing within a process
+    _sequence = itertools.count(1)
+
+    def __init__(self, title, total_seconds, warnings=None, hooks=None):
         """Initialize a new timer.
 
         Args:
             title: Display name for the timer
             total_seconds: Duration in seconds
+            warnings: Optional list of seconds-before-completion at which to
+                send a pre-warning (e.g. [300, 60])
+            hooks: Optional list of commands or URLs to run on completion
         """
         self.id = str(uuid.uuid4())
+        self.seq = next(Timer._sequence)
         self.title = title
         self.total_seconds = total_seconds
-        self.remaining_seconds = total_seconds
+        self.deadline = time.monotonic() + total_seconds
+        # Pre-warnings that are still ahead, latest-to-fire last
+        self.warnings = sorted(
+            {int(w) for w in (warnings or []) if 0 < int(w) < total_seconds},
+            reverse=True
+        )
+        self.hooks = list(hooks or [])
+        self.paused_remaining = None  # Seconds left when paused, None while running
         self.is_active = True
         self.created_at = datetime.now()
         self.thread = None
 
+    @property
+    def is_paused(self):
+        """Whether the countdown is paused."""
+        return self.paused_remaining is not None
+
+    @property
+    def remaining_seconds(self):
+        """Whole seconds left until the timer completes."""
+        if self.paused_remaining is not None:
+            return max(0, math.ceil(self.paused_remaining))
+        return max(0, math.ceil(self.deadline - time.monotonic()))
+
+    @property
+    def deadline_epoch(self):
+        """Wall-clock Unix time at which the timer completes.
+
+        For a paused timer this is when it would complete if resumed now.
+        """
+        if self.paused_remaining is not None:
+            return time.time() + self.paused_remaining
+        return time.time() + (self.deadline - time.monotonic())
+
 
 class TimerManager:
     """Manages a collection of timers with thread-safe operations."""
 
+    # Number of changes kept for get_changes_since()
+    CHANGE_LOG_SIZE = 1024
+
     def __init__(self):
         """Initialize the timer manager."""
         self.timers = {}
-        self.lock = threading.Lock()
+        self.title_index = {}  # Case-folded title -> set of timer IDs
+        # (seq, id) in creation order for page_timers(); entries of removed
+        # timers are skipped and compacted away lazily
+        self.creation_order = []
+        self.lock = create_lock('timer_manager')
         self.notification_handler = None
+        self.completion_log = None
+        self.hook_runner = None
         self.pinned_timer_id = None  # Currently pinned timer ID
         self.pin_change_callbacks = []  # Callbacks for pin changes
+        self.event_callbacks = []  # Callbacks for timer lifecycle events
+
+        # Bumped on every add, removal and pin change; the change log keeps
+        # (version, op, timer_id) for the most recent ones. Starting from
+        # the clock makes versions unique across runs, so a version saved
+        # by a client before a restart always gets a full reply.
+        self.version = time.time_ns()
+        self.change_log = deque(maxlen=self.CHANGE_LOG_SIZE)
 
     def set_notification_handler(self, handler):
         """Set the notification handler for timer completion.
@@ -44,7 +102,41 @@ class TimerManager:
         """
         self.notification_handler = handler
 
-    def add_timer(self, title, hours, minutes, seconds):
+    def set_completion_log(self, completion_log):
+        """Set the log that records completed and cancelled timers.
+
+        Args:
+            completion_log: CompletionLog instance
+        """
+        self.completion_log = completion_log
+
+    def set_hook_runner(self, hook_runner):
+        """Set the runner for user completion hooks.
+
+        Args:
+            hook_runner: HookRunner instance
+        """
+        self.hook_runner = hook_runner
+
+    def _log_finished(self, timer, kind):
+        """Record a finished or cancelled timer in the completion log.
+
+        Should be called outside the lock.
+
+        Args:
+            timer: The Timer object
+            kind: completion_log.KIND_COMPLETED or KIND_CANCELLED
+        """
+        if not self.completion_log:
+            return
+
+        try:
+            actual = (datetime.now() - timer.created_at).total_seconds()
+            self.completion_log.append(timer.title, timer.total_seconds, actual, kind)
+        except Exception as e:
+            print(f"Warning: Could not write completion log: {e}")
+
+    def add_timer(self, title, hours, minutes, seconds, warnings=None, hooks=None):
         """Create and start a new timer.
 
         Args:
@@ -52,6 +144,9 @@ class TimerManager:
             hours: Hours (0-23)
             minutes: Minutes (0-59)
             seconds: Seconds (0-59)
+            warnings: Optional list of seconds-before-completion at which to
+                send a pre-warning
+            hooks: Optional list of commands or URLs to run on completion
 
         Returns:
             Timer ID (UUID string)
@@ -70,12 +165,19 @@ class TimerManager:
         timer_id = None
 
         with self.lock:
-            timer = Timer(title, total_seconds)
-            thread = TimerThread(timer, self.on_timer_complete)
+            timer = Timer(title, total_seconds, warnings, hooks)
+            thread = TimerThread(timer, self.on_timer_complete, self.on_timer_warning)
             timer.thread = thread
             self.timers[timer.id] = timer
+            self.title_index.setdefault(title.casefold(), set()).add(timer.id)
+            self.creation_order.append((timer.seq, timer.id))
+            if len(self.creation_order) > 2 * len(self.timers) + 64:
+                self.creation_order = [
+                    entry for entry in self.creation_order if entry[1] in self.timers
+                ]
             timer_id = timer.id
             thread.start()
+            self._record_change_unlocked('added', timer.id)
 
             # Auto-pin if this is the first timer OR if it finishes sooner than current pin
             if len(self.timers) == 1:
@@ -85,11 +187,16 @@ class TimerManager:
             elif self.pinned_timer_id:
                 # Check if new timer should become the pinned one
                 pinned = self.timers.get(self.pinned_timer_id)
-                if pinned and timer.remaining_seconds < pinned.remaining_seconds:
+                sort_key = self.SORT_KEYS['deadline']
+                if pinned and sort_key(timer) < sort_key(pinned):
                     self.pinned_timer_id = timer.id
                     should_notify = True
 
+            if should_notify:
+                self._record_change_unlocked('pinned', self.pinned_timer_id)
+
         # Notify outside of lock to avoid deadlock
+        self._notify_timer_event('added', timer)
         if should_notify:
             self._notify_pin_changed()
 
@@ -104,6 +211,339 @@ class TimerManager:
         with self.lock:
             return list(self.timers.values())
 
+    def get_timer_count(self):
+        """Get the number of active timers.
+
+        Returns:
+            Integer count
+        """
+        with self.lock:
+            return len(self.timers)
+
+    # Sort keys accepted by query_timers()
+    SORT_KEYS = {
+        # Paused timers have a stale deadline and go after the running ones
+        'deadline': lambda t: (t.is_paused, t.deadline, t.created_at),
+        'title': lambda t: (t.title.casefold(), t.deadline),
+        'created': lambda t: t.created_at,
+    }
+
+    def query_timers(self, title_filter='', sort_key='deadline', limit=0, offset=0):
+        """Find timers matching a title filter, sorted and paginated.
+
+        Args:
+            title_filter: Case-insensitive filter on the title. A pattern
+                containing *, ? or [ is matched as a glob, anything else as a
+                substring. Empty matches all timers.
+            sort_key: "deadline", "title" or "created", optionally prefixed
+                with "-" for descending order
+            limit: Maximum number of timers to return (0 for no limit)
+            offset: Number of matching timers to skip
+
+        Returns:
+            Tuple of (total number of matching timers, list of Timer objects)
+
+        Raises:
+            ValueError: If sort_key is unknown
+        """
+        descending = sort_key.startswith('-')
+        key = self.SORT_KEYS.get(sort_key.lstrip('-') or 'deadline')
+        if key is None:
+            raise ValueError(f"Unknown sort key: {sort_key}")
+
+        with self.lock:
+            timers = list(self.timers.values())
+
+        if title_filter:
+            folded = title_filter.casefold()
+            if any(c in folded for c in '*?['):
+                timers = [t for t in timers if fnmatch.fnmatchcase(t.title.casefold(), folded)]
+            else:
+                timers = [t for t in timers if folded in t.title.casefold()]
+
+        total = len(timers)
+        if limit > 0:
+            # Only the first offset + limit timers need to be ordered
+            pick = heapq.nlargest if descending else heapq.nsmallest
+            timers = pick(offset + limit, timers, key=key)[offset:]
+        else:
+            timers = sorted(timers, key=key, reverse=descending)[offset:]
+
+        return total, timers
+
+    def page_timers(self, after=0, limit=500):
+        """Get the next page of timers in creation order.
+
+        Pages are addressed by the last timer seen rather than by offset,
+        so a page costs O(log n + limit) and timers removed between pages
+        don't shift the rest.
+
+        Args:
+            after: seq of the last timer of the previous page (0 to start)
+            limit: Maximum number of timers to return
+
+        Returns:
+            List of Timer objects; fewer than limit on the last page
+        """
+        page = []
+        with self.lock:
+            start = bisect.bisect_left(self.creation_order, (after + 1,))
+            for _, timer_id in itertools.islice(self.creation_order, start, None):
+                timer = self.timers.get(timer_id)
+                if timer is not None:
+                    page.append(timer)
+                    if len(page) >= limit:
+                        break
+        return page
+
+    def _record_change_unlocked(self, op, timer_id):
+        """Bump the version and append a change to the change log.
+
+        Should only be called within a lock context.
+
+        Args:
+            op: "added", "removed", "changed" or "pinned"
+            timer_id: ID of the timer concerned (None when unpinned)
+        """
+        self.version += 1
+        self.change_log.append((self.version, op, timer_id))
+
+    def get_changes_since(self, version):
+        """Get what changed after a given version.
+
+        Args:
+            version: Version the caller last saw (0 for none)
+
+        Returns:
+            Tuple of (current version, full, upserts, removed_ids, pinned_id).
+            When full is True the change log no longer reaches back to the
+            requested version: upserts then holds every active timer and the
+            caller should drop anything it has. Otherwise upserts are the
+            timers added or changed since version and removed_ids the
+            timers gone since.
+        """
+        with self.lock:
+            current = self.version
+            pinned_id = self.pinned_timer_id
+
+            oldest = self.change_log[0][0] if self.change_log else current + 1
+            if version > current or version < oldest - 1:
+                return current, True, list(self.timers.values()), [], pinned_id
+
+            # Only the last change per timer matters
+            latest = {}
+            for change_version, op, timer_id in reversed(self.change_log):
+                if change_version <= version:
+                    break
+                if op != 'pinned':
+                    latest.setdefault(timer_id, op)
+
+            upserts = []
+            removed = []
+            for timer_id, op in latest.items():
+                timer = self.timers.get(timer_id)
+                if timer is not None:
+                    upserts.append(timer)
+                else:
+                    removed.append(timer_id)
+
+        return current, False, upserts, removed, pinned_id
+
+    # Title matching modes accepted by find_timers_by_title()
+    TITLE_MATCHES = ('exact', 'all', 'prefix', 'glob')
+
+    def _ids_by_title_unlocked(self, pattern, match='exact'):
+        """Look up timer IDs by title in the title index.
+
+        Should only be called within a lock context. An exact match is a
+        single dictionary lookup; prefix and glob matches scan the distinct
+        titles rather than every timer. "all" finds the same timers as
+        "exact"; it only differs for deletion.
+
+        Args:
+            pattern: Title, title prefix or glob pattern (case-insensitive)
+            match: "exact", "all", "prefix" or "glob"
+
+        Returns:
+            List of timer IDs
+
+        Raises:
+            ValueError: If match is unknown
+        """
+        folded = pattern.casefold()
+        if match in ('exact', 'all'):
+            return list(self.title_index.get(folded, ()))
+        if match == 'prefix':
+            return [
+                timer_id
+                for title, ids in self.title_index.items() if title.startswith(folded)
+                for timer_id in ids
+            ]
+        if match == 'glob':
+            return [
+                timer_id
+                for title, ids in self.title_index.items() if fnmatch.fnmatchcase(title, folded)
+                for timer_id in ids
+            ]
+        raise ValueError(f"Unknown title match: {match}")
+
+    def _unindex_title_unlocked(self, timer):
+        """Remove a timer from the title index.
+
+        Should only be called within a lock context.
+
+        Args:
+            timer: The Timer object being removed
+        """
+        folded = timer.title.casefold()
+        ids = self.title_index.get(folded)
+        if ids is not None:
+            ids.discard(timer.id)
+            if not ids:
+                del self.title_index[folded]
+
+    def find_timers_by_title(self, pattern, match='exact'):
+        """Find timers by title.
+
+        Args:
+            pattern: Title, title prefix or glob pattern (case-insensitive)
+            match: "exact", "prefix" or "glob"
+
+        Returns:
+            List of Timer objects, soonest deadline first
+
+        Raises:
+            ValueError: If match is unknown
+        """
+        with self.lock:
+            timers = [self.timers[i] for i in self._ids_by_title_unlocked(pattern, match)]
+        return sorted(timers, key=self.SORT_KEYS['deadline'])
+
+    def delete_timers_by_title(self, pattern, match='exact'):
+        """Delete timers whose title matches.
+
+        An exact match deletes only the timer with the soonest deadline,
+        even if several share the title; "all" deletes every timer with
+        the title.
+
+        Args:
+            pattern: Title, title prefix or glob pattern (case-insensitive)
+            match: "exact", "all", "prefix" or "glob"
+
+        Returns:
+            Number of timers deleted
+
+        Raises:
+            ValueError: If match is unknown
+        """
+        with self.lock:
+            timer_ids = self._ids_by_title_unlocked(pattern, match)
+            if match == 'exact' and len(timer_ids) > 1:
+                soonest = min(
+                    (self.timers[i] for i in timer_ids), key=self.SORT_KEYS['deadline']
+                )
+                timer_ids = [soonest.id]
+
+        deleted = 0
+        for timer_id in timer_ids:
+            if self.delete_timer(timer_id):
+                deleted += 1
+        return deleted
+
+    def pause_timer(self, timer_id):
+        """Pause a running timer, keeping its remaining time.
+
+        Args:
+            timer_id: UUID string
+
+        Returns:
+            bool: True if the timer was paused, False if missing or already paused
+        """
+        with self.lock:
+            timer = self.timers.get(timer_id)
+            if timer is None or timer.is_paused:
+                return False
+
+            timer.paused_remaining = max(0.0, timer.deadline - time.monotonic())
+            if timer.thread:
+                timer.thread.stop()
+                timer.thread = None
+            self._record_change_unlocked('changed', timer_id)
+
+            # A paused timer sorts after the running ones, so hand the pin on
+            should_notify = False
+            if self.pinned_timer_id == timer_id:
+                self._auto_pin_earliest()
+                if self.pinned_timer_id != timer_id:
+                    self._record_change_unlocked('pinned', self.pinned_timer_id)
+                    should_notify = True
+
+        # Notify outside of lock to avoid deadlock
+        self._notify_timer_event('paused', timer)
+        if should_notify:
+            self._notify_pin_changed()
+        return True
+
+    def resume_timer(self, timer_id):
+        """Resume a paused timer.
+
+        Args:
+            timer_id: UUID string
+
+        Returns:
+            bool: True if the timer was resumed, False if missing or not paused
+        """
+        from timer_app.timer_thread import TimerThread
+
+        with self.lock:
+            timer = self.timers.get(timer_id)
+            if timer is None or not timer.is_paused:
+                return False
+
+            remaining = timer.paused_remaining
+            timer.deadline = time.monotonic() + remaining
+            # Warnings that fired before the pause must not fire again
+            timer.warnings = [w for w in timer.warnings if w < remaining]
+            timer.paused_remaining = None
+            timer.thread = TimerThread(timer, self.on_timer_complete, self.on_timer_warning)
+            timer.thread.start()
+            self._record_change_unlocked('changed', timer_id)
+
+            # Take the pin if this timer now finishes sooner, as in add_timer()
+            should_notify = False
+            pinned = self.timers.get(self.pinned_timer_id)
+            sort_key = self.SORT_KEYS['deadline']
+            if pinned is None or (pinned is not timer and sort_key(timer) < sort_key(pinned)):
+                self.pinned_timer_id = timer_id
+                self._record_change_unlocked('pinned', timer_id)
+                should_notify = True
+
+        # Notify outside of lock to avoid deadlock
+        self._notify_timer_event('resumed', timer)
+        if should_notify:
+            self._notify_pin_changed()
+        return True
+
+    def set_paused_by_title(self, pattern, paused, match='exact'):
+        """Pause or resume every timer whose title matches.
+
+        Args:
+            pattern: Title, title prefix or glob pattern (case-insensitive)
+            paused: True to pause, False to resume
+            match: "exact", "prefix" or "glob"
+
+        Returns:
+            Number of timers whose state changed
+
+        Raises:
+            ValueError: If match is unknown
+        """
+        with self.lock:
+            timer_ids = self._ids_by_title_unlocked(pattern, match)
+
+        action = self.pause_timer if paused else self.resume_timer
+        return sum(1 for timer_id in timer_ids if action(timer_id))
+
     def get_timer(self, timer_id):
         """Get a specific timer by ID.
 
@@ -138,6 +578,7 @@ class TimerManager:
                 should_notify = True
             else:
                 return False
+            self._record_change_unlocked('pinned', self.pinned_timer_id)
 
         # Notify outside of lock to avoid deadlock
         if should_notify:
@@ -192,11 +633,8 @@ class TimerManager:
         if not self.timers:
             return None
 
-        # Sort by remaining_seconds (ascending), then by created_at for determinism
-        return min(
-            self.timers.values(),
-            key=lambda t: (t.remaining_seconds, t.created_at)
-        )
+        # Running timers by deadline, then created_at for determinism
+        return min(self.timers.values(), key=self.SORT_KEYS['deadline'])
 
     def add_pin_change_callback(self, callback):
         """Register a callback to be called when the pinned timer changes.
@@ -208,6 +646,38 @@ class TimerManager:
             if callback not in self.pin_change_callbacks:
                 self.pin_change_callbacks.append(callback)
 
+    def add_event_callback(self, callback):
+        """Register a callback for timer lifecycle events.
+
+        The callback is called outside the lock, on the thread that made
+        the change, so it must be cheap and thread-safe.
+
+        Args:
+            callback: Function taking (event, timer) where event is
+                "added", "deleted", "completed", "paused" or "resumed"
+        """
+        with self.lock:
+            if callback not in self.event_callbacks:
+                self.event_callbacks.append(callback)
+
+    def _notify_timer_event(self, event, timer):
+        """Call the lifecycle event callbacks.
+
+        Must be called outside the lock.
+
+        Args:
+            event: "added", "deleted", "completed", "paused" or "resumed"
+            timer: The Timer object the event is about
+        """
+        with self.lock:
+            callbacks = self.event_callbacks[:]
+
+        for callback in callbacks:
+            try:
+                callback(event, timer)
+            except Exception as e:
+                print(f"Warning: Timer event callback failed: {e}")
+
     def _auto_pin_earliest(self):
         """Internal method to automatically pin the earliest timer.
 
@@ -226,6 +696,9 @@ class TimerManager:
         This method acquires its own lock to copy callbacks, then releases
         it before calling them to avoid deadlock.
         """
+        # Imported here so Timer and the sort keys load without PyGObject
+        from gi.repository import GLib
+
         # Copy callbacks while holding lock
         with self.lock:
             callbacks = self.pin_change_callbacks[:]
@@ -239,29 +712,66 @@ class TimerManager:
 
         Args:
             timer_id: UUID string
+
+        Returns:
+            bool: True if the timer existed
         """
         should_notify = False
+        deleted = None
 
         with self.lock:
             if timer_id in self.timers:
                 timer = self.timers[timer_id]
                 if timer.thread:
                     timer.thread.stop()
+                deleted = timer
 
                 # Check if we're deleting the pinned timer
                 was_pinned = (timer_id == self.pinned_timer_id)
 
                 del self.timers[timer_id]
+                self._unindex_title_unlocked(timer)
+                self._record_change_unlocked('removed', timer_id)
 
                 # If deleted timer was pinned, auto-pin the next earliest
                 if was_pinned:
                     self._auto_pin_earliest()
+                    self._record_change_unlocked('pinned', self.pinned_timer_id)
                     should_notify = True
 
+        if deleted:
+            from timer_app.completion_log import KIND_CANCELLED
+            self._log_finished(deleted, KIND_CANCELLED)
+            self._notify_timer_event('deleted', deleted)
+
         # Notify outside of lock to avoid deadlock
         if should_notify:
             self._notify_pin_changed()
 
+        return deleted is not None
+
+    @timed('timer_warning')
+    def on_timer_warning(self, timer, seconds_left):
+        """Callback when a timer reaches one of its pre-warning offsets.
+
+        This is called from the main GTK thread via GLib.idle_add.
+
+        Args:
+            timer: The Timer object
+            seconds_left: The warning offset that was reached
+
+        Returns:
+            False so GLib.idle_add doesn't call it again
+        """
+        with self.lock:
+            still_active = timer.id in self.timers and not timer.is_paused
+
+        # A warning queued just before the timer was deleted is dropped
+        if still_active and self.notification_handler:
+            self.notification_handler.notify_timer_warning(timer, seconds_left)
+        return False
+
+    @timed('timer_complete')
     def on_timer_complete(self, timer):
         """Callback when a timer reaches zero.
 
@@ -271,10 +781,14 @@ class TimerManager:
             timer: The completed Timer object
         """
         should_notify = False
+        completed = False
         timer_id = timer.id
 
         # Check if this timer is pinned
         with self.lock:
+            # Queued by a thread that was stopped by a pause
+            if timer.is_paused or time.monotonic() < timer.deadline:
+                return
             was_pinned = (timer.id == self.pinned_timer_id)
 
         # Send notification (outside lock to avoid blocking)
@@ -288,12 +802,25 @@ class TimerManager:
                 if timer.thread:
                     timer.thread.stop()
                 del self.timers[timer_id]
+                self._unindex_title_unlocked(timer)
+                self._record_change_unlocked('removed', timer_id)
+                completed = True
 
                 # If completed timer was pinned, auto-pin next earliest
                 if was_pinned:
                     self._auto_pin_earliest()
+                    self._record_change_unlocked('pinned', self.pinned_timer_id)
                     should_notify = True
 
+        if completed:
+            from timer_app.completion_log import KIND_COMPLETED
+            self._log_finished(timer, KIND_COMPLETED)
+
+            # Only queues the hooks; they run on the hook runner's workers
+            if self.hook_runner:
+                self.hook_runner.run_completion_hooks(timer)
+            self._notify_timer_event('completed', timer)
+
         # Notify outside of lock to avoid deadlock
         if should_notify:
             self._notify_pin_changed()
@@ -310,3 +837,4 @@ class TimerManager:
                     timer.thread.join(timeout=2)
 
             self.timers.clear()
+            self.title_index.clear()
@@ -1,5 +1,6 @@
 import os
 import json
+import hashlib
 from pathlib import Path
 
 
@@ -17,6 +18,8 @@ class TimerPresets:
     def __init__(self):
         """Initialize the timer presets manager."""
         self.config_file = self._get_config_file_path()
+        self._file_signature = None  # (mtime_ns, size) of the last load/save
+        self._file_hash = None  # Content hash of the last load/save
         self.presets = self._load_presets()
 
     def _get_config_file_path(self):
@@ -41,13 +44,120 @@ class TimerPresets:
             return self.DEFAULT_PRESETS.copy()
 
         try:
-            with open(self.config_file, 'r') as f:
-                data = json.load(f)
-                return data.get('presets', self.DEFAULT_PRESETS.copy())
+            with open(self.config_file, 'rb') as f:
+                raw = f.read()
+            self._remember_file(raw)
+            data = json.loads(raw)
+            presets = data.get('presets', self.DEFAULT_PRESETS.copy())
+            self._by_title(presets, warn=True)
+            return presets
         except Exception as e:
             print(f"Warning: Could not load timer presets: {e}")
             return self.DEFAULT_PRESETS.copy()
 
+    def _remember_file(self, raw):
+        """Record the signature and hash of the config file contents.
+
+        Args:
+            raw: Bytes that were just read from or written to the file
+        """
+        try:
+            st = self.config_file.stat()
+            self._file_signature = (st.st_mtime_ns, st.st_size)
+        except OSError:
+            self._file_signature = None
+        self._file_hash = hashlib.sha1(raw).hexdigest()
+
+    def reload_if_changed(self):
+        """Re-read the config file if it changed since the last load or save.
+
+        The file is only read when its mtime or size changed, and only
+        re-parsed when its content hash changed.
+
+        Returns:
+            Dictionary describing the change, or None if nothing changed:
+            {"added": [presets], "removed": [titles], "changed": [presets],
+            "order": [titles]}
+        """
+        try:
+            st = self.config_file.stat()
+        except OSError:
+            return None
+
+        if (st.st_mtime_ns, st.st_size) == self._file_signature:
+            return None
+
+        try:
+            with open(self.config_file, 'rb') as f:
+                raw = f.read()
+        except OSError as e:
+            print(f"Warning: Could not reload timer presets: {e}")
+            return None
+
+        old_hash = self._file_hash
+        self._remember_file(raw)
+        if self._file_hash == old_hash:
+            return None
+
+        try:
+            new_presets = json.loads(raw).get('presets', [])
+        except Exception as e:
+            # Keep the current presets while the file is half-edited
+            print(f"Warning: Could not reload timer presets: {e}")
+            return None
+
+        new_by_title = self._by_title(new_presets, warn=True)
+        diff = self._diff_presets(self.presets, new_by_title)
+        # Duplicates stay in the list so saving doesn't drop them from the file
+        self.presets = new_presets
+        return diff
+
+    def _by_title(self, presets, warn=False):
+        """Index presets by title, keeping the first of any duplicates.
+
+        Args:
+            presets: List of preset dictionaries
+            warn: Print a warning naming duplicate titles
+
+        Returns:
+            Dictionary of title -> preset, in list order
+        """
+        by_title = {}
+        duplicates = []
+        for preset in presets:
+            if preset['title'] in by_title:
+                duplicates.append(preset['title'])
+            else:
+                by_title[preset['title']] = preset
+
+        if warn and duplicates:
+            print(
+                f"Warning: Duplicate timer preset titles in {self.config_file}: "
+                f"{', '.join(sorted(set(duplicates)))}; only the first of each is shown"
+            )
+        return by_title
+
+    def _diff_presets(self, old_presets, new_by_title):
+        """Describe the change between two sets of presets.
+
+        Args:
+            old_presets: List of current preset dictionaries
+            new_by_title: Dictionary of title -> new preset, in new order
+
+        Returns:
+            Dictionary with keys "added", "removed", "changed" and "order"
+        """
+        old_by_title = self._by_title(old_presets)
+        return {
+            "added": [p for t, p in new_by_title.items() if t not in old_by_title],
+            "removed": [t for t in old_by_title if t not in new_by_title],
+            "changed": [
+                p for t, p in new_by_title.items()
+                if t in old_by_title and old_by_title[t] != p
+            ],
+            "order": list(new_by_title),
+        }
+
     def _save_presets(self, presets=None):
         """Save timer presets to configuration file.
 
@@ -58,8 +168,11 @@ class TimerPresets:
             presets = self.presets
 
         try:
-            with open(self.config_file, 'w') as f:
-                json.dump({'presets': presets}, f, indent=2)
+            raw = json.dumps({'presets': presets}, indent=2).encode('utf-8')
+            with open(self.config_file, 'wb') as f:
+                f.write(raw)
+            # Our own writes must not look like external edits
+            self._remember_file(raw)
         except Exception as e:
             print(f"Warning: Could not save timer presets: {e}")
 
@@ -99,6 +212,31 @@ class TimerPresets:
         self.presets.append(preset)
         self._save_presets()
 
+    def add_presets(self, presets):
+        """Add or update several presets and save the file once.
+
+        Args:
+            presets: List of preset dictionaries
+
+        Returns:
+            Change description in the same format as reload_if_changed()
+        """
+        new_presets = list(self.presets)
+        positions = {}
+        for i, preset in enumerate(new_presets):
+            positions.setdefault(preset['title'], i)
+        for preset in presets:
+            if preset['title'] in positions:
+                new_presets[positions[preset['title']]] = preset
+            else:
+                positions[preset['title']] = len(new_presets)
+                new_presets.append(preset)
+
+        diff = self._diff_presets(self.presets, self._by_title(new_presets))
+        self.presets = new_presets
+        self._save_presets()
+        return diff
+
     def remove_preset(self, title):
         """Remove a preset timer by title.
 
@@ -6,33 +6,59 @@ from gi.repository import GLib
 
 
 class TimerThread(threading.Thread):
-    """Thread that counts down a timer in the background."""
+    """Thread that waits for a timer's deadlines in the background.
 
-    def __init__(self, timer, callback):
+    The thread sleeps until the next scheduled event (a pre-warning or the
+    completion itself) instead of ticking every second, so idle timers
+    cost no CPU. Stopping the thread cancels the timer's pending warnings
+    along with its completion.
+    """
+
+    def __init__(self, timer, callback, warning_callback=None):
         """Initialize the timer thread.
 
         Args:
             timer: Timer object to count down
             callback: Function to call when timer completes (called on main thread)
+            warning_callback: Function called with (timer, seconds_left) for
+                each pre-warning (called on main thread)
         """
         super().__init__(daemon=True)
         self.timer = timer
         self.callback = callback
+        self.warning_callback = warning_callback
         self.stop_event = threading.Event()
 
     def run(self):
-        """Execute the countdown loop."""
+        """Wait for each warning and then the completion."""
         try:
-            while self.timer.remaining_seconds > 0 and not self.stop_event.is_set():
-                time.sleep(1)
-                if not self.stop_event.is_set():
-                    self.timer.remaining_seconds -= 1
+            for seconds_left in self.timer.warnings:
+                if not self._wait_until(self.timer.deadline - seconds_left):
+                    return
+                if self.warning_callback:
+                    GLib.idle_add(self.warning_callback, self.timer, seconds_left)
 
-            if self.timer.remaining_seconds == 0 and not self.stop_event.is_set():
+            if self._wait_until(self.timer.deadline):
                 GLib.idle_add(self.callback, self.timer)
         except Exception as e:
             print(f"Error in timer thread for '{self.timer.title}': {e}")
 
+    def _wait_until(self, when):
+        """Sleep until a monotonic time or until stopped.
+
+        Args:
+            when: time.monotonic() value to wait for
+
+        Returns:
+            True if the time was reached, False if the thread was stopped
+        """
+        while True:
+            remaining = when - time.monotonic()
+            if remaining <= 0:
+                return not self.stop_event.is_set()
+            if self.stop_event.wait(remaining):
+                return False
+
     def stop(self):
         """Signal the thread to stop gracefully."""
         self.stop_event.set()
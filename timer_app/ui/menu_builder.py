@@ -1,11 +1,16 @@
+import time
 import gi
 gi.require_version('Gtk', '3.0')
-from gi.repository import Gtk
+from gi.repository import Gtk, GLib
+from timer_app.metrics import timed
 
 
 class MenuBuilder:
     """Builds the system tray menu for the timer application."""
 
+    # Longest time a batch of menu edits may hold the main loop (~half a frame)
+    JOB_SLICE_SECONDS = 0.008
+
     def __init__(self, app):
         """Initialize the menu builder.
 
@@ -13,6 +18,11 @@ class MenuBuilder:
             app: Reference to the TimerApp instance
         """
         self.app = app
+        self.add_submenu = None
+        self.preset_label = None
+        self.preset_items = {}  # title -> (Gtk.MenuItem, handler ID)
+        self._pending_jobs = []  # Menu edits still to apply
+        self._jobs_source_id = None
 
     def build_menu(self):
         """Build and return the system tray menu.
@@ -72,26 +82,172 @@ class MenuBuilder:
         # Separator
         submenu.append(Gtk.SeparatorMenuItem())
 
-        # Preset timers section
+        # Preset timers section (label hidden while there are no presets)
+        self.preset_label = Gtk.MenuItem(label="Preset Timers")
+        self.preset_label.set_sensitive(False)
+        self.preset_label.set_no_show_all(True)
+        submenu.append(self.preset_label)
+
+        self.add_submenu = submenu
+        self.preset_items = {}
         presets = self.app.timer_presets.get_presets()
-        if presets:
-            preset_label = Gtk.MenuItem(label="Preset Timers")
-            preset_label.set_sensitive(False)
-            submenu.append(preset_label)
-
-            for preset in presets:
-                # Format the duration
-                duration_parts = []
-                if preset['hours'] > 0:
-                    duration_parts.append(f"{preset['hours']}h")
-                if preset['minutes'] > 0:
-                    duration_parts.append(f"{preset['minutes']}m")
-                if preset['seconds'] > 0:
-                    duration_parts.append(f"{preset['seconds']}s")
-                duration_str = " ".join(duration_parts) if duration_parts else "0s"
-
-                item = Gtk.MenuItem(label=f"  {preset['title']} ({duration_str})")
-                item.connect("activate", lambda _, p=preset: self.app.start_preset_timer(p))
-                submenu.append(item)
+        for preset in presets:
+            # Items are keyed by title; a duplicate title only gets the first
+            if preset['title'] not in self.preset_items:
+                self._append_preset_item(preset)
+        self.preset_label.set_visible(bool(presets))
 
         return submenu
+
+    def _format_preset_label(self, preset):
+        """Format the menu label for a preset.
+
+        Args:
+            preset: Preset dictionary
+
+        Returns:
+            Label string, e.g. "  Pomodoro (25m)"
+        """
+        duration_parts = []
+        if preset['hours'] > 0:
+            duration_parts.append(f"{preset['hours']}h")
+        if preset['minutes'] > 0:
+            duration_parts.append(f"{preset['minutes']}m")
+        if preset['seconds'] > 0:
+            duration_parts.append(f"{preset['seconds']}s")
+        duration_str = " ".join(duration_parts) if duration_parts else "0s"
+
+        return f"  {preset['title']} ({duration_str})"
+
+    def _append_preset_item(self, preset):
+        """Append a menu item for a preset to the end of the submenu.
+
+        Args:
+            preset: Preset dictionary
+        """
+        item = Gtk.MenuItem(label=self._format_preset_label(preset))
+        handler_id = item.connect(
+            "activate", lambda _, p=preset: self.app.start_preset_timer(p)
+        )
+        self.add_submenu.append(item)
+        item.show()
+        self.preset_items[preset['title']] = (item, handler_id)
+
+    def _remove_preset_item(self, title):
+        """Remove the menu item for a preset.
+
+        Args:
+            title: Title of the removed preset
+        """
+        entry = self.preset_items.pop(title, None)
+        if entry:
+            entry[0].destroy()
+
+    def _update_preset_item(self, preset):
+        """Refresh the label and action of an existing preset item.
+
+        Args:
+            preset: Updated preset dictionary
+        """
+        entry = self.preset_items.get(preset['title'])
+        if not entry:
+            self._append_preset_item(preset)
+            return
+
+        item, handler_id = entry
+        item.disconnect(handler_id)
+        item.set_label(self._format_preset_label(preset))
+        handler_id = item.connect(
+            "activate", lambda _, p=preset: self.app.start_preset_timer(p)
+        )
+        self.preset_items[preset['title']] = (item, handler_id)
+
+    def _reorder_preset_items(self, order):
+        """Queue moves so preset items follow the order of the config file.
+
+        Args:
+            order: List of preset titles in file order
+        """
+        if list(self.preset_items) == order:
+            return
+
+        base = self.add_submenu.get_children().index(self.preset_label) + 1
+        for offset, title in enumerate(order):
+            self._pending_jobs.append(
+                lambda t=title, pos=base + offset: self._move_preset_item(t, pos)
+            )
+
+        # Keep our bookkeeping in file order too
+        self._pending_jobs.append(lambda: self._sort_preset_items(order))
+
+    def _move_preset_item(self, title, position):
+        """Move a preset item to a position in the submenu.
+
+        Args:
+            title: Preset title
+            position: Child index in the submenu
+        """
+        entry = self.preset_items.get(title)
+        if entry:
+            self.add_submenu.reorder_child(entry[0], position)
+
+    def _sort_preset_items(self, order):
+        """Reorder the preset item mapping to match the config file.
+
+        Args:
+            order: List of preset titles in file order
+        """
+        self.preset_items = {
+            t: self.preset_items[t] for t in order if t in self.preset_items
+        }
+
+    def update_presets(self, diff):
+        """Patch the preset section of the menu after the presets changed.
+
+        Only the affected items are touched. The edits are applied from an
+        idle callback in small time slices, so even thousands of changed
+        presets never hold the main loop for more than a fraction of a frame.
+
+        Args:
+            diff: Change description from TimerPresets.reload_if_changed()
+        """
+        if self.add_submenu is None:
+            return
+
+        for title in diff['removed']:
+            self._pending_jobs.append(lambda t=title: self._remove_preset_item(t))
+        for preset in diff['changed']:
+            self._pending_jobs.append(lambda p=preset: self._update_preset_item(p))
+        for preset in diff['added']:
+            self._pending_jobs.append(lambda p=preset: self._append_preset_item(p))
+        self._pending_jobs.append(lambda: self._reorder_preset_items(diff['order']))
+        self._pending_jobs.append(
+            lambda: self.preset_label.set_visible(bool(self.preset_items))
+        )
+
+        if self._jobs_source_id is None:
+            self._jobs_source_id = GLib.idle_add(self._run_pending_jobs)
+
+    @timed('menu_jobs')
+    def _run_pending_jobs(self):
+        """Apply queued menu edits until the time slice is used up.
+
+        Returns:
+            True while edits remain, False when done
+        """
+        deadline = time.monotonic() + self.JOB_SLICE_SECONDS
+        jobs = self._pending_jobs
+        index = 0
+        while index < len(jobs) and time.monotonic() < deadline:
+            try:
+                jobs[index]()
+            except Exception as e:
+                print(f"Error updating preset menu: {e}")
+            index += 1
+        del jobs[:index]
+
+        if jobs:
+            return True
+
+        self._jobs_source_id = None
+        return False
@@ -2,6 +2,7 @@ import gi
 gi.require_version('Gtk', '3.0')
 from gi.repository import Gtk, GLib
 from timer_app.utils import format_time
+from timer_app.metrics import timed
 
 
 class ViewTimersDialog(Gtk.Dialog):
@@ -23,6 +24,8 @@ class ViewTimersDialog(Gtk.Dialog):
 
         self.timer_manager = timer_manager
         self.timeout_id = None
+        self.version = None  # Manager version the rows were built for
+        self.time_labels = []  # (timer, label) for each row
 
         self.set_default_size(400, 300)
 
@@ -47,15 +50,29 @@ class ViewTimersDialog(Gtk.Dialog):
         self.update_display()
         self.show_all()
 
+    @timed('timers_dialog')
     def update_display(self):
-        """Update the list of timers with current countdown values.
+        """Update the countdowns, rebuilding the rows only if timers changed.
 
         Returns:
             True to continue the timeout callback
         """
+        if self.version == self.timer_manager.version:
+            for timer, time_label in self.time_labels:
+                self._set_time_markup(time_label, timer)
+            return True
+
+        self.rebuild_rows()
+        return True
+
+    def rebuild_rows(self):
+        """Recreate one row per active timer."""
         for child in self.listbox.get_children():
             self.listbox.remove(child)
+        self.time_labels = []
 
+        # Read the version first so a change during the rebuild is caught next time
+        self.version = self.timer_manager.version
         timers = self.timer_manager.get_all_timers()
 
         if not timers:
@@ -69,7 +86,6 @@ class ViewTimersDialog(Gtk.Dialog):
                 self.listbox.add(row)
 
         self.listbox.show_all()
-        return True
 
     def create_timer_row(self, timer):
         """Create a list row for a timer.
@@ -104,11 +120,11 @@ class ViewTimersDialog(Gtk.Dialog):
         hbox.pack_start(title_label, True, True, 0)
 
         # Countdown display
-        time_str = format_time(timer.remaining_seconds)
         time_label = Gtk.Label()
-        time_label.set_markup(f'<span font_family="monospace" size="large">{time_str}</span>')
+        self._set_time_markup(time_label, timer)
         time_label.set_halign(Gtk.Align.END)
         hbox.pack_start(time_label, False, False, 0)
+        self.time_labels.append((timer, time_label))
 
         # Pin/Unpin button
         pin_btn = Gtk.Button(label="Unpin" if is_pinned else "Pin")
@@ -126,6 +142,16 @@ class ViewTimersDialog(Gtk.Dialog):
         row.add(hbox)
         return row
 
+    def _set_time_markup(self, time_label, timer):
+        """Show a timer's remaining time in its countdown label.
+
+        Args:
+            time_label: Gtk.Label of the row
+            timer: Timer object
+        """
+        time_str = format_time(timer.remaining_seconds)
+        time_label.set_markup(f'<span font_family="monospace" size="large">{time_str}</span>')
+
     def on_delete_clicked(self, button, timer_id):
         """Handle delete button click.
 
@@ -0,0 +1,162 @@
+import os
+import json
+import time
+from collections import OrderedDict
+from datetime import date
+from pathlib import Path
+
+from timer_app.completion_log import KIND_COMPLETED
+
+
+# Indexes into an aggregate entry
+COMPLETED = 0
+CANCELLED = 1
+TOTAL_SECONDS = 2
+TOTAL_OVERRUN = 3
+
+
+class UsageAggregates:
+    """Running per-title and per-day usage totals.
+
+    Each finished timer updates two small fixed-size entries in place, so
+    the cost per completion is constant no matter how long the app has
+    been running. Per-day entries are kept for a rolling window of days.
+    The totals are checkpointed to disk and, on startup, brought up to
+    date by replaying only the completion log records written after the
+    last checkpoint.
+    """
+
+    RETAIN_DAYS = 90
+
+    def __init__(self, path=None):
+        """Initialize the aggregates, loading the last checkpoint.
+
+        Args:
+            path: Checkpoint file (defaults to usage_stats.json in the config dir)
+        """
+        if path is None:
+            config_dir = Path.home() / '.config' / 'multi-timer-app'
+            config_dir.mkdir(parents=True, exist_ok=True)
+            path = config_dir / 'usage_stats.json'
+
+        self.path = Path(path)
+        self.by_title = {}  # title -> [completed, cancelled, seconds, overrun]
+        self.by_day = OrderedDict()  # "YYYY-MM-DD" -> same, oldest first
+        self.last_timestamp = 0  # Timestamp of the newest applied record
+        self.seen_at_last = 0  # Records applied with exactly that timestamp
+        self.dirty = False
+        self._load()
+
+    def _load(self):
+        """Load the last checkpoint from disk."""
+        if not self.path.exists():
+            return
+
+        try:
+            with open(self.path, 'r') as f:
+                data = json.load(f)
+            self.by_title = data.get('by_title', {})
+            self.by_day = OrderedDict(sorted(data.get('by_day', {}).items()))
+            self.last_timestamp = data.get('last_timestamp', 0)
+            self.seen_at_last = data.get('seen_at_last', 0)
+        except Exception as e:
+            print(f"Warning: Could not load usage stats: {e}")
+
+    def catch_up(self, completion_log):
+        """Apply completion log records written after the last checkpoint.
+
+        Only the log segments from the checkpoint's day onwards are read.
+
+        Args:
+            completion_log: CompletionLog instance
+        """
+        start = self.last_timestamp or None
+        skip = self.seen_at_last
+        for timestamp, title, planned, actual, kind in completion_log.iter_records(start=start):
+            if timestamp == self.last_timestamp and skip > 0:
+                skip -= 1
+                continue
+            self.record(title, planned, actual, kind, timestamp)
+
+    def record(self, title, planned_seconds, actual_seconds, kind, timestamp=None):
+        """Update the aggregates with one finished timer.
+
+        Args:
+            title: Timer title
+            planned_seconds: Duration the timer was set for
+            actual_seconds: Seconds from start until it finished or was cancelled
+            kind: completion_log.KIND_COMPLETED or KIND_CANCELLED
+            timestamp: Unix time of the event (defaults to now)
+        """
+        if timestamp is None:
+            timestamp = time.time()
+        timestamp = int(timestamp)
+
+        day = date.fromtimestamp(timestamp).isoformat()
+        day_entry = self.by_day.get(day)
+        if day_entry is None:
+            day_entry = self.by_day[day] = [0, 0, 0, 0]
+            # Days arrive in order, so the oldest are at the front
+            while len(self.by_day) > self.RETAIN_DAYS:
+                self.by_day.popitem(last=False)
+
+        title_entry = self.by_title.get(title)
+        if title_entry is None:
+            title_entry = self.by_title[title] = [0, 0, 0, 0]
+
+        for entry in (title_entry, day_entry):
+            entry[TOTAL_SECONDS] += actual_seconds
+            if kind == KIND_COMPLETED:
+                entry[COMPLETED] += 1
+                entry[TOTAL_OVERRUN] += actual_seconds - planned_seconds
+            else:
+                entry[CANCELLED] += 1
+
+        if timestamp > self.last_timestamp:
+            self.last_timestamp = timestamp
+            self.seen_at_last = 1
+        elif timestamp == self.last_timestamp:
+            self.seen_at_last += 1
+        self.dirty = True
+
+    def get_rows(self, group_by='title'):
+        """Get the aggregates as rows.
+
+        Args:
+            group_by: "title" or "day"
+
+        Returns:
+            List of tuples (key, completed, cancelled, total_seconds, avg_overrun)
+            where avg_overrun is the mean seconds completed timers ran past
+            their planned duration
+        """
+        source = self.by_day if group_by == 'day' else self.by_title
+        rows = []
+        for key, (completed, cancelled, seconds, overrun) in source.items():
+            avg_overrun = overrun / completed if completed else 0.0
+            rows.append((key, completed, cancelled, float(seconds), float(avg_overrun)))
+        return rows
+
+    def checkpoint(self):
+        """Write the aggregates to disk if they changed.
+
+        The file is written to a temporary name and renamed into place, so a
+        crash never leaves a half-written checkpoint.
+        """
+        if not self.dirty:
+            return
+
+        data = {
+            'by_title': self.by_title,
+            'by_day': self.by_day,
+            'last_timestamp': self.last_timestamp,
+            'seen_at_last': self.seen_at_last,
+        }
+        tmp_path = self.path.with_suffix('.tmp')
+        try:
+            with open(tmp_path, 'w') as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.path)
+            self.dirty = False
+        except Exception as e:
+            print(f"Warning: Could not save usage stats: {e}")
@@ -17,6 +17,29 @@ def format_time(seconds):
     return f"{hours:02d}:{minutes:02d}:{secs:02d}"
 
 
+def format_duration(seconds):
+    """Convert seconds to a short human-readable duration.
+
+    Args:
+        seconds: Integer number of seconds
+
+    Returns:
+        String such as "5m", "1h 30m" or "45s"
+    """
+    hours = seconds // 3600
+    minutes = (seconds % 3600) // 60
+    secs = seconds % 60
+
+    parts = []
+    if hours:
+        parts.append(f"{hours}h")
+    if minutes:
+        parts.append(f"{minutes}m")
+    if secs or not parts:
+        parts.append(f"{secs}s")
+    return " ".join(parts)
+
+
 def parse_time(hours, minutes, seconds):
     """Convert hours, minutes, seconds to total seconds.
 
@@ -31,6 +54,66 @@ def parse_time(hours, minutes, seconds):
     return hours * 3600 + minutes * 60 + seconds
 
 
+def parse_duration(duration_str):
+    """Parse a duration string into hours, minutes, seconds.
+
+    Supported formats:
+    - "5m" - 5 minutes
+    - "1h30m" - 1 hour 30 minutes
+    - "2h" - 2 hours
+    - "90s" - 90 seconds
+    - "1h30m45s" - 1 hour 30 minutes 45 seconds
+
+    Args:
+        duration_str: Duration string to parse
+
+    Returns:
+        Tuple of (hours, minutes, seconds)
+
+    Raises:
+        ValueError if the format is invalid
+    """
+    hours = 0
+    minutes = 0
+    seconds = 0
+
+    duration_str = duration_str.lower().strip()
+
+    # Parse hours
+    if 'h' in duration_str:
+        parts = duration_str.split('h')
+        try:
+            hours = int(parts[0])
+            duration_str = parts[1] if len(parts) > 1 else ''
+        except ValueError:
+            raise ValueError(f"Invalid hours value in duration: {duration_str}")
+
+    # Parse minutes
+    if 'm' in duration_str:
+        parts = duration_str.split('m')
+        try:
+            minutes = int(parts[0])
+            duration_str = parts[1] if len(parts) > 1 else ''
+        except ValueError:
+            raise ValueError(f"Invalid minutes value in duration: {duration_str}")
+
+    # Parse seconds
+    if 's' in duration_str:
+        parts = duration_str.split('s')
+        try:
+            seconds = int(parts[0])
+        except ValueError:
+            raise ValueError(f"Invalid seconds value in duration: {duration_str}")
+    elif duration_str and duration_str.strip():
+        # If there's leftover text, it's invalid
+        raise ValueError(f"Invalid duration format: {duration_str}")
+
+    if hours == 0 and minutes == 0 and seconds == 0:
+        raise ValueError("Duration must be greater than 0")
+
+    return hours, minutes, seconds
+
+
 def validate_timer_input(title, hours, minutes, seconds):
     """Validate timer input parameters.
 